@@ -14,3 +14,7 @@ EFF_ITER_2_DATA_DIR_PATH = f'{EFF_DATA_DIR_PATH}/eff_2'
 EFF_CONC_ITER_2_DATA_DIR_PATH = f'{EFF_DATA_DIR_PATH}/conclusion_2.json'
 
 INSIGHTS_DATA_DIR_PATH = f'{DATA_DIR_PATH}/insights'
+
+CACHE_DATA_DIR_PATH = f'{DATA_DIR_PATH}/cache'
+METRICS_DATA_DIR_PATH = f'{DATA_DIR_PATH}/metrics'
+TRACES_DATA_DIR_PATH = f'{DATA_DIR_PATH}/traces'
@@ -1,2 +1,74 @@
+from argparse import ArgumentParser
+
 if __name__ == '__main__':
-  pass
+  import src.modules.udpipe_client.udpipe_client as uc
+
+  from src.modules.parser.parser import Parser
+  from src.modules.metrics.metrics import registry as metrics
+  from src.modules.metrics.decorators import stage_logging
+  from src.modules.tracing.tracing import tracer
+  from src.modules.parse_cache.parse_cache import ParseCache
+  from src.modules.parser.artifacts import ArtifactStore
+  from src.modules.bert_qa.answers_cache import AnswersCache
+  from src.modules.bert_qa.typedefs import QaBackend
+  from src.modules.bert_qa.constants import DEF_QA_BACKEND
+  from src.modules.parse_service.parse_service import serve
+  from src.modules.parse_service.constants import SERVICE_HOST, SERVICE_PORT, SERVICE_WORKERS
+
+  arg_parser = ArgumentParser(description='Run the resident parse service with warm models.')
+  arg_parser.add_argument('--host', default=SERVICE_HOST)
+  arg_parser.add_argument('--port', type=int, default=SERVICE_PORT)
+  arg_parser.add_argument('--unix-socket')
+  arg_parser.add_argument('--workers', type=int, default=SERVICE_WORKERS)
+  arg_parser.add_argument('--cache-path')
+  arg_parser.add_argument('--answers-cache-path')
+  arg_parser.add_argument('--artifacts-path')
+  arg_parser.add_argument('--qa-backend', choices=[backend.value for backend in QaBackend], default=DEF_QA_BACKEND.value)
+  arg_parser.add_argument('--time-budget', type=float)
+  arg_parser.add_argument('--section-spans', action='store_true')
+  arg_parser.add_argument('--udp-local', action='store_true')
+  arg_parser.add_argument('--warm-up-udp', action='store_true')
+  arg_parser.add_argument('--metrics-dirname')
+  arg_parser.add_argument('--traces-dirname')
+  arg_parser.add_argument('--debug', action='store_true')
+  args = arg_parser.parse_args()
+
+  if args.debug:
+    stage_logging.enable_debug()
+
+  if args.traces_dirname:
+    tracer.enable(args.traces_dirname)
+
+  if args.metrics_dirname:
+    metrics.enable()
+    metrics.start_periodic_export(args.metrics_dirname)
+
+  if args.udp_local:
+    uc.start()
+
+  try:
+    serve(
+      parser=Parser(
+        cache=ParseCache(path=args.cache_path) if args.cache_path else None,
+        answers_cache=AnswersCache(path=args.answers_cache_path) if args.answers_cache_path else None,
+        artifacts=ArtifactStore(path=args.artifacts_path) if args.artifacts_path else None,
+        qa_backend=QaBackend(args.qa_backend),
+        time_budget=args.time_budget,
+        section_spans=args.section_spans,
+        udp_locally=args.udp_local,
+      ),
+      host=args.host,
+      port=args.port,
+      unix_socket=args.unix_socket,
+      workers=args.workers,
+      warm_up_udp=args.warm_up_udp,
+    )
+  finally:
+    if args.udp_local:
+      uc.stop()
+
+    if args.metrics_dirname:
+      metrics.stop_periodic_export()
+      metrics.export(args.metrics_dirname)
+
+    tracer.disable()
@@ -0,0 +1,84 @@
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from src.modules.kv_store.kv_store import KvStore
+from src.modules.bert_qa.typedefs import QaQuery, QaBackend, CachedAnswer, AnswersCacheStats
+from src.modules.bert_qa.constants import \
+  QA_MODEL_NAME, \
+  DEF_QA_BACKEND, \
+  ANSWERS_CACHE_CAPACITY, \
+  ANSWERS_CACHE_MAX_BYTES
+
+
+class AnswersCache:
+  def __init__(
+      self,
+      capacity: int = ANSWERS_CACHE_CAPACITY,
+      path: Optional[str] = None,
+      max_bytes: int = ANSWERS_CACHE_MAX_BYTES,
+  ) -> None:
+    self.capacity = capacity
+    self.entries: OrderedDict[str, Optional[str]] = OrderedDict()
+    self.store = KvStore(path=path, max_bytes=max_bytes) if path else None
+    self.lock = threading.Lock()
+
+    self.hits = 0
+    self.misses = 0
+
+  def get(self, query: QaQuery, backend: QaBackend = DEF_QA_BACKEND) -> Optional[CachedAnswer]:
+    key = make_answer_key(query, backend)
+
+    with self.lock:
+      if key in self.entries:
+        self.entries.move_to_end(key)
+        self.hits += 1
+
+        return CachedAnswer(answer=self.entries[key])
+
+    value = self.store.get(key) if self.store else None
+
+    with self.lock:
+      if value is None:
+        self.misses += 1
+        return None
+
+      answer = json.loads(value)
+
+      self.hits += 1
+      self.__remember(key, answer)
+
+    return CachedAnswer(answer=answer)
+
+  def put(self, query: QaQuery, answer: Optional[str], backend: QaBackend = DEF_QA_BACKEND) -> None:
+    key = make_answer_key(query, backend)
+
+    with self.lock:
+      self.__remember(key, answer)
+
+    if self.store:
+      self.store.put(key=key, value=json.dumps(answer, ensure_ascii=False))
+
+  def stats(self) -> AnswersCacheStats:
+    with self.lock:
+      return AnswersCacheStats(hits=self.hits, misses=self.misses, entries=len(self.entries))
+
+  def __remember(self, key: str, answer: Optional[str]) -> None:
+    self.entries[key] = answer
+    self.entries.move_to_end(key)
+
+    while len(self.entries) > self.capacity:
+      self.entries.popitem(last=False)
+
+
+def make_answer_key(query: QaQuery, backend: QaBackend = DEF_QA_BACKEND) -> str:
+  context_digest = hashlib.sha256(query.context.encode('utf-8')).hexdigest()
+  digest = hashlib.sha256()
+
+  for part in [QA_MODEL_NAME, backend.value, query.question, context_digest]:
+    digest.update(part.encode('utf-8'))
+    digest.update(b'\0')
+
+  return digest.hexdigest()
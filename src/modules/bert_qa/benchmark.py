@@ -0,0 +1,98 @@
+from argparse import ArgumentParser
+from statistics import mean
+from time import perf_counter
+from typing import Optional
+
+from src.modules.bert_qa.bert_qa import BertQaModelClient
+from src.modules.bert_qa.typedefs import QaQuery, QaBackend, BackendBenchmark
+from src.modules.bert_qa.constants import BENCHMARK_RUNS, BENCHMARK_CONTEXTS
+from src.modules.parser.constants import QA_QUESTIONS
+
+
+def benchmark_backends(
+    backends: list[QaBackend],
+    queries: Optional[list[QaQuery]] = None,
+    runs: int = BENCHMARK_RUNS,
+) -> list[BackendBenchmark]:
+  queries = queries or make_benchmark_queries()
+  reference_answers = None
+  benchmarks = []
+
+  for backend in [QaBackend.Eager, *[backend for backend in backends if backend != QaBackend.Eager]]:
+    answers, latencies = run_backend(backend, queries, runs)
+
+    if reference_answers is None:
+      reference_answers = answers
+
+    benchmarks.append(BackendBenchmark(
+      backend=backend,
+      mean_latency_ms=to_ms(mean(latencies)),
+      p95_latency_ms=to_ms(eval_percentile(latencies, 0.95)),
+      agreement=round(eval_agreement(answers, reference_answers), 3),
+    ))
+
+  return benchmarks
+
+
+def make_benchmark_queries() -> list[QaQuery]:
+  return [
+    QaQuery(question=question, context=context)
+    for context in BENCHMARK_CONTEXTS
+    for question in QA_QUESTIONS.values()
+  ]
+
+
+def run_backend(
+    backend: QaBackend,
+    queries: list[QaQuery],
+    runs: int,
+) -> tuple[list[Optional[str]], list[float]]:
+  qa_client = BertQaModelClient(backend=backend)
+  qa_client.ask_many(queries[:1])
+
+  answers: list[Optional[str]] = []
+  latencies: list[float] = []
+
+  for _ in range(runs):
+    answers = []
+
+    for query in queries:
+      start_time = perf_counter()
+      answers.append(qa_client.ask_many([query])[0])
+      latencies.append(perf_counter() - start_time)
+
+  return answers, latencies
+
+
+def eval_agreement(answers: list[Optional[str]], reference_answers: list[Optional[str]]) -> float:
+  matches = [answer == reference for answer, reference in zip(answers, reference_answers)]
+
+  return sum(matches) / len(matches)
+
+
+def eval_percentile(values: list[float], percentile: float) -> float:
+  sorted_values = sorted(values)
+
+  return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * percentile))]
+
+
+def to_ms(seconds: float) -> float:
+  return round(seconds * 1000, 1)
+
+
+def log(message: str) -> None:
+  print(f'QA benchmark: {message}')
+
+
+if __name__ == '__main__':
+  arg_parser = ArgumentParser(description='Compare QA backends latency and answers agreement against eager.')
+  arg_parser.add_argument('--backends', nargs='+', choices=[backend.value for backend in QaBackend],
+                          default=[backend.value for backend in QaBackend])
+  arg_parser.add_argument('--runs', type=int, default=BENCHMARK_RUNS)
+  args = arg_parser.parse_args()
+
+  for benchmark in benchmark_backends([QaBackend(backend) for backend in args.backends], runs=args.runs):
+    log(
+      f'{benchmark.backend.value}: mean {benchmark.mean_latency_ms} ms, '
+      f'p95 {benchmark.p95_latency_ms} ms, agreement {benchmark.agreement}'
+    )
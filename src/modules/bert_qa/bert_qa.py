@@ -1,41 +1,118 @@
 import os
+import threading
 from typing import Optional
 
-from transformers import AutoTokenizer, AutoModelForQuestionAnswering, pipeline
-
-from src.modules.bert_qa.constants import QA_MODEL_NAME, PIPELINE_TASK_TYPE, CACHE_DIR_PATH
+from src.utils.imports import lazy_import
+from src.modules.bert_qa.typedefs import QaQuery, QaBackend
+from src.modules.bert_qa.answers_cache import AnswersCache
+from src.modules.bert_qa.constants import \
+  QA_MODEL_NAME, \
+  PIPELINE_TASK_TYPE, \
+  CACHE_DIR_PATH, \
+  DEF_QA_BACKEND, \
+  ONNX_MODEL_DIR_PATH
 from src.modules.bert_qa.helpers import thresholded, normalize_answer
 
+transformers = lazy_import('transformers')
+optimum_ort = lazy_import('optimum.onnxruntime')
+torch = lazy_import('torch')
+
 
 class BertQaModelClient:
-  def __init__(self, context: str) -> None:
-    self.context = context
+  def __init__(
+      self,
+      answers_cache: Optional[AnswersCache] = None,
+      backend: QaBackend = DEF_QA_BACKEND,
+  ) -> None:
+    self.answers_cache = answers_cache
+    self.backend = backend
+    self.thread_local = threading.local()
 
     self.__attach_cache()
-    self.__init_tokenizer()
     self.__init_model()
-    self.__init_pipeline()
 
-  def ask(self, question: str) -> Optional[str]:
-    output = self.pipeline(context=self.context, question=question)  # noqa
-    answer = thresholded(output)
+  def ask(self, question: str, context: str) -> Optional[str]:
+    return self.ask_many([QaQuery(question=question, context=context)])[0]
 
-    if not answer:
-      return None
+  def ask_many(self, queries: list[QaQuery]) -> list[Optional[str]]:
+    if not self.answers_cache:
+      return self.__infer(queries)
 
-    return normalize_answer(answer)
+    answers: list[Optional[str]] = [None] * len(queries)
+    missed_indices = []
+
+    for index, query in enumerate(queries):
+      cached_answer = self.answers_cache.get(query, self.backend)
+
+      if cached_answer:
+        answers[index] = cached_answer.answer
+      else:
+        missed_indices.append(index)
+
+    inferred_answers = self.__infer([queries[index] for index in missed_indices])
+
+    for index, answer in zip(missed_indices, inferred_answers):
+      answers[index] = answer
+      self.answers_cache.put(queries[index], answer, self.backend)
+
+    return answers
+
+  def __infer(self, queries: list[QaQuery]) -> list[Optional[str]]:
+    if not queries:
+      return []
+
+    outputs = self.__get_pipeline()(  # noqa
+      question=[query.question for query in queries],
+      context=[query.context for query in queries],
+      batch_size=len(queries),
+    )
 
-  def reset_context(self, context: str) -> None:
-    self.context = context
+    if isinstance(outputs, dict):
+      outputs = [outputs]
 
-  def __init_tokenizer(self) -> None:
-    self.tokenizer = AutoTokenizer.from_pretrained(QA_MODEL_NAME, cache_dir=self.cache_dir)
+    return [BertQaModelClient.__to_answer(output) for output in outputs]
 
   def __init_model(self) -> None:
-    self.model = AutoModelForQuestionAnswering.from_pretrained(QA_MODEL_NAME, cache_dir=self.cache_dir)
+    if self.backend == QaBackend.Onnx:
+      self.model = self.__load_onnx_model()
+      return
 
-  def __init_pipeline(self):
-    self.pipeline = pipeline(PIPELINE_TASK_TYPE, model=self.model, tokenizer=self.tokenizer)
+    self.model = transformers.AutoModelForQuestionAnswering.from_pretrained(QA_MODEL_NAME, cache_dir=self.cache_dir)
+
+    if self.backend == QaBackend.Int8:
+      self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+
+  def __load_onnx_model(self):
+    if os.path.isdir(ONNX_MODEL_DIR_PATH):
+      return optimum_ort.ORTModelForQuestionAnswering.from_pretrained(ONNX_MODEL_DIR_PATH)
+
+    model = optimum_ort.ORTModelForQuestionAnswering.from_pretrained(
+      QA_MODEL_NAME,
+      export=True,
+      cache_dir=self.cache_dir,
+    )
+    model.save_pretrained(ONNX_MODEL_DIR_PATH)
+
+    return model
+
+  def __get_pipeline(self):
+    if not hasattr(self.thread_local, 'pipeline'):
+      self.thread_local.pipeline = transformers.pipeline(
+        PIPELINE_TASK_TYPE,
+        model=self.model,
+        tokenizer=transformers.AutoTokenizer.from_pretrained(QA_MODEL_NAME, cache_dir=self.cache_dir),
+      )
+
+    return self.thread_local.pipeline
+
+  @staticmethod
+  def __to_answer(output: dict) -> Optional[str]:
+    answer = thresholded(output)
+
+    if not answer:
+      return None
+
+    return normalize_answer(answer)
 
   def __attach_cache(self):
     self.cache_dir = os.environ['HF_HOME'] = CACHE_DIR_PATH
@@ -1,5 +1,28 @@
+from src.constants.paths import CACHE_DATA_DIR_PATH
+from src.modules.bert_qa.typedefs import QaBackend
+
 QA_MODEL_NAME = 'robinhad/ukrainian-qa'
 PIPELINE_TASK_TYPE = 'question-answering'
 CACHE_DIR_PATH = '/Users/dmytro-pelovych/University/SE3/cw/project/cache'
 
 ANSWER_SCORE_THRESH = 0.5
+
+DEF_QA_BACKEND = QaBackend.Eager
+ONNX_MODEL_DIR_PATH = f'{CACHE_DATA_DIR_PATH}/onnx/ukrainian-qa'
+
+ANSWERS_CACHE_CAPACITY = 10_000
+ANSWERS_CACHE_PATH = f'{CACHE_DATA_DIR_PATH}/qa_answers.sqlite'
+ANSWERS_CACHE_MAX_BYTES = 256 * 1024 ** 2
+
+BENCHMARK_RUNS = 3
+BENCHMARK_CONTEXTS = [
+  'Справа № 522/1234/21. ВИРОК ІМЕНЕМ УКРАЇНИ 12 березня 2021 року м. Одеса. '
+  'Приморський районний суд м. Одеси у складі: головуючого судді Петренка О. В., '
+  'за участю секретаря судового засідання Коваль І. М., прокурора Сидоренка А. П.',
+  'Справа № 757/4321/20-к. УХВАЛА ІМЕНЕМ УКРАЇНИ 03 лютого 2020 року. '
+  'Печерський районний суд міста Києва в складі головуючого судді Іваненко Н. С., '
+  'при секретарі Мельник О. О., за участю прокурора Бондаренка В. І.',
+  'Справа № 466/987/19. ВИРОК ІМЕНЕМ УКРАЇНИ 21 листопада 2019 року м. Львів. '
+  'Шевченківський районний суд м. Львова у складі: головуючий суддя Ткачук Р. Я., '
+  'секретар судового засідання Гнатюк Л. П., прокурор Лисенко Д. М.',
+]
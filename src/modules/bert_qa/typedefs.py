@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+
+class QaBackend(Enum):
+  Eager = 'eager'
+  Onnx = 'onnx'
+  Int8 = 'int8'
+
+
+@dataclass
+class QaQuery:
+  question: str
+  context: str
+
+
+@dataclass
+class CachedAnswer:
+  answer: Optional[str]
+
+
+@dataclass
+class AnswersCacheStats:
+  hits: int
+  misses: int
+  entries: int
+
+
+@dataclass
+class BackendBenchmark:
+  backend: QaBackend
+  mean_latency_ms: float
+  p95_latency_ms: float
+  agreement: float
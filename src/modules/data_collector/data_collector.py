@@ -1,11 +1,13 @@
 import os
-import requests
 from urllib import request
-from requests import Response
+
+from src.utils.imports import lazy_import
 
 from src.constants.paths import DATA_DIR_PATH
 from src.modules.data_collector.constants import SEARCHER_ENDPOINTS, SEARCHER_DEFAULT_HEADERS
 
+requests = lazy_import('requests')
+
 
 def get_and_download_doc(id: int) -> None:
   doc = get_doc(id)
@@ -26,7 +28,7 @@ def bulk_get_docs(ids: list[int]) -> list[dict]:
   return docs
 
 
-def request_doc(id: int) -> Response:
+def request_doc(id: int) -> 'requests.Response':
   url = f'{SEARCHER_ENDPOINTS["FULL_DOCUMENT"]}/{id}'
 
   response = requests.get(
@@ -1,13 +1,15 @@
 from typing import Optional
 from dataclasses import asdict
 
-from matplotlib import pyplot as plt
 import src.modules.file_manager.file_manager as fm
 from src.utils.functional import is_list_empty, flatten, rounded
+from src.utils.imports import lazy_import
 
 from src.modules.eff_analyzer.typedefs import ParserEfficiency, MethodEfficiency
 from src.modules.eff_analyzer.constants import PARSER_EFF_FILE
 
+plt = lazy_import('matplotlib.pyplot')
+
 
 class ParserEfficiencyAnalyzer:
   def __init__(self, dirname: str, dst_path: str):
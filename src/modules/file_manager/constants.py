@@ -1,2 +1,11 @@
+import re
+
 PDF_FILE_MARKER = '.pdf'
-TXT_FILE_MARKER = '.txt'
\ No newline at end of file
+TXT_FILE_MARKER = '.txt'
+SHARD_FILE_MARKER = '.jsonl'
+COMPRESSED_SHARD_FILE_MARKER = '.jsonl.gz'
+SHARD_INDEX_FILE_MARKER = '.index.jsonl'
+SHARD_MAX_BYTES = 64 * 1024 * 1024
+SHARD_READ_SIZE = 64 * 1024
+SHARD_INDEX_FLUSH_SIZE = 64
+TXT_LINE_BREAK_PATTERN = re.compile(r'\n(?!\Z)')
@@ -1,17 +1,32 @@
 import json
 import os
+import zlib
 from glob import glob
 from json import JSONDecodeError
-from typing import Any
-from striprtf import striprtf
+from typing import Any, Iterator
 from io import StringIO
-from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
-from pdfminer.converter import TextConverter
-from pdfminer.layout import LAParams
-from pdfminer.pdfpage import PDFPage
 
-from src.modules.file_manager.constants import PDF_FILE_MARKER, TXT_FILE_MARKER
-from src.modules.file_manager.typedefs import IdentifiablePath, IdentifiableJSON, IdentifiableFileRecord
+from src.utils.imports import lazy_import
+
+from src.modules.file_manager.constants import \
+  PDF_FILE_MARKER, \
+  TXT_FILE_MARKER, \
+  SHARD_FILE_MARKER, \
+  COMPRESSED_SHARD_FILE_MARKER, \
+  SHARD_INDEX_FILE_MARKER, \
+  SHARD_READ_SIZE, \
+  TXT_LINE_BREAK_PATTERN
+from src.modules.file_manager.typedefs import \
+  IdentifiablePath, \
+  IdentifiableJSON, \
+  IdentifiableFileRecord, \
+  ShardLocation
+
+striprtf = lazy_import('striprtf.striprtf')
+pdfinterp = lazy_import('pdfminer.pdfinterp')
+pdfconverter = lazy_import('pdfminer.converter')
+pdflayout = lazy_import('pdfminer.layout')
+pdfpage = lazy_import('pdfminer.pdfpage')
 
 
 def map_to_identifiable_path(path: str) -> IdentifiablePath:
@@ -59,6 +74,17 @@ def get_files_count(dirname: str, pattern: str = '*') -> int:
   return len(files_paths)
 
 
+def get_file_size(path: str) -> int:
+  return os.path.getsize(path)
+
+
+def make_dir(path: str) -> None:
+  try:
+    os.makedirs(path, exist_ok=True)
+  except:  # noqa
+    throw(f'cannot make directory, {path}')
+
+
 def read_json(path: str) -> dict or None:
   try:
     with open(path, 'r') as json_file:
@@ -92,15 +118,73 @@ def read_txt(path: str) -> str:
     throw(f'cannot read file, {path}')
 
 
+def iterate_file_chunks(path: str, chunk_size: int) -> Iterator[str]:
+  if PDF_FILE_MARKER in path:
+    return iterate_pdf_chunks(path)
+  elif TXT_FILE_MARKER in path:
+    return iterate_txt_chunks(path, chunk_size)
+  else:
+    throw('file format is not acceptable!')
+
+
+def join_txt_lines(content: str) -> str:
+  return TXT_LINE_BREAK_PATTERN.sub('\n ', content.replace('\r\n', '\n').replace('\r', '\n'))
+
+
+def iterate_txt_chunks(path: str, chunk_size: int) -> Iterator[str]:
+  try:
+    with open(path, 'r', encoding='utf-8') as file:
+      separator = ''
+      lines = []
+      size = 0
+
+      for line in file:
+        lines.append(line)
+        size += len(line)
+
+        if size >= chunk_size:
+          yield separator + ' '.join(lines)
+          separator = ' '
+          lines = []
+          size = 0
+
+      if lines:
+        yield separator + ' '.join(lines)
+  except Exception:
+    throw(f'cannot read file, {path}')
+
+
+def iterate_pdf_chunks(path: str) -> Iterator[str]:
+  try:
+    manager = pdfinterp.PDFResourceManager()
+    buffer = StringIO()
+    converter = pdfconverter.TextConverter(manager, buffer, laparams=pdflayout.LAParams())
+    interpreter = pdfinterp.PDFPageInterpreter(manager, converter)
+
+    with open(path, 'rb') as file:
+      for page in pdfpage.PDFPage.get_pages(file, check_extractable=True):
+        interpreter.process_page(page)
+
+        yield buffer.getvalue()
+
+        buffer.seek(0)
+        buffer.truncate()
+
+    converter.close()
+    buffer.close()
+  except Exception:
+    throw(f'cannot read PDF file, {path}')
+
+
 def read_pdf(path: str) -> str:
   try:
-    manager = PDFResourceManager()
+    manager = pdfinterp.PDFResourceManager()
     buffer = StringIO()
-    converter = TextConverter(manager, buffer, laparams=LAParams())
-    interpreter = PDFPageInterpreter(manager, converter)
+    converter = pdfconverter.TextConverter(manager, buffer, laparams=pdflayout.LAParams())
+    interpreter = pdfinterp.PDFPageInterpreter(manager, converter)
 
     with open(path, 'rb') as file:
-      pages = PDFPage.get_pages(file, caching=True, check_extractable=True)
+      pages = pdfpage.PDFPage.get_pages(file, caching=True, check_extractable=True)
 
       [interpreter.process_page(page) for page in pages]
 
@@ -115,6 +199,9 @@ def read_pdf(path: str) -> str:
 
 
 def bulk_get_jsons(dirname: str, sorting: bool, nonempty: bool) -> list[IdentifiableJSON]:
+  if get_paths(dirname, f'*{SHARD_INDEX_FILE_MARKER}'):
+    return bulk_get_shards_jsons(dirname, sorting, nonempty)
+
   jsons = []
   pattern_with_dir = f'{dirname}/*.json'
 
@@ -135,6 +222,84 @@ def bulk_get_jsons(dirname: str, sorting: bool, nonempty: bool) -> list[Identifi
   return jsons
 
 
+def bulk_get_shards_jsons(dirname: str, sorting: bool, nonempty: bool) -> list[IdentifiableJSON]:
+  index = read_shards_index(dirname)
+  jsons = []
+
+  for path in get_shards_paths(dirname):
+    shard = os.path.basename(path)
+
+    for offset, line in iterate_shard_lines(path):
+      record = json.loads(line)
+      location = index.get(record['id'])
+
+      if not location or location.shard != shard or location.offset != offset:
+        continue
+
+      jsons.append(IdentifiableJSON(id=record['id'], content=record['content']))
+
+  if sorting:
+    jsons = sorted(jsons, key=lambda json: int(json.id))
+
+  if nonempty:
+    jsons = list(filter(lambda json: json.content is not None, jsons))
+
+  return jsons
+
+
+def get_shards_paths(dirname: str) -> list[str]:
+  paths = [
+    *get_paths(dirname, f'*{SHARD_FILE_MARKER}'),
+    *get_paths(dirname, f'*{COMPRESSED_SHARD_FILE_MARKER}'),
+  ]
+
+  return sorted([path for path in paths if not path.endswith(SHARD_INDEX_FILE_MARKER)])
+
+
+def read_shards_index(dirname: str) -> dict[str, ShardLocation]:
+  index: dict[str, ShardLocation] = {}
+
+  for path in sorted(get_paths(dirname, f'*{SHARD_INDEX_FILE_MARKER}')):
+    with open(path, 'r', encoding='utf-8') as index_file:
+      for line in index_file:
+        entry = json.loads(line)
+        location = ShardLocation(shard=entry['shard'], offset=entry['offset'], written_at=entry.get('written_at', 0))
+
+        if entry['id'] not in index or index[entry['id']].written_at <= location.written_at:
+          index[entry['id']] = location
+
+  return index
+
+
+def iterate_shard_lines(path: str) -> Iterator[tuple[int, bytes]]:
+  if not path.endswith(COMPRESSED_SHARD_FILE_MARKER):
+    with open(path, 'rb') as shard:
+      offset = 0
+
+      for line in shard:
+        yield offset, line
+        offset += len(line)
+
+    return
+
+  with open(path, 'rb') as shard:
+    data = memoryview(shard.read())
+
+  offset = 0
+
+  while offset < len(data):
+    start = offset
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    parts = []
+
+    while not decompressor.eof and offset < len(data):
+      chunk = data[offset:offset + SHARD_READ_SIZE]
+      parts.append(decompressor.decompress(chunk))
+      offset += len(chunk) - len(decompressor.unused_data)
+
+    yield start, b''.join(parts)
+
+
 def bulk_get_files_records(
     dirname: str,
     pattern: str
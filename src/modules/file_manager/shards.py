@@ -0,0 +1,136 @@
+import os
+import gzip
+import json
+import threading
+from time import time_ns
+from typing import Any, Optional, BinaryIO, TextIO
+
+import src.modules.file_manager.file_manager as fm
+
+from src.modules.file_manager.constants import \
+  SHARD_FILE_MARKER, \
+  COMPRESSED_SHARD_FILE_MARKER, \
+  SHARD_INDEX_FILE_MARKER, \
+  SHARD_MAX_BYTES, \
+  SHARD_INDEX_FLUSH_SIZE
+
+
+class ShardWriter:
+  def __init__(
+      self,
+      dirname: str,
+      prefix: str = 'shard',
+      max_bytes: int = SHARD_MAX_BYTES,
+      compress: bool = False,
+  ) -> None:
+    self.dirname = dirname
+    self.prefix = prefix
+    self.max_bytes = max_bytes
+    self.compress = compress
+    self.lock = threading.Lock()
+
+    fm.make_dir(dirname)
+
+    self.index_path = f'{dirname}/{prefix}{SHARD_INDEX_FILE_MARKER}'
+    self.shard_number = self.__find_last_shard_number()
+    self.shard: Optional[BinaryIO] = None
+    self.index: Optional[TextIO] = None
+    self.index_entries: list[str] = []
+
+  def __enter__(self) -> 'ShardWriter':
+    return self
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+  def write(self, record_id: str, content: Any) -> None:
+    line = json.dumps({'id': record_id, 'content': content}, ensure_ascii=False) + '\n'
+    data = line.encode('utf-8')
+
+    if self.compress:
+      data = gzip.compress(data)
+
+    with self.lock:
+      shard = self.__get_writable_shard(len(data))
+      offset = shard.tell()
+      shard.write(data)
+
+      self.index_entries.append(json.dumps({
+        'id': record_id,
+        'shard': os.path.basename(shard.name),
+        'offset': offset,
+        'written_at': time_ns(),
+      }) + '\n')
+
+      if len(self.index_entries) >= SHARD_INDEX_FLUSH_SIZE:
+        self.__flush_index()
+
+  def flush(self) -> None:
+    with self.lock:
+      self.__flush_index()
+
+  def close(self) -> None:
+    with self.lock:
+      self.__flush_index()
+
+      if self.shard:
+        self.shard.close()
+        self.shard = None
+
+      if self.index:
+        self.index.close()
+        self.index = None
+
+  def __flush_index(self) -> None:
+    if not self.index_entries:
+      return
+
+    self.shard.flush()
+
+    if not self.index:
+      self.index = open(self.index_path, 'a', encoding='utf-8')
+
+    self.index.writelines(self.index_entries)
+    self.index.flush()
+    self.index_entries = []
+
+  def __get_writable_shard(self, size: int) -> BinaryIO:
+    if not self.shard:
+      self.shard = open(self.__make_shard_path(self.shard_number), 'ab')
+
+    if self.shard.tell() and self.shard.tell() + size > self.max_bytes:
+      self.__flush_index()
+      self.shard.close()
+      self.shard_number += 1
+      self.shard = open(self.__make_shard_path(self.shard_number), 'ab')
+
+    return self.shard
+
+  def __make_shard_path(self, number: int) -> str:
+    marker = COMPRESSED_SHARD_FILE_MARKER if self.compress else SHARD_FILE_MARKER
+
+    return f'{self.dirname}/{self.prefix}-{number:05}{marker}'
+
+  def __find_last_shard_number(self) -> int:
+    numbers = [
+      int(fm.get_file_id(path).rsplit('-', 1)[1])
+      for path in fm.get_shards_paths(self.dirname)
+      if os.path.basename(path).startswith(f'{self.prefix}-')
+    ]
+
+    return max(numbers, default=0)
+
+
+def read_shard_record(dirname: str, record_id: str) -> Optional[dict]:
+  location = fm.read_shards_index(dirname).get(record_id)
+
+  if not location:
+    return None
+
+  with open(f'{dirname}/{location.shard}', 'rb') as shard:
+    shard.seek(location.offset)
+
+    if location.shard.endswith(COMPRESSED_SHARD_FILE_MARKER):
+      shard = gzip.GzipFile(fileobj=shard)
+
+    return json.loads(shard.readline())['content']
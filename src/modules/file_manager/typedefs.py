@@ -17,3 +17,10 @@ class IdentifiableJSON:
 class IdentifiablePath:
   id: str
   path: str
+
+
+@dataclass
+class ShardLocation:
+  shard: str
+  offset: int
+  written_at: int = 0
@@ -0,0 +1,15 @@
+IMPORT_TIME_LINE_PREFIX = 'import time:'
+DEF_RUNS = 5
+TOP_IMPORTS_COUNT = 5
+
+ENTRY_POINTS_BUDGETS_MS = {
+  'src.main': 50,
+  'src.modules.parser.parser': 250,
+  'src.modules.parser.batch': 300,
+  'src.modules.parser.pipeline': 300,
+  'src.modules.parse_cache.parse_cache': 200,
+  'src.modules.file_manager.file_manager': 100,
+  'src.modules.udpipe_client.udpipe_client': 100,
+  'src.modules.eff_analyzer.eff_analyzer': 120,
+  'src.modules.insights.insights': 150,
+}
@@ -0,0 +1,93 @@
+import sys
+import subprocess
+from argparse import ArgumentParser
+from statistics import median
+
+from src.modules.import_bench.typedefs import ImportEntry, ImportTiming
+from src.modules.import_bench.constants import \
+  IMPORT_TIME_LINE_PREFIX, \
+  DEF_RUNS, \
+  TOP_IMPORTS_COUNT, \
+  ENTRY_POINTS_BUDGETS_MS
+
+
+def check_budgets(budgets: dict[str, float], runs: int = DEF_RUNS) -> list[ImportTiming]:
+  return [
+    measure_import_time(module, budget_ms, runs)
+    for module, budget_ms in budgets.items()
+  ]
+
+
+def measure_import_time(module: str, budget_ms: float, runs: int = DEF_RUNS) -> ImportTiming:
+  runs_entries = [trace_imports(module) for _ in range(runs)]
+  cumulative_times = [
+    next(entry.cumulative_us for entry in entries if entry.package == module)
+    for entries in runs_entries
+  ]
+
+  return ImportTiming(
+    module=module,
+    cumulative_ms=round(median(cumulative_times) / 1000, 1),
+    budget_ms=budget_ms,
+    top_imports=sorted(runs_entries[-1], key=lambda entry: entry.self_us, reverse=True)[:TOP_IMPORTS_COUNT],
+  )
+
+
+def trace_imports(module: str) -> list[ImportEntry]:
+  completed = subprocess.run(
+    [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+    capture_output=True,
+    text=True,
+  )
+
+  if completed.returncode != 0:
+    throw(f'cannot import {module}, {completed.stderr.strip().splitlines()[-1]}')
+
+  return [
+    parse_import_time_line(line)
+    for line in completed.stderr.splitlines()
+    if line.startswith(IMPORT_TIME_LINE_PREFIX) and not line.rstrip().endswith('imported package')
+  ]
+
+
+def parse_import_time_line(line: str) -> ImportEntry:
+  self_us, cumulative_us, package = line[len(IMPORT_TIME_LINE_PREFIX):].split('|')
+
+  return ImportEntry(
+    package=package.strip(),
+    self_us=int(self_us),
+    cumulative_us=int(cumulative_us),
+  )
+
+
+def report(timings: list[ImportTiming]) -> None:
+  for timing in timings:
+    status = 'EXCEEDED' if timing.exceeded else 'ok'
+    log(f'{timing.module}: {timing.cumulative_ms} ms of {timing.budget_ms} ms [{status}]')
+
+    if timing.exceeded:
+      for entry in timing.top_imports:
+        log(f'  {entry.package}: {round(entry.self_us / 1000, 1)} ms self')
+
+
+def log(message: str) -> None:
+  print(f'ImportBench: {message}')
+
+
+def throw(message: str):
+  raise Exception(f'ImportBench: {message}')
+
+
+if __name__ == '__main__':
+  arg_parser = ArgumentParser(description='Check entry points import times against their budgets.')
+  arg_parser.add_argument('modules', nargs='*', default=list(ENTRY_POINTS_BUDGETS_MS))
+  arg_parser.add_argument('--runs', type=int, default=DEF_RUNS)
+  args = arg_parser.parse_args()
+
+  results = check_budgets(
+    {module: ENTRY_POINTS_BUDGETS_MS[module] for module in args.modules},
+    runs=args.runs,
+  )
+  report(results)
+
+  sys.exit(1 if any(timing.exceeded for timing in results) else 0)
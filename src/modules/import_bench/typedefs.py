@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ImportEntry:
+  package: str
+  self_us: int
+  cumulative_us: int
+
+
+@dataclass
+class ImportTiming:
+  module: str
+  cumulative_ms: float
+  budget_ms: float
+  top_imports: list[ImportEntry]
+
+  @property
+  def exceeded(self) -> bool:
+    return self.cumulative_ms > self.budget_ms
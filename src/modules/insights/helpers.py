@@ -2,8 +2,9 @@ import re
 from datetime import date
 from typing import Optional
 
-from fuzzywuzzy import process
 from src.utils.functional import remove_leading_zeros
+from src.modules.metrics.decorators import stage_logging
+from src.utils.imports import lazy_import
 
 import src.modules.regexs.helpers as reh
 
@@ -14,6 +15,8 @@ from src.modules.insights.constants import \
   OUTPUT_MATCHES_LIMIT, \
   PROCESS_MATCHES_LIMIT
 
+process = lazy_import('fuzzywuzzy.process')
+
 
 def get_week_day(value: str) -> Optional[str]:
   date = capture_issue_date(value)
@@ -88,5 +91,9 @@ def parse_month(value: str) -> int:
     else int(remove_leading_zeros(value))
 
 
+def logging(message: str):
+  return stage_logging(log, 'insights')(message)
+
+
 def log(message: str) -> None:
   print(f'Insights: {message}')
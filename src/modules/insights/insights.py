@@ -1,10 +1,10 @@
 from collections import Counter
 
-from matplotlib import pyplot as plt
 import src.modules.file_manager.file_manager as fm
 
 from src.utils.functional import flatten
-from src.modules.insights.helpers import eval_top_strings_freqs, get_week_day, limit_articles
+from src.utils.imports import lazy_import
+from src.modules.insights.helpers import eval_top_strings_freqs, get_week_day, limit_articles, logging
 
 from src.modules.parser.constants import SEX
 
@@ -14,6 +14,8 @@ from src.modules.insights.constants import \
   TOP_ARTICLES_INSIGHT_FILE, \
   SEXES_DISTRIB_INSIGHT_FILE
 
+plt = lazy_import('matplotlib.pyplot')
+
 
 class Insights:
   def __init__(self, dirname: str):
@@ -21,6 +23,7 @@ class Insights:
 
     self.parsed_documents_jsons = fm.bulk_get_jsons(dirname, sorting=False, nonempty=True)
 
+  @logging('building sexes distribution chart...')
   def build_sexes_distribution_chart(self) -> None:
     parties = flatten([
       json.content['case_parties_info']['parties']
@@ -50,6 +53,7 @@ class Insights:
 
     plt.savefig(SEXES_DISTRIB_INSIGHT_FILE)
 
+  @logging('building productivity chart...')
   def build_productivity_chart(self) -> None:
     existing_issue_dates = [
       json.content['document_issue_date']
@@ -83,6 +87,7 @@ class Insights:
     plt.tight_layout()
     plt.savefig(PRODUCT_INSIGHT_FILE)
 
+  @logging('building frequent articles chart...')
   def build_frequent_articles_chart(self) -> None:
     articles = flatten([
       json.content['document_regulatory_framework']
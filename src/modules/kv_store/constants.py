@@ -0,0 +1,4 @@
+CONNECTION_TIMEOUT = 30
+PRUNE_LOW_WATER_RATIO = 0.9
+ACCESS_FLUSH_SIZE = 256
+SIZE_TOTAL = 'size'
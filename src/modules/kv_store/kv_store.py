@@ -0,0 +1,155 @@
+import os
+import sqlite3
+import threading
+from time import time as curr_time
+from typing import Optional
+
+from src.modules.kv_store.typedefs import StoreStats
+from src.modules.kv_store.constants import CONNECTION_TIMEOUT, PRUNE_LOW_WATER_RATIO, ACCESS_FLUSH_SIZE, SIZE_TOTAL
+
+
+class KvStore:
+  def __init__(self, path: str, max_bytes: Optional[int] = None) -> None:
+    self.path = path
+    self.max_bytes = max_bytes
+    self.lock = threading.Lock()
+    self.accesses: dict[str, float] = {}
+
+    self.__connect()
+
+  def get(self, key: str) -> Optional[str]:
+    with self.lock:
+      row = self.connection.execute(
+        'SELECT value FROM entries WHERE key = ?', (key,)
+      ).fetchone()
+
+      if not row:
+        return None
+
+      self.accesses[key] = curr_time()
+
+      if len(self.accesses) >= ACCESS_FLUSH_SIZE:
+        self.__flush_accesses()
+
+    return row[0]
+
+  def put(self, key: str, value: str) -> None:
+    size = len(value.encode('utf-8'))
+
+    with self.lock:
+      self.connection.execute('BEGIN IMMEDIATE')
+
+      try:
+        replaced_row = self.connection.execute(
+          'SELECT size FROM entries WHERE key = ?', (key,)
+        ).fetchone()
+        self.connection.execute(
+          'INSERT OR REPLACE INTO entries (key, value, size, accessed_at) VALUES (?, ?, ?, ?)',
+          (key, value, size, curr_time()),
+        )
+        self.connection.execute(
+          'UPDATE totals SET value = value + ? WHERE name = ?',
+          (size - (replaced_row[0] if replaced_row else 0), SIZE_TOTAL),
+        )
+        total_size = self.__get_total_size()
+        self.connection.commit()
+      except Exception:
+        self.connection.rollback()
+        raise
+
+      self.accesses.pop(key, None)
+      is_over_limit = self.max_bytes is not None and total_size > self.max_bytes
+
+    if is_over_limit:
+      self.prune(int(self.max_bytes * PRUNE_LOW_WATER_RATIO))
+
+  def stats(self) -> StoreStats:
+    with self.lock:
+      entries, size = self.connection.execute(
+        'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries'
+      ).fetchone()
+
+    return StoreStats(path=self.path, entries=entries, size=size)
+
+  def prune(self, max_bytes: int) -> int:
+    with self.lock:
+      self.__flush_accesses()
+      self.connection.execute('BEGIN IMMEDIATE')
+
+      try:
+        total_size = self.connection.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        excess_size = total_size - max_bytes
+        evicted_keys = []
+
+        for key, size in self.connection.execute('SELECT key, size FROM entries ORDER BY accessed_at'):
+          if excess_size <= 0:
+            break
+
+          evicted_keys.append((key,))
+          excess_size -= size
+          total_size -= size
+
+        self.connection.executemany('DELETE FROM entries WHERE key = ?', evicted_keys)
+        self.connection.execute('UPDATE totals SET value = ? WHERE name = ?', (total_size, SIZE_TOTAL))
+        self.connection.commit()
+      except Exception:
+        self.connection.rollback()
+        raise
+
+    return len(evicted_keys)
+
+  def clear(self) -> None:
+    with self.lock:
+      self.connection.execute('DELETE FROM entries')
+      self.connection.execute('UPDATE totals SET value = 0 WHERE name = ?', (SIZE_TOTAL,))
+      self.connection.commit()
+
+      self.accesses = {}
+
+  def flush(self) -> None:
+    with self.lock:
+      self.__flush_accesses()
+
+  def __get_total_size(self) -> int:
+    return self.connection.execute('SELECT value FROM totals WHERE name = ?', (SIZE_TOTAL,)).fetchone()[0]
+
+  def __flush_accesses(self) -> None:
+    accesses = [(accessed_at, key) for key, accessed_at in self.accesses.items()]
+    self.accesses = {}
+
+    try:
+      self.connection.executemany('UPDATE entries SET accessed_at = ? WHERE key = ?', accesses)
+      self.connection.commit()
+    except sqlite3.OperationalError:
+      self.connection.rollback()
+
+  def __connect(self) -> None:
+    dirname = os.path.dirname(self.path)
+
+    if dirname:
+      os.makedirs(dirname, exist_ok=True)
+
+    self.connection = sqlite3.connect(
+      self.path,
+      timeout=CONNECTION_TIMEOUT,
+      check_same_thread=False,
+    )
+    self.connection.execute(
+      'CREATE TABLE IF NOT EXISTS entries ('
+      'key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL'
+      ')'
+    )
+    self.connection.execute(
+      'CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)'
+    )
+    self.connection.execute(
+      'CREATE TABLE IF NOT EXISTS totals (name TEXT PRIMARY KEY, value INTEGER NOT NULL)'
+    )
+    self.connection.commit()
+
+    self.connection.execute('BEGIN IMMEDIATE')
+    self.connection.execute(
+      'INSERT OR IGNORE INTO totals (name, value) SELECT ?, COALESCE(SUM(size), 0) FROM entries',
+      (SIZE_TOTAL,),
+    )
+    self.connection.commit()
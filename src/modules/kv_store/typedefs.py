@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class StoreStats:
+  path: str
+  entries: int
+  size: int
@@ -0,0 +1,11 @@
+from src.constants.paths import METRICS_DATA_DIR_PATH
+
+LATENCY_BUCKETS = [0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+EXPORT_INTERVAL = 30
+JSON_SNAPSHOT_FILENAME = 'metrics.json'
+PROMETHEUS_FILENAME = 'metrics.prom'
+DEF_METRICS_DIR_PATH = METRICS_DATA_DIR_PATH
+
+PROMETHEUS_LATENCY_METRIC = 'cw_parser_stage_duration_seconds'
+PROMETHEUS_COUNTER_METRIC = 'cw_parser_events_total'
@@ -0,0 +1,43 @@
+from functools import wraps
+from typing import Callable
+
+from src.utils.decorators import make_logging_decorator, with_time_estimate
+from src.modules.metrics.metrics import registry as metrics
+from src.modules.tracing.tracing import tracer
+
+
+class StageLogging:
+  def __init__(self) -> None:
+    self.debug = False
+
+  def __call__(self, logger, scope: str):
+    return make_logging_decorator(logger, scope, measure_stage, self.is_debug)
+
+  def enable_debug(self) -> None:
+    self.debug = True
+
+  def disable_debug(self) -> None:
+    self.debug = False
+
+  def is_debug(self) -> bool:
+    return self.debug
+
+
+def measure_stage(name: str, func: Callable) -> Callable:
+  @wraps(func)
+  def measured_func(*args, **kwargs):
+    try:
+      with tracer.span(name):
+        fn_result, exec_time = with_time_estimate(func, *args, **kwargs)
+    except Exception:
+      metrics.increment(f'{name}.errors')
+      raise
+
+    metrics.observe(name, exec_time)
+
+    return fn_result
+
+  return measured_func
+
+
+stage_logging = StageLogging()
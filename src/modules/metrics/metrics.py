@@ -0,0 +1,149 @@
+import os
+import json
+import threading
+from bisect import bisect_left
+from dataclasses import asdict
+from typing import Optional
+
+from src.modules.metrics.typedefs import Histogram
+from src.modules.metrics.constants import \
+  LATENCY_BUCKETS, \
+  EXPORT_INTERVAL, \
+  JSON_SNAPSHOT_FILENAME, \
+  PROMETHEUS_FILENAME, \
+  DEF_METRICS_DIR_PATH, \
+  PROMETHEUS_LATENCY_METRIC, \
+  PROMETHEUS_COUNTER_METRIC
+
+
+class MetricsRegistry:
+  def __init__(self) -> None:
+    self.enabled = False
+    self.lock = threading.Lock()
+    self.counters: dict[str, int] = {}
+    self.histograms: dict[str, Histogram] = {}
+
+    self.export_stop: Optional[threading.Event] = None
+
+  def enable(self) -> None:
+    self.enabled = True
+
+  def disable(self) -> None:
+    self.enabled = False
+
+  def reset(self) -> None:
+    with self.lock:
+      self.counters = {}
+      self.histograms = {}
+
+  def increment(self, name: str, value: int = 1) -> None:
+    if not self.enabled:
+      return
+
+    with self.lock:
+      self.counters[name] = self.counters.get(name, 0) + value
+
+  def observe(self, name: str, seconds: float) -> None:
+    if not self.enabled:
+      return
+
+    with self.lock:
+      histogram = self.histograms.get(name)
+
+      if not histogram:
+        histogram = self.histograms[name] = Histogram(
+          buckets=LATENCY_BUCKETS,
+          counts=[0] * (len(LATENCY_BUCKETS) + 1),
+        )
+
+      histogram.counts[bisect_left(histogram.buckets, seconds)] += 1
+      histogram.sum += seconds
+      histogram.count += 1
+
+  def merge(self, snapshot: dict) -> None:
+    with self.lock:
+      for name, value in snapshot['counters'].items():
+        self.counters[name] = self.counters.get(name, 0) + value
+
+      for name, data in snapshot['histograms'].items():
+        histogram = self.histograms.get(name)
+
+        if not histogram:
+          histogram = self.histograms[name] = Histogram(
+            buckets=list(data['buckets']),
+            counts=[0] * len(data['counts']),
+          )
+
+        histogram.counts = [count + other for count, other in zip(histogram.counts, data['counts'])]
+        histogram.sum += data['sum']
+        histogram.count += data['count']
+
+  def snapshot(self) -> dict:
+    with self.lock:
+      return {
+        'counters': dict(self.counters),
+        'histograms': {
+          name: asdict(histogram)
+          for name, histogram in self.histograms.items()
+        },
+      }
+
+  def export(self, dirname: str = DEF_METRICS_DIR_PATH) -> None:
+    snapshot = self.snapshot()
+
+    os.makedirs(dirname, exist_ok=True)
+
+    with open(f'{dirname}/{JSON_SNAPSHOT_FILENAME}', 'w', encoding='utf-8') as file:
+      json.dump(snapshot, file, ensure_ascii=False)
+
+    with open(f'{dirname}/{PROMETHEUS_FILENAME}', 'w', encoding='utf-8') as file:
+      file.write(to_prometheus_text(snapshot))
+
+  def start_periodic_export(
+      self,
+      dirname: str = DEF_METRICS_DIR_PATH,
+      interval: float = EXPORT_INTERVAL,
+  ) -> None:
+    self.stop_periodic_export()
+    self.export_stop = threading.Event()
+
+    def export_periodically(stop: threading.Event) -> None:
+      while not stop.wait(interval):
+        self.export(dirname)
+
+    threading.Thread(
+      target=export_periodically,
+      args=(self.export_stop,),
+      daemon=True,
+    ).start()
+
+  def stop_periodic_export(self) -> None:
+    if self.export_stop:
+      self.export_stop.set()
+      self.export_stop = None
+
+
+def to_prometheus_text(snapshot: dict) -> str:
+  lines = [
+    f'# TYPE {PROMETHEUS_COUNTER_METRIC} counter',
+    *[
+      f'{PROMETHEUS_COUNTER_METRIC}{{name="{name}"}} {value}'
+      for name, value in snapshot['counters'].items()
+    ],
+    f'# TYPE {PROMETHEUS_LATENCY_METRIC} histogram',
+  ]
+
+  for name, histogram in snapshot['histograms'].items():
+    cumulative_count = 0
+
+    for bucket, count in zip(histogram['buckets'] + ['+Inf'], histogram['counts']):
+      cumulative_count += count
+      lines.append(f'{PROMETHEUS_LATENCY_METRIC}_bucket{{stage="{name}",le="{bucket}"}} {cumulative_count}')
+
+    lines.append(f'{PROMETHEUS_LATENCY_METRIC}_sum{{stage="{name}"}} {histogram["sum"]}')
+    lines.append(f'{PROMETHEUS_LATENCY_METRIC}_count{{stage="{name}"}} {histogram["count"]}')
+
+  return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
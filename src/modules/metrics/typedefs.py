@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class Histogram:
+  buckets: list[float]
+  counts: list[int]
+  sum: float = 0.0
+  count: int = 0
@@ -0,0 +1,4 @@
+from src.constants.paths import CACHE_DATA_DIR_PATH
+
+PARSE_CACHE_PATH = f'{CACHE_DATA_DIR_PATH}/parsed_documents.sqlite'
+PARSE_CACHE_MAX_BYTES = 1024 ** 3
@@ -0,0 +1,99 @@
+import json
+import hashlib
+from argparse import ArgumentParser
+from dataclasses import asdict
+from typing import Optional
+
+from src.modules.kv_store.kv_store import KvStore
+from src.modules.kv_store.typedefs import StoreStats
+from src.modules.parser.typedefs import ParsedDocument
+from src.modules.parser.helpers import parsed_document_from_dict
+
+from src.modules.parser.constants import PARSER_VERSION, FIELD_VERSIONS
+from src.modules.bert_qa.typedefs import QaBackend
+from src.modules.bert_qa.constants import QA_MODEL_NAME, DEF_QA_BACKEND
+from src.modules.udpipe_client.constants import UDP_MODEL_NAME
+from src.modules.parse_cache.constants import PARSE_CACHE_PATH, PARSE_CACHE_MAX_BYTES
+
+
+class ParseCache:
+  def __init__(self, path: str = PARSE_CACHE_PATH, max_bytes: int = PARSE_CACHE_MAX_BYTES) -> None:
+    self.store = KvStore(path=path, max_bytes=max_bytes)
+
+  def get(
+      self,
+      document: str,
+      fields: list[str],
+      qa_backend: QaBackend = DEF_QA_BACKEND,
+      section_spans: bool = False,
+  ) -> Optional[ParsedDocument]:
+    value = self.store.get(make_cache_key(document, fields, qa_backend, section_spans))
+
+    if value is None:
+      return None
+
+    return parsed_document_from_dict(json.loads(value))
+
+  def put(
+      self,
+      document: str,
+      fields: list[str],
+      parsed_document: ParsedDocument,
+      qa_backend: QaBackend = DEF_QA_BACKEND,
+      section_spans: bool = False,
+  ) -> None:
+    self.store.put(
+      key=make_cache_key(document, fields, qa_backend, section_spans),
+      value=json.dumps(asdict(parsed_document), ensure_ascii=False),
+    )
+
+  def stats(self) -> StoreStats:
+    return self.store.stats()
+
+  def prune(self, max_bytes: int) -> int:
+    return self.store.prune(max_bytes)
+
+  def clear(self) -> None:
+    self.store.clear()
+
+
+def make_cache_key(
+    document: str,
+    fields: list[str],
+    qa_backend: QaBackend = DEF_QA_BACKEND,
+    section_spans: bool = False,
+) -> str:
+  digest = hashlib.sha256()
+
+  versioned_fields = [f'{field}@{FIELD_VERSIONS[field]}' for field in sorted(fields)]
+  sections_format = 'spans' if section_spans else 'text'
+
+  for part in [
+    PARSER_VERSION, QA_MODEL_NAME, qa_backend.value, UDP_MODEL_NAME, sections_format, *versioned_fields, document,
+  ]:
+    digest.update(part.encode('utf-8'))
+    digest.update(b'\0')
+
+  return digest.hexdigest()
+
+
+def log(message: str) -> None:
+  print(f'ParseCache: {message}')
+
+
+if __name__ == '__main__':
+  arg_parser = ArgumentParser(description='Inspect and prune the parsed documents cache.')
+  arg_parser.add_argument('command', choices=['stats', 'prune', 'clear'])
+  arg_parser.add_argument('--path', default=PARSE_CACHE_PATH)
+  arg_parser.add_argument('--max-bytes', type=int, default=PARSE_CACHE_MAX_BYTES)
+  args = arg_parser.parse_args()
+
+  cache = ParseCache(path=args.path, max_bytes=args.max_bytes)
+
+  if args.command == 'prune':
+    log(f'evicted {cache.prune(args.max_bytes)} entries')
+  elif args.command == 'clear':
+    cache.clear()
+
+  stats = cache.stats()
+  log(f'{stats.entries} entries, {stats.size} bytes at {stats.path}')
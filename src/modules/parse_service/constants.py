@@ -0,0 +1,19 @@
+from src.modules.parse_service.typedefs import RequestPriority
+from src.modules.bert_qa.constants import BENCHMARK_CONTEXTS
+
+SERVICE_HOST = '127.0.0.1'
+SERVICE_PORT = 8765
+SERVICE_WORKERS = 2
+
+PARSE_ENDPOINT = '/parse'
+HEALTH_ENDPOINT = '/health'
+
+REQUEST_PRIORITIES = {
+  'interactive': RequestPriority.Interactive,
+  'bulk': RequestPriority.Bulk,
+}
+DEF_REQUEST_PRIORITY = 'interactive'
+
+STOP_PRIORITY = max(priority.value for priority in RequestPriority) + 1
+
+WARMUP_DOCUMENT = '\n'.join(BENCHMARK_CONTEXTS)
@@ -0,0 +1,33 @@
+import json
+from dataclasses import asdict
+
+from src.modules.parser.typedefs import ParsedDocument
+from src.modules.parse_service.typedefs import RequestPriority
+
+from src.modules.parse_service.constants import REQUEST_PRIORITIES, DEF_REQUEST_PRIORITY
+
+
+def parse_request_body(body: bytes) -> tuple[str, RequestPriority]:
+  data = json.loads(body)
+
+  if not isinstance(data.get('document'), str):
+    throw('request body must contain a document string')
+
+  priority = data.get('priority', DEF_REQUEST_PRIORITY)
+
+  if priority not in REQUEST_PRIORITIES:
+    throw(f'unknown priority {priority}, expected one of {list(REQUEST_PRIORITIES)}')
+
+  return data['document'], REQUEST_PRIORITIES[priority]
+
+
+def dump_parsed_document(parsed_document: ParsedDocument) -> bytes:
+  return json.dumps(asdict(parsed_document), ensure_ascii=False).encode('utf-8')
+
+
+def log(message: str):
+  print(f'ParseService: {message}')
+
+
+def throw(message: str):
+  raise Exception(f'ParseService: {message}')
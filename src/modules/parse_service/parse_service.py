@@ -0,0 +1,195 @@
+import os
+import json
+import threading
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from queue import PriorityQueue
+from socketserver import ThreadingMixIn, UnixStreamServer
+from time import perf_counter
+from typing import Optional
+
+from src.modules.parser.parser import Parser
+from src.modules.parser.typedefs import ParsedDocument, ParseStage
+from src.modules.parser.helpers import normalize_raw_document
+from src.modules.parser.constants import FIELDS_STAGES
+from src.modules.metrics.metrics import registry as metrics
+from src.modules.tracing.tracing import tracer
+from src.modules.parse_service.typedefs import ParseJob, RequestPriority
+from src.modules.parse_service.helpers import parse_request_body, dump_parsed_document, log
+
+from src.modules.parse_service.constants import \
+  SERVICE_HOST, \
+  SERVICE_PORT, \
+  SERVICE_WORKERS, \
+  PARSE_ENDPOINT, \
+  HEALTH_ENDPOINT, \
+  STOP_PRIORITY, \
+  WARMUP_DOCUMENT
+
+
+class ParseService:
+  def __init__(self, parser: Parser, workers: int = SERVICE_WORKERS, warm_up_udp: bool = False) -> None:
+    self.parser = parser
+    self.workers = workers
+    self.warm_up_udp = warm_up_udp or parser.udp_locally
+    self.queue: PriorityQueue = PriorityQueue()
+    self.sequence = count()
+    self.threads: list[threading.Thread] = []
+
+  def start(self) -> None:
+    warmed_up = threading.Barrier(self.workers + 1)
+
+    for _ in range(self.workers):
+      thread = threading.Thread(target=self.__work, args=(warmed_up,), daemon=True)
+      thread.start()
+      self.threads.append(thread)
+
+    warmed_up.wait()
+    log(f'{self.workers} workers warmed up')
+
+  def stop(self) -> None:
+    for _ in self.threads:
+      self.queue.put((STOP_PRIORITY, next(self.sequence), None))
+
+    for thread in self.threads:
+      thread.join()
+
+    self.threads = []
+
+  def submit(self, document: str, priority: RequestPriority) -> Future:
+    future = Future()
+    job = ParseJob(document=document, priority=priority, future=future, submitted_at=perf_counter())
+
+    self.queue.put((priority.value, next(self.sequence), job))
+
+    return future
+
+  def parse(self, document: str, priority: RequestPriority) -> ParsedDocument:
+    return self.submit(document, priority).result()
+
+  def __work(self, warmed_up: threading.Barrier) -> None:
+    self.__warm_up()
+    warmed_up.wait()
+
+    while (job := self.queue.get()[2]) is not None:
+      if not job.future.set_running_or_notify_cancel():
+        continue
+
+      try:
+        with tracer.trace('parse_document', {'service.priority': job.priority.name}):
+          job.future.set_result(self.__parse(job.document))
+      except Exception as error:
+        metrics.increment(f'service.{job.priority.name}.errors')
+        job.future.set_exception(error)
+      finally:
+        metrics.observe(f'service.{job.priority.name}', perf_counter() - job.submitted_at)
+
+  def __warm_up(self) -> None:
+    document = normalize_raw_document(WARMUP_DOCUMENT)
+    fields = [
+      field
+      for field in self.parser.fields
+      if self.warm_up_udp or ParseStage.Udp not in FIELDS_STAGES[field]
+    ]
+
+    if not fields:
+      return
+
+    try:
+      self.parser.parse(document, self.parser.process_with_udp(document, fields), fields)
+    except Exception as error:
+      log(f'warm up failed, {error}')
+
+  def __parse(self, raw_document: str) -> ParsedDocument:
+    document = normalize_raw_document(raw_document)
+    parsed_document = self.parser.restore(document)
+
+    if parsed_document:
+      return parsed_document
+
+    budget = self.parser.make_budget()
+
+    return self.parser.parse(document, self.parser.process_with_udp(document, budget=budget), budget=budget)
+
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+  daemon_threads = True
+
+
+def make_request_handler(service: ParseService) -> type[BaseHTTPRequestHandler]:
+  class ParseRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+      if self.path != HEALTH_ENDPOINT:
+        self.respond(404, json.dumps({'error': f'unknown endpoint {self.path}'}).encode('utf-8'))
+        return
+
+      self.respond(200, json.dumps({'status': 'ok', 'queued': service.queue.qsize()}).encode('utf-8'))
+
+    def do_POST(self) -> None:
+      if self.path != PARSE_ENDPOINT:
+        self.respond(404, json.dumps({'error': f'unknown endpoint {self.path}'}).encode('utf-8'))
+        return
+
+      try:
+        document, priority = parse_request_body(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+      except Exception as error:
+        self.respond(400, json.dumps({'error': str(error)}, ensure_ascii=False).encode('utf-8'))
+        return
+
+      try:
+        parsed_document = service.parse(document, priority)
+      except Exception as error:
+        self.respond(500, json.dumps({'error': str(error)}, ensure_ascii=False).encode('utf-8'))
+        return
+
+      self.respond(200, dump_parsed_document(parsed_document))
+
+    def respond(self, status: int, body: bytes) -> None:
+      self.send_response(status)
+      self.send_header('Content-Type', 'application/json; charset=utf-8')
+      self.send_header('Content-Length', str(len(body)))
+      self.end_headers()
+      self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+      pass
+
+  return ParseRequestHandler
+
+
+def serve(
+    parser: Parser,
+    host: str = SERVICE_HOST,
+    port: int = SERVICE_PORT,
+    unix_socket: Optional[str] = None,
+    workers: int = SERVICE_WORKERS,
+    warm_up_udp: bool = False,
+) -> None:
+  service = ParseService(parser, workers, warm_up_udp)
+  service.start()
+
+  handler = make_request_handler(service)
+
+  if unix_socket and os.path.exists(unix_socket):
+    os.remove(unix_socket)
+
+  if unix_socket:
+    server = ThreadingUnixHTTPServer(unix_socket, handler)
+    log(f'listening on {unix_socket}')
+  else:
+    server = ThreadingHTTPServer((host, port), handler)
+    log(f'listening on http://{host}:{port}')
+
+  try:
+    server.serve_forever()
+  except KeyboardInterrupt:
+    log('shutting down...')
+  finally:
+    server.server_close()
+    service.stop()
+
+    if unix_socket:
+      os.remove(unix_socket)
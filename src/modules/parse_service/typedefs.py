@@ -0,0 +1,16 @@
+from concurrent.futures import Future
+from dataclasses import dataclass
+from enum import Enum
+
+
+class RequestPriority(Enum):
+  Interactive = 0
+  Bulk = 1
+
+
+@dataclass
+class ParseJob:
+  document: str
+  priority: RequestPriority
+  future: Future
+  submitted_at: float
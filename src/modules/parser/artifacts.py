@@ -0,0 +1,57 @@
+import json
+import hashlib
+from dataclasses import asdict
+from typing import Optional
+
+import src.modules.udpipe_client.helpers as uch
+import src.modules.parser.helpers as ph
+
+from src.modules.kv_store.kv_store import KvStore
+from src.modules.udpipe_client.typedefs import Sentence
+from src.modules.parser.typedefs import DocumentSpans
+
+from src.modules.udpipe_client.constants import UDP_MODEL_NAME
+from src.modules.parser.constants import ARTIFACTS_PATH, ARTIFACTS_MAX_BYTES, SECTIONS_ARTIFACT_VERSION
+
+
+class ArtifactStore:
+  def __init__(self, path: str = ARTIFACTS_PATH, max_bytes: int = ARTIFACTS_MAX_BYTES) -> None:
+    self.store = KvStore(path=path, max_bytes=max_bytes)
+
+  def get_sentences(self, document: str) -> Optional[list[Sentence]]:
+    value = self.store.get(make_artifact_key('sentences', UDP_MODEL_NAME, document))
+
+    if value is None:
+      return None
+
+    return [uch.sentence_from_dict(sentence) for sentence in json.loads(value)]
+
+  def put_sentences(self, document: str, sentences: list[Sentence]) -> None:
+    self.store.put(
+      key=make_artifact_key('sentences', UDP_MODEL_NAME, document),
+      value=json.dumps([uch.sentence_to_dict(sentence) for sentence in sentences], ensure_ascii=False),
+    )
+
+  def get_spans(self, document: str) -> Optional[DocumentSpans]:
+    value = self.store.get(make_artifact_key('spans', str(SECTIONS_ARTIFACT_VERSION), document))
+
+    if value is None:
+      return None
+
+    return ph.document_spans_from_dict(json.loads(value))
+
+  def put_spans(self, document: str, spans: DocumentSpans) -> None:
+    self.store.put(
+      key=make_artifact_key('spans', str(SECTIONS_ARTIFACT_VERSION), document),
+      value=json.dumps(asdict(spans)),
+    )
+
+
+def make_artifact_key(kind: str, version: str, document: str) -> str:
+  digest = hashlib.sha256()
+
+  for part in [kind, version, document]:
+    digest.update(part.encode('utf-8'))
+    digest.update(b'\0')
+
+  return digest.hexdigest()
@@ -0,0 +1,169 @@
+import os
+import json
+import shutil
+from glob import glob
+from time import time_ns
+from multiprocessing import Pool
+from multiprocessing.util import Finalize
+from typing import Optional
+
+import src.modules.file_manager.file_manager as fm
+
+from src.modules.parser.parser import Parser
+from src.modules.metrics.metrics import registry as metrics
+from src.modules.tracing.tracing import tracer
+from src.modules.parse_cache.parse_cache import ParseCache
+from src.modules.parser.artifacts import ArtifactStore
+from src.modules.file_manager.shards import ShardWriter
+from src.modules.bert_qa.answers_cache import AnswersCache
+from src.modules.bert_qa.typedefs import QaBackend
+from src.modules.bert_qa.constants import DEF_QA_BACKEND
+from src.modules.parser.helpers import log
+from src.modules.parser.typedefs import ParseTask
+from src.modules.metrics.constants import JSON_SNAPSHOT_FILENAME
+from src.modules.parser.constants import LOCAL_STORE_PATH, MAX_TASKS_PER_WORKER, WORKER_METRICS_DIRNAME
+
+worker_parser: Optional[Parser] = None
+
+
+def bulk_parse(
+    src_paths: list[str],
+    dst_dirname: str,
+    workers: Optional[int] = None,
+    max_tasks_per_worker: int = MAX_TASKS_PER_WORKER,
+    cache_path: Optional[str] = None,
+    answers_cache_path: Optional[str] = None,
+    metrics_dirname: Optional[str] = None,
+    sharded: bool = False,
+    compress_shards: bool = False,
+    qa_backend: QaBackend = DEF_QA_BACKEND,
+    time_budget: Optional[float] = None,
+    section_spans: bool = False,
+    traces_dirname: Optional[str] = None,
+    artifacts_path: Optional[str] = None,
+) -> list[str]:
+  tasks = get_largest_first_tasks(src_paths, dst_dirname)
+
+  with Pool(
+      processes=workers,
+      initializer=init_worker,
+      initargs=(
+        cache_path,
+        answers_cache_path,
+        metrics_dirname,
+        dst_dirname if sharded else None,
+        compress_shards,
+        qa_backend,
+        time_budget,
+        section_spans,
+        traces_dirname,
+        artifacts_path,
+      ),
+      maxtasksperchild=max_tasks_per_worker,
+  ) as pool:
+    dst_paths = list(pool.imap_unordered(parse_task, tasks, chunksize=1))
+    pool.close()
+    pool.join()
+
+  if metrics_dirname:
+    merge_worker_metrics(metrics_dirname)
+
+  if sharded:
+    return get_written_shards_paths(dst_dirname, [dst_path for dst_path in dst_paths if dst_path])
+
+  return [dst_path for dst_path in dst_paths if dst_path]
+
+
+def get_written_shards_paths(dst_dirname: str, dst_paths: list[str]) -> list[str]:
+  index = fm.read_shards_index(dst_dirname)
+  record_ids = [fm.get_file_id(dst_path) for dst_path in dst_paths]
+
+  return sorted({
+    f'{dst_dirname}/{index[record_id].shard}'
+    for record_id in record_ids
+    if record_id in index
+  })
+
+
+def get_largest_first_tasks(src_paths: list[str], dst_dirname: str) -> list[ParseTask]:
+  sorted_src_paths = sorted(src_paths, key=fm.get_file_size, reverse=True)
+
+  return [
+    ParseTask(src_path=src_path, dst_path=get_dst_file_path(src_path, dst_dirname))
+    for src_path in sorted_src_paths
+  ]
+
+
+def get_dst_file_path(src_path: str, dst_dirname: str) -> str:
+  file_id = fm.get_file_id(src_path)
+
+  return f'{dst_dirname}/{file_id}.json'
+
+
+def merge_worker_metrics(metrics_dirname: str) -> None:
+  workers_dirname = f'{metrics_dirname}/{WORKER_METRICS_DIRNAME}'
+
+  for snapshot_path in glob(f'{workers_dirname}/*/{JSON_SNAPSHOT_FILENAME}'):
+    with open(snapshot_path, encoding='utf-8') as file:
+      metrics.merge(json.load(file))
+
+  metrics.export(metrics_dirname)
+  shutil.rmtree(workers_dirname, ignore_errors=True)
+
+
+def init_worker(
+    cache_path: Optional[str],
+    answers_cache_path: Optional[str],
+    metrics_dirname: Optional[str],
+    shards_dirname: Optional[str],
+    compress_shards: bool,
+    qa_backend: QaBackend,
+    time_budget: Optional[float],
+    section_spans: bool,
+    traces_dirname: Optional[str],
+    artifacts_path: Optional[str],
+) -> None:
+  global worker_parser
+
+  if metrics_dirname:
+    metrics.enable()
+    Finalize(
+      None,
+      metrics.export,
+      args=(f'{metrics_dirname}/{WORKER_METRICS_DIRNAME}/{os.getpid()}-{time_ns()}',),
+      exitpriority=0,
+    )
+
+  if traces_dirname:
+    tracer.enable(traces_dirname)
+
+  sink = ShardWriter(
+    dirname=shards_dirname,
+    prefix=str(os.getpid()),
+    compress=compress_shards,
+  ) if shards_dirname else None
+
+  if sink:
+    Finalize(sink, sink.close, exitpriority=1)
+
+  worker_parser = Parser(
+    store_path=f'{LOCAL_STORE_PATH}/{os.getpid()}',
+    cache=ParseCache(path=cache_path) if cache_path else None,
+    answers_cache=AnswersCache(path=answers_cache_path) if answers_cache_path else None,
+    sink=sink,
+    qa_backend=qa_backend,
+    time_budget=time_budget,
+    section_spans=section_spans,
+    artifacts=ArtifactStore(path=artifacts_path) if artifacts_path else None,
+  )
+
+
+def parse_task(task: ParseTask) -> Optional[str]:
+  try:
+    worker_parser(src_path=task.src_path, dst_path=task.dst_path)
+  except Exception as error:
+    log(f'failed to parse {task.src_path}, {error}')
+    metrics.increment('batch.failures')
+    return None
+
+  return task.dst_path
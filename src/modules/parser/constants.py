@@ -1,9 +1,40 @@
+from src.modules.parser.typedefs import \
+  QaField, ParseStage, PipelineLimits, FieldGuard, DocumentSectionType, Degradation
+from src.modules.regexs.typedefs import KeywordFamily
+from src.constants.paths import CACHE_DATA_DIR_PATH
+from src.modules.regexs.constants import \
+  JUDGE_PATTERN, \
+  PROSECUTOR_PATTERN, \
+  CLERK_PATTERN, \
+  COURT_NAME_PATTERN, \
+  CASE_RULING_START_MARKERS, \
+  CASE_DECISION_START_MARKERS, \
+  CASE_DECISION_END_MARKER
+
 LOCAL_STORE_PATH = './modules/parser/__local__'
-DOCUMENT_PATH = f'{LOCAL_STORE_PATH}/document.txt'
-PROCESSED_DOCUMENT_PATH = f'{LOCAL_STORE_PATH}/udp_document.json'
-DOCUMENT_SENTENCES_PATH = f'{LOCAL_STORE_PATH}/document_sentences.json'
+DOCUMENT_FILENAME = 'document.txt'
+PROCESSED_DOCUMENT_FILENAME = 'udp_document.json'
+DOCUMENT_SENTENCES_FILENAME = 'document_sentences.json'
 DEF_PARSED_DOCUMENT_PATH = f'{LOCAL_STORE_PATH}/parsed_document.json'
 
+MAX_TASKS_PER_WORKER = 50
+WORKER_METRICS_DIRNAME = 'workers'
+
+DEF_PIPELINE_LIMITS = PipelineLimits(
+  read_concurrency=2,
+  udp_concurrency=4,
+  scan_concurrency=2,
+  qa_concurrency=4,
+  parse_concurrency=2,
+  commit_concurrency=1,
+  queue_size=8,
+)
+
+PARSER_VERSION = '1'
+SECTIONS_ARTIFACT_VERSION = 1
+ARTIFACTS_PATH = f'{CACHE_DATA_DIR_PATH}/parse_artifacts.sqlite'
+ARTIFACTS_MAX_BYTES = 4 * 1024 ** 3
+
 NO_OCCUR_IN_TEXT = 'No occurrence in text'
 
 SEX = {
@@ -11,7 +42,112 @@ SEX = {
   'F': 'Fem',
 }
 
+FIELDS_STAGES = {
+  'document_sections': [ParseStage.Sections],
+  'document_issue_date': [ParseStage.Qa],
+  'document_regulatory_framework': [],
+  'document_decision_status': [ParseStage.Sections, ParseStage.Keywords],
+  'case_form': [ParseStage.Keywords],
+  'case_parties_info': [ParseStage.Udp],
+  'court_commission': [ParseStage.Sections, ParseStage.Keywords, ParseStage.Qa],
+  'court_location': [ParseStage.Qa],
+}
+
+FIELD_VERSIONS = {
+  'document_sections': 1,
+  'document_issue_date': 1,
+  'document_regulatory_framework': 1,
+  'document_decision_status': 1,
+  'case_form': 1,
+  'case_parties_info': 1,
+  'court_commission': 1,
+  'court_location': 1,
+}
+
+STAGES_DEPENDENCIES = {
+  ParseStage.Sections: [],
+  ParseStage.Keywords: [],
+  ParseStage.Udp: [],
+  ParseStage.Qa: [ParseStage.Sections],
+}
+
+FIELDS_QA_FIELDS = {
+  'document_issue_date': [QaField.IssueDate],
+  'court_commission': [QaField.Judge, QaField.Prosecutor, QaField.Clerk],
+  'court_location': [QaField.Location],
+}
+
+QA_FIELDS_GUARDS = {
+  QaField.IssueDate: [],
+  QaField.Judge: [FieldGuard(family=KeywordFamily.Judge, section_type=DocumentSectionType.Header)],
+  QaField.Prosecutor: [FieldGuard(family=KeywordFamily.Prosecutor, section_type=DocumentSectionType.Header)],
+  QaField.Clerk: [FieldGuard(family=KeywordFamily.Clerk, section_type=DocumentSectionType.Header)],
+  QaField.Location: [],
+}
+
+QA_QUESTIONS = {
+  QaField.IssueDate: 'Перша дата після іменем України?',
+  QaField.Judge: 'ПІБ головуючого судді?',
+  QaField.Prosecutor: 'ПІБ прокурора?',
+  QaField.Clerk: 'ПІБ секретаря?',
+  QaField.Location: 'Де розташований суд?',
+}
+
+QA_CUE_PATTERNS = {
+  QaField.Judge: JUDGE_PATTERN,
+  QaField.Prosecutor: PROSECUTOR_PATTERN,
+  QaField.Clerk: CLERK_PATTERN,
+  QaField.Location: COURT_NAME_PATTERN,
+}
+
+DEGRADATIONS_BUDGET_SHARES = {
+  Degradation.NoUdp: 0.5,
+  Degradation.HeaderOnlyQa: 0.5,
+  Degradation.RegexOnly: 0.2,
+}
+
+DEGRADATIONS_STAGES = {
+  Degradation.NoUdp: ParseStage.Udp,
+  Degradation.HeaderOnlyQa: ParseStage.Qa,
+  Degradation.RegexOnly: ParseStage.Qa,
+}
+
+RULE_CONFIDENCE_THRESH = 0.8
+ANCHORED_RULE_CONFIDENCE = 0.95
+QUALIFIED_RULE_CONFIDENCE = 0.85
+LOOSE_RULE_CONFIDENCE = 0.6
+ISSUE_DATE_ANCHOR_WINDOW = 200
+
+RETRIEVAL_WINDOW = 1
+RETRIEVAL_MAX_CUES = 3
+
 CASE_DECISION_STATUS = {
   'SATISFIED': 'задовольнити',
   'REJECTED': 'відмовити',
 }
+
+NORMALIZATION_CHUNK_SIZE = 64 * 1024
+STREAMING_MIN_BYTES = 8 * 1024 ** 2
+SECTION_MARKER_MAX_CHARS = max(
+  len(marker)
+  for marker in [*CASE_RULING_START_MARKERS, *CASE_DECISION_START_MARKERS, CASE_DECISION_END_MARKER]
+) + len('ла:')
+NORMALIZATION_BENCH_SIZES = [1024 ** 2, 4 * 1024 ** 2, 16 * 1024 ** 2]
+NORMALIZATION_BENCH_EDGE_CASES = [
+  '1/2/3, 4:5http://x AM',
+  '1/2/3,http://x 4:5 AM',
+  'a1/2/3, 4:5 AM',
+  '1/2/3, 4:5 AMhttps://x м.',
+  'http://x1/2/3, 4:5 PM ч.',
+]
+NORMALIZATION_BENCH_SAMPLE = (
+  'Справа № 522/1234/21\f\n'
+  'ВИРОК\xa0ІМЕНЕМ УКРАЇНИ 12 березня 2021 року м. Одеса\n'
+  'Суд, керуючись ст. 368, ч. 2 ст. 374, п. 1 ч. 1 ст. 7 КПК України, '
+  'див. https://reyestr.court.gov.ua/Review/95123456 \xd0\n'
+  '3/15/21, 10:42 AM\n'
+)
+SEGMENTER_CHECK_DOCUMENTS = 20000
+SEGMENTER_CHECK_SEED = 5
+SEGMENTER_CHECK_CHUNK_SIZE = 16
+SEGMENTER_CHECK_FILLERS = [' ', '\n', 'Суд ', 'x', ' текст\n', ':', 'ПОСТАНОВА ', 'суд ухвалив ']
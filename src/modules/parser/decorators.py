@@ -1,30 +1,23 @@
-from typing import Optional
+from dataclasses import replace
+from functools import wraps
 
-from src.modules.parser.typedefs import DocumentSectionType
+from src.modules.parser.typedefs import DocumentSectionType, ParseContext
 
 
 class WithSectionContext:
   def __init__(self, section_type: DocumentSectionType) -> None:
     self.section_type = section_type
 
-    self.instance: Optional = None
-    self.document_context: Optional[str] = None
-    self.section_context: Optional[str] = None
-
   def __call__(self, func):
-    def wrapped_func(instance, *args, **kwargs):
-      self.instance = instance
-      self.document_context = self.instance.document
-      self.section_context = self.instance.get_section(section_type=self.section_type)
+    section_type = self.section_type
 
-      if self.section_context:
-        self.instance.temp_context = self.section_context
-        self.instance.qa_client.reset_context(context=self.instance.temp_context)
+    @wraps(func)
+    def wrapped_func(instance, context: ParseContext, *args, **kwargs):
+      section_context = instance.get_section(context, section_type=section_type) or context.document
+      section_span = instance.get_section_scope_span(context, section_type=section_type)
 
-      return func(self.instance, *args, **kwargs)
+      section_scoped_context = replace(context, section_context=section_context, section_span=section_span)
 
-    if self.section_context:
-      self.instance.temp_context = None
-      self.instance.qa_client.reset_context(context=self.document_context)
+      return func(instance, section_scoped_context, *args, **kwargs)
 
     return wrapped_func
@@ -1,36 +1,275 @@
-from src.utils.decorators import make_logging_decorator
+from re import Pattern
+from time import monotonic
+from typing import Optional, Iterable, Iterator
+
+from src.modules.metrics.decorators import stage_logging
+from src.modules.metrics.metrics import registry as metrics
+
+import src.modules.file_manager.file_manager as fm
+
+from src.modules.parser.segmenter import slice_span
+
+from src.modules.parser.typedefs import \
+  ParsedDocument, \
+  CourtCommission, \
+  CasePartiesInfo, CaseParty, \
+  DocumentSections, DocumentSpans, \
+  ParseStage, ParseBudget, Degradation, QaField
+
+from src.modules.parser.constants import \
+  FIELDS_STAGES, \
+  FIELD_VERSIONS, \
+  STAGES_DEPENDENCIES, \
+  DEGRADATIONS_BUDGET_SHARES, \
+  DEGRADATIONS_STAGES, \
+  FIELDS_QA_FIELDS, \
+  RETRIEVAL_WINDOW, \
+  STREAMING_MIN_BYTES, \
+  NORMALIZATION_CHUNK_SIZE, \
+  RETRIEVAL_MAX_CUES
 
 from src.modules.regexs.constants import \
-  NBSP_PATTERN, \
-  FF_PATTERN, \
-  HTTP_PATTERN, \
-  NON_24_DATE_PATTERN, \
-  UTF_START_BYTE_PATTERN
+  NORMALIZATION_CHARS, \
+  NORMALIZATION_REMOVAL_PATTERNS, \
+  NORMALIZATION_ABBREVIATIONS
 
 
 def normalize_text(text: str) -> str:
-  modified_text = purify_text(text)
-  modified_text = modified_text.replace('м.', 'місто ')
-  modified_text = modified_text.replace('ст.', 'стаття ')
-  modified_text = modified_text.replace('ч.', 'частина ')
-  modified_text = modified_text.replace('п.', 'пункт ')
+  modified_text = replace_all(text, NORMALIZATION_CHARS)
+
+  for pattern in NORMALIZATION_REMOVAL_PATTERNS:
+    modified_text = pattern.sub('', modified_text)
+
+  return replace_all(modified_text, NORMALIZATION_ABBREVIATIONS)
+
+
+def replace_all(text: str, replacements: dict[str, str]) -> str:
+  for old, new in replacements.items():
+    text = text.replace(old, new)
+
+  return text
+
+
+def normalize_chunks(chunks: Iterable[str]) -> Iterator[str]:
+  tail = ''
+
+  for chunk in chunks:
+    text = tail + chunk
+    lines_end = text.rfind('\n') + 1
+
+    if lines_end:
+      yield normalize_text(text[:lines_end])
+
+    tail = text[lines_end:]
+
+  if tail:
+    yield normalize_text(tail)
+
+
+def normalize_raw_document(text: str) -> str:
+  return normalize_text(fm.join_txt_lines(text))
+
+
+def read_normalized_document(src_path: str) -> str:
+  return ''.join(iterate_normalized_chunks(src_path))
+
+
+def iterate_normalized_chunks(src_path: str) -> Iterator[str]:
+  if not is_streamed_document(src_path):
+    return iter([normalize_text(fm.read_file(src_path))])
+
+  return normalize_chunks(fm.iterate_file_chunks(src_path, NORMALIZATION_CHUNK_SIZE))
+
+
+def is_streamed_document(src_path: str) -> bool:
+  return fm.get_file_size(src_path) >= STREAMING_MIN_BYTES
+
+
+def narrow_context(context: str, cue_pattern: Pattern[str]) -> Optional[str]:
+  lines = [line.strip() for line in context.split('\n') if line.strip()]
+  cue_indices = [
+    index
+    for index, line in enumerate(lines)
+    if cue_pattern.search(line)
+  ][:RETRIEVAL_MAX_CUES]
+
+  kept_indices = sorted({
+    kept_index
+    for index in cue_indices
+    for kept_index in range(
+      max(0, index - RETRIEVAL_WINDOW),
+      min(len(lines), index + RETRIEVAL_WINDOW + 1),
+    )
+  })
+
+  narrowed_context = '\n'.join([lines[index] for index in kept_indices])
+
+  if not narrowed_context or len(narrowed_context) >= len(context):
+    return None
+
+  return narrowed_context
+
+
+def resolve_stages(fields: list[str]) -> set[ParseStage]:
+  unknown_fields = [field for field in fields if field not in FIELDS_STAGES]
+
+  if unknown_fields:
+    throw(f'unknown fields, {unknown_fields}')
+
+  stages = set()
+  pending_stages = [stage for field in fields for stage in FIELDS_STAGES[field]]
+
+  while pending_stages:
+    stage = pending_stages.pop()
+
+    if stage not in stages:
+      stages.add(stage)
+      pending_stages.extend(STAGES_DEPENDENCIES[stage])
 
-  return modified_text
+  return stages
 
 
-def purify_text(text: str) -> str:
-  modified_text = NBSP_PATTERN.sub(" ", text)
-  modified_text = UTF_START_BYTE_PATTERN.sub(" ", modified_text)
-  modified_text = FF_PATTERN.sub("", modified_text)
-  modified_text = HTTP_PATTERN.sub("", modified_text)
-  modified_text = NON_24_DATE_PATTERN.sub("", modified_text)
+def find_stale_fields(parsed_document: ParsedDocument, fields: list[str]) -> list[str]:
+  field_versions = parsed_document.field_versions or {}
 
-  return modified_text
+  return [
+    field
+    for field in fields
+    if field_versions.get(field) != FIELD_VERSIONS[field]
+  ]
+
+
+def make_budget(time_budget: Optional[float]) -> Optional[ParseBudget]:
+  if not time_budget:
+    return None
+
+  return ParseBudget(time_budget=time_budget, deadline=monotonic() + time_budget)
+
+
+def pause_budget(budget: Optional[ParseBudget]) -> None:
+  if budget and budget.paused_at is None:
+    budget.paused_at = monotonic()
+
+
+def resume_budget(budget: Optional[ParseBudget]) -> None:
+  if budget and budget.paused_at is not None:
+    budget.deadline += monotonic() - budget.paused_at
+    budget.paused_at = None
+
+
+def is_degraded(budget: Optional[ParseBudget], degradation: Degradation) -> bool:
+  if not budget:
+    return False
+
+  if degradation not in budget.degradations:
+    if get_remaining_time(budget) / budget.time_budget >= DEGRADATIONS_BUDGET_SHARES[degradation]:
+      return False
+
+    degrade(budget, degradation)
+
+  return True
+
+
+def degrade(budget: ParseBudget, degradation: Degradation) -> None:
+  budget.degradations.add(degradation)
+  metrics.increment(f'parser.degradations.{degradation.name}')
+
+
+def get_remaining_time(budget: Optional[ParseBudget]) -> Optional[float]:
+  if not budget:
+    return None
+
+  return max(budget.deadline - monotonic(), 0)
+
+
+def find_degraded_fields(
+    budget: Optional[ParseBudget],
+    fields: list[str],
+    forced_qa_fields: set[QaField],
+) -> list[str]:
+  if not budget:
+    return []
+
+  skipped_stages = {
+    DEGRADATIONS_STAGES[degradation]
+    for degradation in budget.degradations
+    if DEGRADATIONS_STAGES[degradation] != ParseStage.Qa
+  }
+
+  return [
+    field
+    for field in fields
+    if skipped_stages.intersection(FIELDS_STAGES[field])
+    or forced_qa_fields.intersection(FIELDS_QA_FIELDS.get(field, []))
+  ]
+
+
+def bulk_get_parsed_documents(dirname: str, src_dirname: Optional[str] = None) -> dict[str, ParsedDocument]:
+  src_paths = {m_path.id: m_path.path for m_path in fm.get_parsed_paths(src_dirname, '*.*')} if src_dirname else {}
+
+  return {
+    stored_json.id: parsed_document_from_dict(
+      stored_json.content,
+      document=read_normalized_document(src_paths[stored_json.id]) if stored_json.id in src_paths else None,
+    )
+    for stored_json in fm.bulk_get_jsons(dirname, sorting=True, nonempty=True)
+  }
+
+
+def parsed_document_from_dict(data: dict, document: Optional[str] = None) -> ParsedDocument:
+  sections = document_sections_from_dict(data['document_sections']) if data.get('document_sections') else None
+  parties_info = data.get('case_parties_info')
+  commission = data.get('court_commission')
+
+  return ParsedDocument(
+    document_sections=resolve_document_sections(document, sections) if sections and document else sections,
+    document_issue_date=data.get('document_issue_date'),
+    document_regulatory_framework=data.get('document_regulatory_framework'),
+    document_decision_status=data.get('document_decision_status'),
+    case_form=data.get('case_form'),
+    case_parties_info=CasePartiesInfo(
+      total=parties_info['total'],
+      parties=[CaseParty(**party) for party in parties_info['parties']],
+    ) if parties_info else None,
+    court_commission=CourtCommission(**commission) if commission else None,
+    court_location=data.get('court_location'),
+    field_versions=data.get('field_versions'),
+    degraded_fields=data.get('degraded_fields'),
+  )
+
+
+def document_sections_from_dict(data: dict) -> DocumentSections | DocumentSpans:
+  if any(isinstance(value, list) for value in data.values()):
+    return document_spans_from_dict(data)
+
+  return DocumentSections(**data)
+
+
+def document_spans_from_dict(data: dict) -> DocumentSpans:
+  return DocumentSpans(**{
+    name: tuple(span) if span else None
+    for name, span in data.items()
+  })
+
+
+def resolve_document_sections(document: str, sections: DocumentSections | DocumentSpans) -> DocumentSections:
+  if isinstance(sections, DocumentSections):
+    return sections
+
+  return DocumentSections(
+    header=slice_span(document, sections.header),
+    ruling=slice_span(document, sections.ruling),
+    decision=slice_span(document, sections.decision),
+  )
 
 
 def logging(message: str):
-  return make_logging_decorator(log)(message)
+  return stage_logging(log, 'parser')(message)
 
 
 def log(message: str):
   print(f'Parser: {message}')
+
+
+def throw(message: str):
+  raise Exception(f'Parser: {message}')
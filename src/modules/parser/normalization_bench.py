@@ -0,0 +1,107 @@
+import re
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable
+
+import src.modules.file_manager.file_manager as fm
+
+from src.modules.parser.helpers import normalize_text, normalize_chunks, log
+from src.modules.parser.constants import \
+  NORMALIZATION_BENCH_SAMPLE, \
+  NORMALIZATION_BENCH_SIZES, \
+  NORMALIZATION_BENCH_EDGE_CASES, \
+  NORMALIZATION_CHUNK_SIZE
+
+NBSP_PATTERN = re.compile(r'\xA0')
+UTF_START_BYTE_PATTERN = re.compile(r'\xd0')
+FF_PATTERN = re.compile(r'\f')
+HTTP_PATTERN = re.compile(r'https?://\S+')
+NON_24_DATE_PATTERN = re.compile(r'\b\d+/\d+/\d+, \d+:\d+ [AP]M\b')
+
+
+def benchmark_normalization(documents: list[str]) -> None:
+  check_edge_cases(NORMALIZATION_BENCH_EDGE_CASES)
+
+  for document in documents:
+    expected, multipass_secs = with_duration(normalize_text_multipass, document)
+    normalized, normalized_secs = with_duration(normalize_text, document)
+    streamed, streamed_secs = with_duration(normalize_streamed, document)
+
+    if normalized != expected or streamed != expected:
+      throw_mismatch(len(document))
+
+    log(
+      f'{round(len(document) / 1024 ** 2, 2)} MB: '
+      f'multipass {to_ms(multipass_secs)} ms, '
+      f'table-driven {to_ms(normalized_secs)} ms, '
+      f'streamed {to_ms(streamed_secs)} ms'
+    )
+
+
+def check_edge_cases(cases: list[str]) -> None:
+  for case in cases:
+    if normalize_text(case) != normalize_text_multipass(case) or normalize_streamed(case) != normalize_text_multipass(case):
+      throw_mismatch(len(case))
+
+
+def normalize_text_multipass(text: str) -> str:
+  modified_text = purify_text(text)
+  modified_text = modified_text.replace('м.', 'місто ')
+  modified_text = modified_text.replace('ст.', 'стаття ')
+  modified_text = modified_text.replace('ч.', 'частина ')
+  modified_text = modified_text.replace('п.', 'пункт ')
+
+  return modified_text
+
+
+def purify_text(text: str) -> str:
+  modified_text = NBSP_PATTERN.sub(" ", text)
+  modified_text = UTF_START_BYTE_PATTERN.sub(" ", modified_text)
+  modified_text = FF_PATTERN.sub("", modified_text)
+  modified_text = HTTP_PATTERN.sub("", modified_text)
+  modified_text = NON_24_DATE_PATTERN.sub("", modified_text)
+
+  return modified_text
+
+
+def normalize_streamed(document: str) -> str:
+  chunks = (
+    document[start:start + NORMALIZATION_CHUNK_SIZE]
+    for start in range(0, len(document), NORMALIZATION_CHUNK_SIZE)
+  )
+
+  return ''.join(normalize_chunks(chunks))
+
+
+def make_sample_documents(sizes: list[int]) -> list[str]:
+  return [
+    NORMALIZATION_BENCH_SAMPLE * (size // len(NORMALIZATION_BENCH_SAMPLE) + 1)
+    for size in sizes
+  ]
+
+
+def with_duration(func: Callable[[str], str], document: str) -> tuple[str, float]:
+  start_time = perf_counter()
+  result = func(document)
+
+  return result, perf_counter() - start_time
+
+
+def to_ms(seconds: float) -> float:
+  return round(seconds * 1000, 1)
+
+
+def throw_mismatch(size: int):
+  raise Exception(f'Parser: normalization output differs from multipass on {size} chars document')
+
+
+if __name__ == '__main__':
+  arg_parser = ArgumentParser(description='Compare table-driven text normalization against the multipass one.')
+  arg_parser.add_argument('paths', nargs='*')
+  args = arg_parser.parse_args()
+
+  benchmark_normalization(
+    [fm.read_file(path) for path in args.paths]
+    if args.paths
+    else make_sample_documents(NORMALIZATION_BENCH_SIZES)
+  )
@@ -1,140 +1,473 @@
 import re
-from dataclasses import asdict
-from typing import Optional, Pattern, Match
+from dataclasses import asdict, replace
+from typing import Any, Callable, Optional
 
 import src.modules.file_manager.file_manager as fm
 import src.modules.udpipe_client.udpipe_client as uc
 import src.modules.udpipe_client.helpers as uch
 import src.modules.regexs.helpers as reh
+import src.modules.regexs.scanner as rsc
 
+from src.modules.udpipe_client.typedefs import Sentence
 from src.modules.bert_qa.bert_qa import BertQaModelClient
+from src.modules.bert_qa.typedefs import QaQuery, QaBackend
+from src.modules.bert_qa.constants import DEF_QA_BACKEND
+from src.modules.bert_qa.answers_cache import AnswersCache
+from src.modules.parse_cache.parse_cache import ParseCache
+from src.modules.file_manager.shards import ShardWriter
 from src.modules.parser.decorators import WithSectionContext
-from src.modules.parser.helpers import logging, normalize_text
-
+from src.modules.parser.helpers import \
+  logging, resolve_stages, narrow_context, find_stale_fields, \
+  read_normalized_document, iterate_normalized_chunks, is_streamed_document, \
+  make_budget, is_degraded, degrade, get_remaining_time, find_degraded_fields
+from src.modules.parser.segmenter import segment_document, segment_chunks, collect_chunks, slice_span, nonempty_span
+from src.modules.parser.rules import answer_by_rules
+from src.modules.parser.stats import QaFieldsStats
+from src.modules.parser.artifacts import ArtifactStore
+from src.modules.metrics.metrics import registry as metrics
+from src.modules.tracing.tracing import tracer
+
+from src.modules.regexs.typedefs import KeywordFamily
 from src.modules.regexs.constants import \
   REG_FRAMEWORK_PATTERN, \
   CASE_FORM_MARKERS, \
-  UDP_GENDER_PATTERN, \
-  DECISION_STATUS_PATTERN, \
-  JUDGE_PATTERN, PROSECUTOR_PATTERN, CLERK_PATTERN
+  UDP_GENDER_PATTERN
 
 from src.modules.parser.typedefs import \
   ParsedDocument, \
   CourtCommission, \
   CasePartiesInfo, CaseParty, \
-  DocumentSections, DocumentSectionType, FindOption
+  DocumentSections, DocumentSpans, DocumentSectionType, QaField, QaFieldOutcome, ParseStage, ParseContext, Span, \
+  ParseBudget, Degradation
 
 from src.modules.parser.constants import \
-  DOCUMENT_PATH, \
-  PROCESSED_DOCUMENT_PATH, \
-  DOCUMENT_SENTENCES_PATH, \
+  LOCAL_STORE_PATH, \
+  DOCUMENT_FILENAME, \
+  PROCESSED_DOCUMENT_FILENAME, \
+  DOCUMENT_SENTENCES_FILENAME, \
   NO_OCCUR_IN_TEXT, \
+  FIELDS_STAGES, \
+  FIELD_VERSIONS, \
+  FIELDS_QA_FIELDS, \
+  QA_QUESTIONS, \
+  QA_CUE_PATTERNS, \
+  QA_FIELDS_GUARDS, \
+  RULE_CONFIDENCE_THRESH, \
   CASE_DECISION_STATUS, \
   SEX
 
 
 class Parser:
-  def __init__(self) -> None:
-    self.document = ''
-    self.src_path: Optional[str] = None
-    self.dst_path: Optional[str] = None
-    self.temp_context: Optional[str] = None
-    self.document_sections: Optional[DocumentSections] = None
-    self.parsed_document: Optional[ParsedDocument] = None
-
-    self.__init_qa_model_client()
+  def __init__(
+      self,
+      store_path: str = LOCAL_STORE_PATH,
+      debug: bool = False,
+      cache: Optional[ParseCache] = None,
+      fields: Optional[set[str]] = None,
+      answers_cache: Optional[AnswersCache] = None,
+      sink: Optional[ShardWriter] = None,
+      qa_backend: QaBackend = DEF_QA_BACKEND,
+      artifacts: Optional[ArtifactStore] = None,
+      time_budget: Optional[float] = None,
+      section_spans: bool = False,
+      udp_locally: bool = False,
+  ) -> None:
+    self.debug = debug
+    self.udp_locally = udp_locally
+    self.section_spans = section_spans
+    self.time_budget = time_budget
+    self.artifacts = artifacts
+    self.qa_backend = qa_backend
+    self.sink = sink
+    self.cache = cache
+    self.answers_cache = answers_cache
+    self.fields = [field for field in FIELDS_STAGES if not fields or field in fields]
+    self.stages = resolve_stages(list(fields) if fields else self.fields)
+    self.document_path = f'{store_path}/{DOCUMENT_FILENAME}'
+    self.processed_document_path = f'{store_path}/{PROCESSED_DOCUMENT_FILENAME}'
+    self.document_sentences_path = f'{store_path}/{DOCUMENT_SENTENCES_FILENAME}'
+    self.qa_client: Optional[BertQaModelClient] = None
+    self.qa_fields_stats = QaFieldsStats()
+
+    if self.debug:
+      fm.make_dir(store_path)
+
+    if ParseStage.Qa in self.stages:
+      self.__init_qa_model_client()
 
   def __call__(self, src_path: str, dst_path: str) -> None:
-    self.src_path = src_path
-    self.dst_path = dst_path
-
-    self.__commit_document()
-    self.qa_client.reset_context(context=self.document)
-
-    self.__process_with_udp()
-    self.__parse()
-    self.__commit_parsed_document()
-
-  def __parse(self) -> None:
-    self.parsed_document = ParsedDocument(
-      document_sections=self.find_document_sections(),
-      document_issue_date=self.find_document_issue_date(),
-      document_regulatory_framework=self.find_document_regulatory_framework(),
-      document_decision_status=self.find_document_decision_status(),
-      case_form=self.find_case_form(),
-      case_parties_info=self.find_case_parties_info(),
-      court_commission=self.find_court_commission(),
-      court_location=self.find_court_location(),
+    with tracer.trace('parse_document', {'document.path': src_path}):
+      budget = self.make_budget()
+      document, spans = self.load_document(src_path)
+      parsed_document = self.restore(document)
+
+      if not parsed_document:
+        context = self.scan(document, self.process_with_udp(document, budget=budget), budget=budget, spans=spans)
+        parsed_document = self.extract(self.ask_questions(context))
+
+      self.commit(parsed_document, dst_path)
+
+  def read_document(self, src_path: str) -> str:
+    return self.load_document(src_path)[0]
+
+  @logging('reading document...')
+  def load_document(self, src_path: str) -> tuple[str, Optional[DocumentSpans]]:
+    if is_streamed_document(src_path):
+      chunks: list[str] = []
+      spans = segment_chunks(collect_chunks(iterate_normalized_chunks(src_path), chunks))
+      document = ''.join(chunks)
+    else:
+      document, spans = read_normalized_document(src_path), None
+
+    if self.debug:
+      fm.write_to_file(path=self.document_path, content=document)
+
+    return document, spans
+
+  def restore(self, document: str) -> Optional[ParsedDocument]:
+    if not self.cache:
+      return None
+
+    parsed_document = self.cache.get(document, self.fields, self.qa_backend, self.section_spans)
+    metrics.increment('parser.cache.hits' if parsed_document else 'parser.cache.misses')
+
+    return parsed_document
+
+  def make_budget(self) -> Optional[ParseBudget]:
+    return make_budget(self.time_budget)
+
+  @logging('processing with UDPipe, mapping to sentences...')
+  def process_with_udp(
+      self,
+      document: str,
+      fields: Optional[list[str]] = None,
+      budget: Optional[ParseBudget] = None,
+  ) -> Optional[list[Sentence]]:
+    if ParseStage.Udp not in (resolve_stages(fields) if fields else self.stages):
+      return None
+
+    if is_degraded(budget, Degradation.NoUdp):
+      return None
+
+    if self.artifacts:
+      stored_sentences = self.artifacts.get_sentences(document)
+
+      if stored_sentences is not None:
+        return stored_sentences
+
+    processed_document = uc.process_content(
+      content=document,
+      locally=self.udp_locally,
+      timeout=get_remaining_time(budget),
+    )
+
+    if processed_document is None:
+      degrade(budget, Degradation.NoUdp)
+      return None
+
+    raw_udp_result = uch.get_udp_result(processed_document)
+
+    sentences = uc.make_sentences_from_udp_result(raw_udp_result)
+
+    if self.debug:
+      self.__commit_udp_artifacts(processed_document, sentences)
+
+    if self.artifacts:
+      self.artifacts.put_sentences(document, sentences)
+
+    return sentences
+
+  @logging('parsing document...')
+  def parse(
+      self,
+      document: str,
+      sentences: Optional[list[Sentence]],
+      fields: Optional[list[str]] = None,
+      budget: Optional[ParseBudget] = None,
+  ) -> ParsedDocument:
+    return self.extract(self.ask_questions(self.scan(document, sentences, fields, budget)))
+
+  @logging('reparsing stale fields...')
+  def reparse(self, document: str, parsed_document: ParsedDocument) -> ParsedDocument:
+    stale_fields = find_stale_fields(parsed_document, self.fields)
+
+    if not stale_fields:
+      return parsed_document
+
+    reparsed_document = self.parse(document, self.process_with_udp(document, stale_fields), stale_fields)
+    degraded_fields = [
+      *[field for field in parsed_document.degraded_fields or [] if field not in stale_fields],
+      *(reparsed_document.degraded_fields or []),
+    ]
+
+    return replace(
+      parsed_document,
+      **{field: getattr(reparsed_document, field) for field in stale_fields},
+      field_versions={**(parsed_document.field_versions or {}), **reparsed_document.field_versions},
+      degraded_fields=degraded_fields or None,
+    )
+
+  @logging('scanning document...')
+  def scan(
+      self,
+      document: str,
+      sentences: Optional[list[Sentence]],
+      fields: Optional[list[str]] = None,
+      budget: Optional[ParseBudget] = None,
+      spans: Optional[DocumentSpans] = None,
+  ) -> ParseContext:
+    context = ParseContext(
+      document=document,
+      fields=fields or self.fields,
+      stages=resolve_stages(fields) if fields else self.stages,
+      budget=budget,
+      document_spans=spans,
+      sentences=sentences or [],
+      features_by_word=uch.index_features_by_word(sentences or []),
+    )
+
+    if ParseStage.Keywords in context.stages:
+      self.__scan_keywords(context)
+
+    if ParseStage.Sections in context.stages:
+      self.find_document_spans(context)
+
+    return context
+
+  def ask_questions(self, context: ParseContext) -> ParseContext:
+    if ParseStage.Qa in context.stages:
+      self.__ask_questions(context)
+
+    return context
+
+  def extract(self, context: ParseContext) -> ParsedDocument:
+    field_extractors = {
+      'document_sections': lambda: self.find_document_sections(context),
+      'document_issue_date': lambda: self.find_document_issue_date(context),
+      'document_regulatory_framework': lambda: self.find_document_regulatory_framework(context),
+      'document_decision_status': lambda: self.find_document_decision_status(context),
+      'case_form': lambda: self.find_case_form(context),
+      'case_parties_info': lambda: self.find_case_parties_info(context),
+      'court_commission': lambda: self.find_court_commission(context),
+      'court_location': lambda: self.find_court_location(context),
+    }
+
+    degraded_fields = find_degraded_fields(context.budget, context.fields, context.forced_qa_fields)
+    parsed_document = ParsedDocument(
+      **{
+        field: self.__extract_field(field, field_extractors[field])
+        for field in context.fields
+      },
+      field_versions={
+        field: FIELD_VERSIONS[field]
+        for field in context.fields
+        if field not in degraded_fields
+      },
+      degraded_fields=degraded_fields or None,
+    )
+
+    if degraded_fields:
+      metrics.increment('parser.degraded_documents')
+    elif self.cache:
+      self.cache.put(context.document, context.fields, parsed_document, self.qa_backend, self.section_spans)
+
+    return parsed_document
+
+  def __extract_field(self, field: str, extractor: Callable[[], Any]) -> Any:
+    with tracer.span(f'parser.extract.{field}'):
+      return extractor()
+
+  @logging('committing parsed document...')
+  def commit(self, parsed_document: ParsedDocument, dst_path: str) -> None:
+    if self.sink:
+      self.sink.write(fm.get_file_id(dst_path), asdict(parsed_document))
+      return
+
+    fm.write_to_json(
+      path=dst_path,
+      data=asdict(parsed_document),
     )
 
   @logging('parsing document sections...')
-  def find_document_sections(self) -> DocumentSections:
-    self.document_sections = DocumentSections(
-      header=self.find_case_header(),
-      ruling=self.find_case_ruling(),
-      decision=self.find_case_decision(),
+  def find_document_spans(self, context: ParseContext) -> DocumentSpans:
+    if context.document_spans:
+      return context.document_spans
+
+    context.document_spans = self.artifacts and self.artifacts.get_spans(context.document)
+
+    if not context.document_spans:
+      context.document_spans = segment_document(context.document)
+
+      if self.artifacts:
+        self.artifacts.put_spans(context.document, context.document_spans)
+
+    return context.document_spans
+
+  def find_document_sections(self, context: ParseContext) -> DocumentSections | DocumentSpans:
+    if self.section_spans:
+      return DocumentSpans(
+        header=nonempty_span(context.document_spans.header),
+        ruling=nonempty_span(context.document_spans.ruling),
+        decision=nonempty_span(context.document_spans.decision),
+      )
+
+    return DocumentSections(
+      header=self.find_case_header(context),
+      ruling=self.find_case_ruling(context),
+      decision=self.find_case_decision(context),
+    )
+
+  @logging('scanning keywords...')
+  def __scan_keywords(self, context: ParseContext) -> None:
+    context.keywords = rsc.scan_keywords(context.document)
+
+  @logging('asking QA model questions...')
+  def __ask_questions(self, context: ParseContext) -> None:
+    header = self.get_section(context, section_type=DocumentSectionType.Header)
+    qa_context = header or context.document
+    is_regex_only = is_degraded(context.budget, Degradation.RegexOnly)
+    fields = [
+      qa_field
+      for field in context.fields
+      for qa_field in FIELDS_QA_FIELDS.get(field, [])
+      if self.__passes_guards(context, qa_field)
+      and not self.__answer_by_rules(
+        context,
+        qa_context,
+        qa_field,
+        thresh=0 if is_regex_only else RULE_CONFIDENCE_THRESH,
+      )
+    ]
+
+    if is_regex_only or (not header and is_degraded(context.budget, Degradation.HeaderOnlyQa)):
+      context.answers.update({field: None for field in fields})
+      context.forced_qa_fields.update(fields)
+      return
+
+    narrowed_contexts = {
+      field: narrow_context(qa_context, QA_CUE_PATTERNS[field])
+      for field in fields
+      if field in QA_CUE_PATTERNS
+    }
+
+    answers = self.__ask_many(fields, [
+      QaQuery(question=QA_QUESTIONS[field], context=narrowed_contexts.get(field) or qa_context)
+      for field in fields
+    ])
+
+    context.answers.update(zip(fields, answers))
+
+    fallback_fields = [
+      field
+      for field in fields
+      if context.answers[field] is None and narrowed_contexts.get(field)
+    ]
+
+    if is_degraded(context.budget, Degradation.RegexOnly):
+      context.forced_qa_fields.update(fallback_fields)
+      return
+
+    fallback_answers = self.__ask_many(fallback_fields, [
+      QaQuery(question=QA_QUESTIONS[field], context=qa_context)
+      for field in fallback_fields
+    ])
+
+    context.answers.update(zip(fallback_fields, fallback_answers))
+
+  def __ask_many(self, fields: list[QaField], queries: list[QaQuery]) -> list[Optional[str]]:
+    if not queries:
+      return []
+
+    with tracer.span('parser.qa.ask_many', {'qa.fields': [field.name for field in fields]}):
+      return self.qa_client.ask_many(queries)
+
+  def __passes_guards(self, context: ParseContext, field: QaField) -> bool:
+    is_passed = all(
+      rsc.has_hits(context.keywords, guard.family, self.get_section_scope_span(context, guard.section_type))
+      for guard in QA_FIELDS_GUARDS[field]
     )
 
-    return self.document_sections
+    if not is_passed:
+      context.answers[field] = None
+      self.qa_fields_stats.record(field, QaFieldOutcome.Skipped)
+      metrics.increment(f'parser.guards.{field.name}.skipped')
+
+    return is_passed
+
+  def __answer_by_rules(self, context: ParseContext, qa_context: str, field: QaField, thresh: float) -> bool:
+    rule_answer = answer_by_rules(qa_context, field)
+    is_hit = bool(rule_answer) and rule_answer.confidence >= thresh
+
+    self.qa_fields_stats.record(field, QaFieldOutcome.RuleHit if is_hit else QaFieldOutcome.RuleMiss)
+    metrics.increment(f'parser.fast_path.{field.name}.{"hits" if is_hit else "misses"}')
+
+    if is_hit:
+      context.answers[field] = rule_answer.answer
+      context.confidences[field] = rule_answer.confidence
+
+    return is_hit
 
   @logging('parsing document issue date...')
-  @WithSectionContext(section_type=DocumentSectionType.Header)
-  def find_document_issue_date(self) -> Optional[str]:
-    return self.qa_client.ask('Перша дата після іменем України?')
+  def find_document_issue_date(self, context: ParseContext) -> Optional[str]:
+    return context.answers[QaField.IssueDate]
 
   @logging('parsing regulatory framework...')
-  def find_document_regulatory_framework(self) -> list[str]:
-    matches_iter = re.finditer(REG_FRAMEWORK_PATTERN, self.document)
+  def find_document_regulatory_framework(self, context: ParseContext) -> list[str]:
+    matches_iter = re.finditer(REG_FRAMEWORK_PATTERN, context.document)
     framework = [match.group() for match in matches_iter]
 
     return framework
 
   @logging('parsing document decision status...')
   @WithSectionContext(section_type=DocumentSectionType.Decision)
-  def find_document_decision_status(self) -> Optional[str]:
+  def find_document_decision_status(self, context: ParseContext) -> Optional[str]:
     return self.__only_if_occur_in_section(
-      find_option=DECISION_STATUS_PATTERN,
-      result=self.__define_case_decision_status(),
+      context,
+      family=KeywordFamily.DecisionStatus,
+      result=self.__define_case_decision_status(context),
     )
 
   @logging('parsing case form...')
-  @WithSectionContext(section_type=DocumentSectionType.Header)
-  def find_case_form(self) -> Optional[str]:
-    for case_form_id, case_form_pattern in enumerate(reh.make_case_form_patterns()):
-      if self.__search_in_document(case_form_pattern):
-        return CASE_FORM_MARKERS[case_form_id]
+  def find_case_form(self, context: ParseContext) -> Optional[str]:
+    occurring_markers = {
+      hit.marker
+      for hit in rsc.find_hits(context.keywords, KeywordFamily.CaseForm)
+    }
+
+    for case_form_marker in CASE_FORM_MARKERS:
+      if case_form_marker in occurring_markers:
+        return case_form_marker
 
   @logging('parsing parties info...')
-  def find_case_parties_info(self) -> CasePartiesInfo:
-    total = self.find_case_parties_total()
-    parties = self.find_case_parties(total)
+  def find_case_parties_info(self, context: ParseContext) -> CasePartiesInfo:
+    total = self.find_case_parties_total(context)
+    parties = self.find_case_parties(context, total)
 
     return CasePartiesInfo(total, parties)
 
   @logging('parsing court commission...')
   @WithSectionContext(section_type=DocumentSectionType.Header)
-  def find_court_commission(self) -> CourtCommission:
+  def find_court_commission(self, context: ParseContext) -> CourtCommission:
     return CourtCommission(
-      judge=self.find_court_judge(),
-      prosecutor=self.find_court_prosecutor(),
-      clerk=self.find_court_clerk(),
+      judge=self.find_court_judge(context),
+      prosecutor=self.find_court_prosecutor(context),
+      clerk=self.find_court_clerk(context),
     )
 
   @logging('parsing court location...')
-  @WithSectionContext(section_type=DocumentSectionType.Header)
-  def find_court_location(self) -> Optional[str]:
-    return self.qa_client.ask('Де розташований суд?')
+  def find_court_location(self, context: ParseContext) -> Optional[str]:
+    return context.answers[QaField.Location]
 
-  def find_case_parties_total(self) -> int:
-    matches = re.findall(r'ОСОБА_\d+', self.document)
+  def find_case_parties_total(self, context: ParseContext) -> int:
+    matches = re.findall(r'ОСОБА_\d+', context.document)
     count = len(set(matches))
 
     return count
 
-  def find_case_parties(self, count: int) -> list[CaseParty]:
+  def find_case_parties(self, context: ParseContext, count: int) -> list[CaseParty]:
     case_parties: list[CaseParty] = []
 
-    case_parties_with_assumed_genders = self.__assume_case_parties_genders(count)
+    case_parties_with_assumed_genders = self.__assume_case_parties_genders(context, count)
 
     for party_name, assumed_genders in case_parties_with_assumed_genders.items():
       sex = Parser.defined_major_sex(sexes=assumed_genders)
@@ -143,23 +476,20 @@ class Parser:
 
     return case_parties
 
-  def __assume_case_parties_genders(self, count: int) -> dict[str, list[str]]:
+  def __assume_case_parties_genders(self, context: ParseContext, count: int) -> dict[str, list[str]]:
     case_parties_with_assumed_genders = dict()
 
     for party_id in range(1, count + 1):
       party_name_to_find = f'ОСОБА_{party_id}'
       assumed_genders = []
 
-      for sentence in self.sentences:
-        if party_name_to_find in sentence.sentence:
-          for member in sentence.data:
-            if member.word == party_name_to_find:
-              assumed_gender_match = re.search(UDP_GENDER_PATTERN, member.features)
+      for features in context.features_by_word.get(party_name_to_find, []):
+        assumed_gender_match = re.search(UDP_GENDER_PATTERN, features)
 
-              if assumed_gender_match:
-                assumed_gender = assumed_gender_match.group()
+        if assumed_gender_match:
+          assumed_gender = assumed_gender_match.group()
 
-                assumed_genders.append(assumed_gender)
+          assumed_genders.append(assumed_gender)
 
       case_parties_with_assumed_genders[party_name_to_find] = assumed_genders
 
@@ -179,127 +509,93 @@ class Parser:
 
     return sex
 
-  def find_case_ruling(self) -> Optional[str]:
-    return self.__find_by_pattern(reh.make_case_ruling_pattern())
+  def find_case_ruling(self, context: ParseContext) -> Optional[str]:
+    return slice_span(context.document, context.document_spans.ruling)
+
+  def find_case_decision(self, context: ParseContext) -> Optional[str]:
+    return slice_span(context.document, context.document_spans.decision)
 
-  def find_case_decision(self) -> Optional[str]:
-    return self.__find_by_pattern(reh.make_case_decision_pattern())
+  def find_case_header(self, context: ParseContext) -> Optional[str]:
+    return slice_span(context.document, context.document_spans.header)
 
-  def find_case_header(self) -> Optional[str]:
-    return self.__find_by_pattern(reh.make_case_header_pattern())
+  def __define_case_decision_status(self, context: ParseContext) -> Optional[str]:
+    occurring_texts = {
+      hit.text
+      for hit in rsc.find_hits(context.keywords, KeywordFamily.DecisionStatus, context.section_span)
+    }
 
-  def __define_case_decision_status(self) -> Optional[str]:
-    if CASE_DECISION_STATUS['SATISFIED'] in self.temp_context:
+    if CASE_DECISION_STATUS['SATISFIED'] in occurring_texts:
       return CASE_DECISION_STATUS['SATISFIED']
 
-    if CASE_DECISION_STATUS['REJECTED'] in self.temp_context:
+    if CASE_DECISION_STATUS['REJECTED'] in occurring_texts:
       return CASE_DECISION_STATUS['REJECTED']
 
     return None
 
-  def find_court_judge(self) -> Optional[str]:
+  def find_court_judge(self, context: ParseContext) -> Optional[str]:
     return self.__only_if_occur_in_section(
-      find_option=JUDGE_PATTERN,
-      result=reh.only_if_fullname(self.qa_client.ask('ПІБ головуючого судді?'))
+      context,
+      family=KeywordFamily.Judge,
+      result=reh.only_if_fullname(context.answers[QaField.Judge])
     )
 
-  def find_court_prosecutor(self) -> Optional[str]:
+  def find_court_prosecutor(self, context: ParseContext) -> Optional[str]:
     return self.__only_if_occur_in_section(
-      find_option=PROSECUTOR_PATTERN,
-      result=reh.only_if_fullname(self.qa_client.ask('ПІБ прокурора?'))
+      context,
+      family=KeywordFamily.Prosecutor,
+      result=reh.only_if_fullname(context.answers[QaField.Prosecutor])
     )
 
-  def find_court_clerk(self) -> Optional[str]:
+  def find_court_clerk(self, context: ParseContext) -> Optional[str]:
     return self.__only_if_occur_in_section(
-      find_option=CLERK_PATTERN,
-      result=reh.only_if_fullname(self.qa_client.ask('ПІБ секретаря?'))
+      context,
+      family=KeywordFamily.Clerk,
+      result=reh.only_if_fullname(context.answers[QaField.Clerk])
     )
 
-  def get_section(self, section_type: DocumentSectionType) -> Optional[str]:
+  def get_section(self, context: ParseContext, section_type: DocumentSectionType) -> Optional[str]:
+    return slice_span(context.document, self.get_section_span(context, section_type=section_type))
+
+  def get_section_span(self, context: ParseContext, section_type: DocumentSectionType) -> Optional[Span]:
     if section_type == DocumentSectionType.Header:
-      return self.document_sections.header
+      return context.document_spans.header
 
     if section_type == DocumentSectionType.Ruling:
-      return self.document_sections.ruling
+      return context.document_spans.ruling
+
+    return context.document_spans.decision
+
+  def get_section_scope_span(self, context: ParseContext, section_type: DocumentSectionType) -> Span:
+    if self.get_section(context, section_type=section_type):
+      return self.get_section_span(context, section_type=section_type)
 
-    return self.document_sections.decision
+    return 0, len(context.document)
 
   def __only_if_occur_in_section(
       self,
-      find_option: FindOption,
+      context: ParseContext,
+      family: KeywordFamily,
       result: Optional[str],
   ) -> Optional[str]:
-    assert self.temp_context
+    assert context.section_context
 
-    if not self.__has_occurrence(find_option):
+    if not rsc.has_hits(context.keywords, family, context.section_span):
       return NO_OCCUR_IN_TEXT
 
     return result
 
-  def __has_occurrence(self, find_option: FindOption) -> bool:
-    if isinstance(find_option, Pattern):
-      return bool(self.__search_in_temp_context(find_option))
-
-    return find_option in self.temp_context
-
-  def __find_by_pattern(self, pattern: Pattern[str]) -> Optional[str]:
-    match = self.__search_in_document(pattern)
-
-    if not match:
-      return None
-
-    desc_sorted_groups = sorted(
-      match.groups(),
-      key=lambda group: len(group) if group else 0,
-      reverse=True,
-    )
-
-    desired_group = desc_sorted_groups[0]
-
-    return desired_group.strip()
-
-  def __search_in_document(self, pattern: Pattern) -> Match:
-    return re.search(pattern, self.document)
-
-  def __search_in_temp_context(self, pattern: Pattern) -> Match:
-    assert self.temp_context
-
-    return re.search(pattern, self.temp_context)
-
-  @logging('committing parsed document...')
-  def __commit_parsed_document(self):
-    assert self.parsed_document
-
-    fm.write_to_json(
-      path=self.dst_path,
-      data=asdict(self.parsed_document),
-    )
-
-  @logging('committing document...')
-  def __commit_document(self) -> None:
-    raw_document_content = fm.read_file(self.src_path)
-    normalized_document_content = normalize_text(raw_document_content)
-
-    fm.write_to_file(path=DOCUMENT_PATH, content=normalized_document_content)
-
-    self.document = normalized_document_content
-
   @logging('initializing QA model client...')
   def __init_qa_model_client(self) -> None:
-    self.qa_client = BertQaModelClient(context=self.document)
-
-  @logging('processing with UDPipe, mapping to sentences...')
-  def __process_with_udp(self) -> None:
-    uc.process(src_path=DOCUMENT_PATH, dst_path=PROCESSED_DOCUMENT_PATH, locally=False)
-
-    processed_document = fm.read_json(path=PROCESSED_DOCUMENT_PATH)
-    raw_udp_result = uch.get_udp_result(processed_document)
-
-    self.sentences = uc.make_sentences_from_udp_result(raw_udp_result)
+    self.qa_client = BertQaModelClient(
+      answers_cache=self.answers_cache,
+      backend=self.qa_backend,
+    )
 
+  def __commit_udp_artifacts(self, processed_document: dict, sentences: list[Sentence]) -> None:
     sentences_dict = [
       uch.sentence_to_dict(sentence)
-      for sentence in self.sentences
+      for sentence in sentences
     ]
 
-    fm.write_to_json(path=DOCUMENT_SENTENCES_PATH, data=sentences_dict)
+    fm.write_to_json(path=self.processed_document_path, data=processed_document)
+    fm.write_to_json(path=self.document_sentences_path, data=sentences_dict)
@@ -0,0 +1,150 @@
+import asyncio
+from asyncio import Queue
+from typing import Callable, Optional
+
+from src.modules.parser.parser import Parser
+from src.modules.parser.artifacts import ArtifactStore
+from src.modules.metrics.metrics import registry as metrics
+from src.modules.tracing.tracing import tracer
+from src.modules.parser.helpers import log, pause_budget, resume_budget
+from src.modules.parser.typedefs import ParseTask, PipelineItem, PipelineLimits
+from src.modules.parser.constants import DEF_PIPELINE_LIMITS
+
+
+def run_pipeline(
+    parser: Parser,
+    tasks: list[ParseTask],
+    limits: PipelineLimits = DEF_PIPELINE_LIMITS,
+    metrics_dirname: Optional[str] = None,
+    traces_dirname: Optional[str] = None,
+    artifacts_path: Optional[str] = None,
+) -> list[str]:
+  if artifacts_path:
+    parser.artifacts = ArtifactStore(path=artifacts_path)
+
+  if traces_dirname:
+    tracer.enable(traces_dirname)
+
+  if metrics_dirname:
+    metrics.enable()
+    metrics.start_periodic_export(metrics_dirname)
+
+  try:
+    return asyncio.run(stream_pipeline(parser, tasks, limits))
+  finally:
+    if metrics_dirname:
+      metrics.stop_periodic_export()
+      metrics.export(metrics_dirname)
+
+    tracer.disable()
+
+
+async def stream_pipeline(
+    parser: Parser,
+    tasks: list[ParseTask],
+    limits: PipelineLimits = DEF_PIPELINE_LIMITS,
+) -> list[str]:
+  read_queue, udp_queue, scan_queue, qa_queue, parse_queue, commit_queue = [
+    Queue(maxsize=limits.queue_size)
+    for _ in range(6)
+  ]
+  dst_paths: list[str] = []
+
+  def read(item: PipelineItem) -> PipelineItem:
+    item.budget = parser.make_budget()
+    item.document, item.spans = parser.load_document(item.task.src_path)
+    item.parsed_document = parser.restore(item.document)
+
+    return item
+
+  def process_with_udp(item: PipelineItem) -> PipelineItem:
+    if not item.parsed_document:
+      item.sentences = parser.process_with_udp(item.document, budget=item.budget)
+
+    return item
+
+  def scan(item: PipelineItem) -> PipelineItem:
+    if not item.parsed_document:
+      item.context = parser.scan(item.document, item.sentences, budget=item.budget, spans=item.spans)
+
+    return item
+
+  def ask_questions(item: PipelineItem) -> PipelineItem:
+    if not item.parsed_document:
+      item.context = parser.ask_questions(item.context)
+
+    return item
+
+  def parse(item: PipelineItem) -> PipelineItem:
+    if not item.parsed_document:
+      item.parsed_document = parser.extract(item.context)
+
+    return item
+
+  def commit(item: PipelineItem) -> PipelineItem:
+    parser.commit(item.parsed_document, item.task.dst_path)
+    dst_paths.append(item.task.dst_path)
+    tracer.end_trace(item.trace)
+
+    return item
+
+  await asyncio.gather(
+    feed(tasks, read_queue),
+    run_stage(read, read_queue, udp_queue, limits.read_concurrency),
+    run_stage(process_with_udp, udp_queue, scan_queue, limits.udp_concurrency),
+    run_stage(scan, scan_queue, qa_queue, limits.scan_concurrency),
+    run_stage(ask_questions, qa_queue, parse_queue, limits.qa_concurrency),
+    run_stage(parse, parse_queue, commit_queue, limits.parse_concurrency),
+    run_stage(commit, commit_queue, None, limits.commit_concurrency),
+  )
+
+  log(f'fast path hit rates: {parser.qa_fields_stats.hit_rates()}')
+  log(f'skipped QA producer calls: {parser.qa_fields_stats.skipped_counts()}')
+
+  return dst_paths
+
+
+async def feed(tasks: list[ParseTask], queue: Queue) -> None:
+  for task in tasks:
+    await queue.put(PipelineItem(
+      task=task,
+      trace=tracer.start_trace('parse_document', {'document.path': task.src_path}),
+    ))
+
+  await queue.put(None)
+
+
+async def run_stage(
+    handler: Callable[[PipelineItem], PipelineItem],
+    in_queue: Queue,
+    out_queue: Optional[Queue],
+    concurrency: int,
+) -> None:
+  def traced_handler(item: PipelineItem) -> PipelineItem:
+    resume_budget(item.budget)
+
+    try:
+      with tracer.activate(item.trace), tracer.span(f'pipeline.{handler.__name__}'):
+        return handler(item)
+    finally:
+      pause_budget(item.budget)
+
+  async def work() -> None:
+    while (item := await in_queue.get()) is not None:
+      try:
+        item = await asyncio.to_thread(traced_handler, item)
+      except Exception as error:
+        log(f'failed to parse {item.task.src_path}, {error}')
+        metrics.increment(f'pipeline.{handler.__name__}.failures')
+        tracer.end_trace(item.trace, str(error))
+        continue
+
+      if out_queue:
+        await out_queue.put(item)
+
+    await in_queue.put(None)
+
+  await asyncio.gather(*[work() for _ in range(concurrency)])
+
+  if out_queue:
+    await out_queue.put(None)
@@ -0,0 +1,100 @@
+from argparse import ArgumentParser
+from typing import Optional
+
+import src.modules.file_manager.file_manager as fm
+
+from src.modules.parser.parser import Parser
+from src.modules.parser.artifacts import ArtifactStore
+from src.modules.parse_cache.parse_cache import ParseCache
+from src.modules.file_manager.shards import ShardWriter
+from src.modules.parser.helpers import log, parsed_document_from_dict, find_stale_fields
+from src.modules.parser.typedefs import ParsedDocument
+from src.modules.parser.constants import LOCAL_STORE_PATH, ARTIFACTS_PATH, FIELDS_STAGES
+from src.modules.file_manager.constants import SHARD_INDEX_FILE_MARKER
+
+
+def reparse_documents(
+    src_dirname: str,
+    dst_dirname: str,
+    stale_only: bool = True,
+    artifacts_path: str = ARTIFACTS_PATH,
+    cache_path: Optional[str] = None,
+) -> int:
+  src_paths = {m_path.id: m_path.path for m_path in fm.get_parsed_paths(src_dirname, '*.*')}
+  stored_documents = {
+    stored_json.id: parsed_document_from_dict(stored_json.content)
+    for stored_json in fm.bulk_get_jsons(dst_dirname, sorting=True, nonempty=True)
+    if stored_json.id in src_paths
+  }
+  sharded = bool(fm.get_paths(dst_dirname, f'*{SHARD_INDEX_FILE_MARKER}'))
+  stale_fields = {
+    field
+    for stored_document in stored_documents.values()
+    for field in find_stale_fields(stored_document, list(FIELDS_STAGES))
+  } if stale_only else None
+
+  if stale_only and not stale_fields:
+    log(f'reparsed 0 of {len(stored_documents)} documents')
+    return 0
+
+  parser = Parser(
+    store_path=LOCAL_STORE_PATH,
+    fields=stale_fields,
+    cache=ParseCache(path=cache_path) if cache_path else None,
+    artifacts=ArtifactStore(path=artifacts_path),
+    sink=ShardWriter(dirname=dst_dirname, prefix='reparse') if sharded else None,
+  )
+
+  try:
+    reparsed_count = reparse_stored_documents(parser, stored_documents, src_paths, dst_dirname, stale_only)
+  finally:
+    if parser.sink:
+      parser.sink.close()
+
+  log(f'reparsed {reparsed_count} of {len(stored_documents)} documents')
+
+  return reparsed_count
+
+
+def reparse_stored_documents(
+    parser: Parser,
+    stored_documents: dict[str, ParsedDocument],
+    src_paths: dict[str, str],
+    dst_dirname: str,
+    stale_only: bool,
+) -> int:
+  reparsed_count = 0
+
+  for document_id, stored_document in stored_documents.items():
+    if stale_only and not find_stale_fields(stored_document, parser.fields):
+      continue
+
+    document = parser.read_document(src_paths[document_id])
+    reparsed_document = (
+      parser.reparse(document, stored_document)
+      if stale_only
+      else parser.parse(document, parser.process_with_udp(document))
+    )
+
+    parser.commit(reparsed_document, f'{dst_dirname}/{document_id}.json')
+    reparsed_count += 1
+
+  return reparsed_count
+
+
+if __name__ == '__main__':
+  arg_parser = ArgumentParser(description='Recompute parsed documents fields, reusing stored sections and sentences.')
+  arg_parser.add_argument('src_dirname')
+  arg_parser.add_argument('dst_dirname')
+  arg_parser.add_argument('--stale-only', action='store_true')
+  arg_parser.add_argument('--artifacts-path', default=ARTIFACTS_PATH)
+  arg_parser.add_argument('--cache-path')
+  args = arg_parser.parse_args()
+
+  reparse_documents(
+    src_dirname=args.src_dirname,
+    dst_dirname=args.dst_dirname,
+    stale_only=args.stale_only,
+    artifacts_path=args.artifacts_path,
+    cache_path=args.cache_path,
+  )
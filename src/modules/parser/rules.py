@@ -0,0 +1,81 @@
+import re
+from typing import Optional, Pattern
+
+import src.modules.regexs.helpers as reh
+
+from src.modules.parser.typedefs import QaField, RuleAnswer
+from src.modules.regexs.constants import \
+  JUDGE_MARKER, \
+  PROSECUTOR_MARKER, \
+  CLERK_MARKER, \
+  IN_THE_NAME_OF_UKRAINE_MARKER
+
+from src.modules.parser.constants import \
+  ANCHORED_RULE_CONFIDENCE, \
+  QUALIFIED_RULE_CONFIDENCE, \
+  LOOSE_RULE_CONFIDENCE, \
+  ISSUE_DATE_ANCHOR_WINDOW
+
+ISSUE_DATE_ANCHOR_PATTERN = re.compile(IN_THE_NAME_OF_UKRAINE_MARKER, re.IGNORECASE)
+ISSUE_DATE_PATTERN = reh.make_date_labeled_pattern()
+CITY_PATTERN = reh.make_city_pattern()
+FULLNAME_PATTERNS = {
+  QaField.Judge: reh.make_labeled_fullname_pattern(JUDGE_MARKER),
+  QaField.Prosecutor: reh.make_labeled_fullname_pattern(PROSECUTOR_MARKER),
+  QaField.Clerk: reh.make_labeled_fullname_pattern(CLERK_MARKER),
+}
+
+
+def answer_by_rules(context: str, field: QaField) -> Optional[RuleAnswer]:
+  if field == QaField.IssueDate:
+    return find_issue_date(context)
+
+  if field == QaField.Location:
+    return find_location(context)
+
+  return find_labeled_fullname(context, FULLNAME_PATTERNS[field])
+
+
+def find_issue_date(context: str) -> Optional[RuleAnswer]:
+  anchor = ISSUE_DATE_ANCHOR_PATTERN.search(context)
+  since = anchor.end() if anchor else 0
+  match = ISSUE_DATE_PATTERN.search(context, since)
+
+  if not match:
+    return None
+
+  is_anchored = anchor and match.start() - since <= ISSUE_DATE_ANCHOR_WINDOW
+
+  return RuleAnswer(
+    answer=match.group().strip(),
+    confidence=ANCHORED_RULE_CONFIDENCE if is_anchored else LOOSE_RULE_CONFIDENCE,
+  )
+
+
+def find_labeled_fullname(context: str, pattern: Pattern[str]) -> Optional[RuleAnswer]:
+  match = pattern.search(context)
+
+  if not match:
+    return None
+
+  return RuleAnswer(
+    answer=match.group('name'),
+    confidence=QUALIFIED_RULE_CONFIDENCE if match.group('qualifiers') else ANCHORED_RULE_CONFIDENCE,
+  )
+
+
+def find_location(context: str) -> Optional[RuleAnswer]:
+  matches = list(CITY_PATTERN.finditer(context))
+  dated_match = next((match for match in matches if match.group('dated')), None)
+
+  if dated_match:
+    return RuleAnswer(answer=collapse_spaces(dated_match.group('city')), confidence=ANCHORED_RULE_CONFIDENCE)
+
+  if matches:
+    return RuleAnswer(answer=collapse_spaces(matches[0].group('city')), confidence=LOOSE_RULE_CONFIDENCE)
+
+  return None
+
+
+def collapse_spaces(text: str) -> str:
+  return ' '.join(text.split())
@@ -0,0 +1,269 @@
+import re
+from typing import Optional, Match, Iterable, Iterator
+
+import src.modules.regexs.helpers as reh
+
+from src.modules.regexs.typedefs import SectionMarkerType
+from src.modules.parser.typedefs import DocumentSpans, SectionMarker, Span
+from src.modules.parser.constants import SECTION_MARKER_MAX_CHARS
+
+SECTION_MARKERS_PATTERN = reh.make_section_markers_pattern()
+CONTENT_PATTERN = re.compile(r'\S')
+
+RULING_START_MARKER_TYPES = [SectionMarkerType.Established, SectionMarkerType.Resolved]
+
+
+class SectionMarkersScanner:
+  def __init__(self) -> None:
+    self.markers: list[SectionMarker] = []
+    self.awaiting_markers: list[SectionMarker] = []
+    self.first_content_start: Optional[int] = None
+    self.content_end = 0
+
+  def scan(self, window: str, offset: int, frontier: int) -> None:
+    for match in SECTION_MARKERS_PATTERN.finditer(window):
+      if match.start() >= frontier:
+        break
+
+      marker = make_section_marker(match, offset)
+      marker.content_before_end = self.__find_content_end(window, offset, match.start())
+      self.markers.append(marker)
+
+      if marker.colon_end is not None:
+        self.awaiting_markers.append(marker)
+
+    self.__resolve_content_starts(window, offset)
+    self.content_end = self.__find_content_end(window, offset, frontier)
+
+  def finish(self, length: int) -> None:
+    for marker in self.awaiting_markers:
+      marker.content_after_start = length
+
+    self.awaiting_markers = []
+
+    if self.first_content_start is None:
+      self.first_content_start = length
+
+  def __resolve_content_starts(self, window: str, offset: int) -> None:
+    if self.first_content_start is None:
+      self.first_content_start = find_content_start(window, offset, offset)
+
+    for marker in self.awaiting_markers:
+      marker.content_after_start = find_content_start(window, offset, marker.colon_end)
+
+    self.awaiting_markers = [marker for marker in self.awaiting_markers if marker.content_after_start is None]
+
+  def __find_content_end(self, window: str, offset: int, end: int) -> int:
+    index = end - 1
+
+    while index >= 0 and window[index].isspace():
+      index -= 1
+
+    return offset + index + 1 if index >= 0 else self.content_end
+
+
+def segment_document(document: str) -> DocumentSpans:
+  scanner = SectionMarkersScanner()
+  scanner.scan(document, 0, len(document))
+  scanner.finish(len(document))
+
+  return make_document_spans(scanner)
+
+
+def segment_chunks(chunks: Iterable[str]) -> DocumentSpans:
+  scanner = SectionMarkersScanner()
+  window = ''
+  offset = 0
+
+  for chunk in chunks:
+    window += chunk
+    frontier = find_markers_frontier(window)
+
+    if not frontier:
+      continue
+
+    scanner.scan(window, offset, frontier)
+    window = window[frontier:]
+    offset += frontier
+
+  scanner.scan(window, offset, len(window))
+  scanner.finish(offset + len(window))
+
+  return make_document_spans(scanner)
+
+
+def collect_chunks(chunks: Iterable[str], parts: list[str]) -> Iterator[str]:
+  for chunk in chunks:
+    parts.append(chunk)
+
+    yield chunk
+
+
+def find_markers_frontier(window: str, count: int = SECTION_MARKER_MAX_CHARS + 1) -> int:
+  index = len(window)
+
+  for _ in range(count):
+    index -= 1
+
+    while index >= 0 and window[index].isspace():
+      index -= 1
+
+    if index < 0:
+      content = CONTENT_PATTERN.search(window)
+
+      return content.start() if content else len(window)
+
+  return index
+
+
+def find_content_start(window: str, offset: int, start: int) -> Optional[int]:
+  content = CONTENT_PATTERN.search(window, max(start - offset, 0))
+
+  return offset + content.start() if content else None
+
+
+def make_document_spans(scanner: SectionMarkersScanner) -> DocumentSpans:
+  return DocumentSpans(
+    header=find_header_span(scanner.markers, scanner.first_content_start),
+    ruling=find_ruling_span(scanner.markers),
+    decision=find_decision_span(scanner.markers),
+  )
+
+
+def make_section_marker(match: Match, offset: int = 0) -> SectionMarker:
+  marker_type = next(
+    marker_type
+    for marker_type in SectionMarkerType
+    if match.group(marker_type.value) is not None
+  )
+  name = marker_type.value
+
+  if marker_type == SectionMarkerType.Signed:
+    return SectionMarker(
+      type=marker_type,
+      span=shift_span(match.span(name), offset),
+      suffix_span=shift_span(match.span(name), offset),
+      colon_end=None,
+      suffix_content_end=match.end(name) + offset,
+    )
+
+  suffix_start = match.start(f'{name}_suffix') + offset
+
+  return SectionMarker(
+    type=marker_type,
+    span=shift_span(match.span(name), offset),
+    suffix_span=shift_span(match.span(f'{name}_suffix'), offset),
+    colon_end=match.end(f'{name}_colon') + offset if match.group(f'{name}_colon') else None,
+    suffix_content_end=suffix_start + len(match.group(f'{name}_suffix').rstrip()),
+  )
+
+
+def shift_span(span: Span, offset: int) -> Span:
+  return span[0] + offset, span[1] + offset
+
+
+def find_header_span(markers: list[SectionMarker], first_content_start: int) -> Optional[Span]:
+  established = find_first_marker(markers, [SectionMarkerType.Established], colon=False)
+
+  if established:
+    return longest_stripped_span([
+      make_gap_span(0, established.span[0], first_content_start, established.content_before_end),
+      make_suffix_span(established),
+    ])
+
+  resolved = find_first_marker(markers, [SectionMarkerType.Resolved], colon=True)
+
+  if resolved:
+    return longest_stripped_span([make_suffix_span(resolved)])
+
+  return None
+
+
+def find_ruling_span(markers: list[SectionMarker]) -> Optional[Span]:
+  start = find_first_marker(markers, RULING_START_MARKER_TYPES, colon=True)
+
+  if not start:
+    return None
+
+  end = find_first_marker(markers, [SectionMarkerType.Decided], colon=True, since=start.colon_end)
+
+  if not end:
+    return None
+
+  return longest_stripped_span([
+    make_marker_span(start),
+    make_suffix_span(start),
+    make_gap_span(start.colon_end, end.span[0], start.content_after_start, end.content_before_end),
+    make_marker_span(end),
+    make_suffix_span(end),
+  ])
+
+
+def find_decision_span(markers: list[SectionMarker]) -> Optional[Span]:
+  start = find_first_marker(markers, [SectionMarkerType.Decided], colon=True)
+
+  if not start:
+    return None
+
+  end = find_first_marker(markers, [SectionMarkerType.Signed], colon=False, since=start.colon_end)
+
+  if not end:
+    return None
+
+  return longest_stripped_span([
+    make_marker_span(start),
+    make_suffix_span(start),
+    make_gap_span(start.colon_end, end.span[0], start.content_after_start, end.content_before_end),
+  ])
+
+
+def find_first_marker(
+    markers: list[SectionMarker],
+    types: list[SectionMarkerType],
+    colon: bool,
+    since: int = 0,
+) -> Optional[SectionMarker]:
+  for marker in markers:
+    if marker.span[0] < since or marker.type not in types:
+      continue
+
+    if colon and marker.colon_end is None:
+      continue
+
+    return marker
+
+  return None
+
+
+def make_marker_span(marker: SectionMarker) -> tuple[Span, Span]:
+  return marker.span, (marker.span[0], marker.suffix_content_end)
+
+
+def make_suffix_span(marker: SectionMarker) -> tuple[Span, Span]:
+  return marker.suffix_span, (marker.suffix_span[0], marker.suffix_content_end)
+
+
+def make_gap_span(start: int, end: int, content_start: int, content_end: int) -> tuple[Span, Span]:
+  stripped_start = min(content_start, end)
+
+  return (start, end), (stripped_start, max(content_end, stripped_start))
+
+
+def longest_stripped_span(spans: list[tuple[Span, Span]]) -> Span:
+  desc_sorted_spans = sorted(spans, key=lambda span: span[0][1] - span[0][0], reverse=True)
+
+  return desc_sorted_spans[0][1]
+
+
+def nonempty_span(span: Optional[Span]) -> Optional[Span]:
+  if span is None or span[0] == span[1]:
+    return None
+
+  return span
+
+
+def slice_span(document: str, span: Optional[Span]) -> Optional[str]:
+  if span is None:
+    return None
+
+  return document[span[0]:span[1]]
@@ -0,0 +1,136 @@
+import re
+import random
+from re import Pattern
+from argparse import ArgumentParser
+from typing import Optional
+
+import src.modules.file_manager.file_manager as fm
+
+from src.modules.parser.segmenter import segment_document, segment_chunks, slice_span
+from src.modules.parser.helpers import log
+from src.modules.parser.typedefs import DocumentSpans
+from src.modules.regexs.constants import \
+  CASE_RULING_START_MARKERS, \
+  CASE_DECISION_START_MARKERS, \
+  CASE_DECISION_END_MARKER
+from src.modules.parser.constants import \
+  SEGMENTER_CHECK_DOCUMENTS, \
+  SEGMENTER_CHECK_SEED, \
+  SEGMENTER_CHECK_FILLERS, \
+  SEGMENTER_CHECK_CHUNK_SIZE
+
+
+def check_segmenter(documents: list[str]) -> None:
+  legacy_patterns = make_legacy_patterns()
+
+  for document in documents:
+    expected = [find_by_legacy_pattern(pattern, document) for pattern in legacy_patterns]
+    actual = slice_document_spans(document, segment_document(document))
+    streamed = slice_document_spans(document, segment_chunks(split_document(document)))
+
+    if actual != expected or streamed != expected:
+      throw_mismatch(document)
+
+  log(f'segmenter matches the legacy section patterns on {len(documents)} documents')
+
+
+def slice_document_spans(document: str, spans: DocumentSpans) -> list[Optional[str]]:
+  return [
+    slice_span(document, spans.header),
+    slice_span(document, spans.ruling),
+    slice_span(document, spans.decision),
+  ]
+
+
+def split_document(document: str, size: int = SEGMENTER_CHECK_CHUNK_SIZE) -> list[str]:
+  return [document[start:start + size] for start in range(0, len(document), size)]
+
+
+def find_by_legacy_pattern(pattern: Pattern[str], document: str) -> Optional[str]:
+  match = pattern.search(document)
+
+  if not match:
+    return None
+
+  desc_sorted_groups = sorted(
+    match.groups(),
+    key=lambda group: len(group) if group else 0,
+    reverse=True,
+  )
+
+  return desc_sorted_groups[0].strip()
+
+
+def make_legacy_patterns() -> list[Pattern[str]]:
+  ruling_start_regex = make_legacy_markers_regex(CASE_RULING_START_MARKERS)
+  decision_start_regex = make_legacy_markers_regex(CASE_DECISION_START_MARKERS)
+  decision_end_regex = r'\s*'.join([char for char in CASE_DECISION_END_MARKER])
+
+  return [
+    re.compile(
+      r'^(.*?)' + ruling_start_regex + r'\s*:',
+      re.IGNORECASE | re.DOTALL,
+    ),
+    re.compile(
+      r'(' + ruling_start_regex + r')\s*:(.*?)(' + decision_start_regex + r')\s*:',
+      re.IGNORECASE | re.DOTALL,
+    ),
+    re.compile(
+      r'(' + decision_start_regex + r')\s*:(.*?)' + decision_end_regex + r'\s*:?',
+      re.IGNORECASE | re.DOTALL,
+    ),
+  ]
+
+
+def make_legacy_markers_regex(markers: list[str]) -> str:
+  return r'|'.join([
+    r'\s*'.join([char for char in marker]) + r'\s*(в\s*|л\s*а)'
+    for marker in markers
+  ])
+
+
+def make_random_documents(count: int, seed: int) -> list[str]:
+  rng = random.Random(seed)
+  markers = [
+    *CASE_RULING_START_MARKERS,
+    *CASE_DECISION_START_MARKERS,
+    CASE_DECISION_END_MARKER,
+  ]
+
+  return [
+    ''.join([
+      rng.choice([
+        rng.choice(SEGMENTER_CHECK_FILLERS),
+        make_random_marker(rng, rng.choice(markers)),
+      ])
+      for _ in range(rng.randint(0, 12))
+    ])
+    for _ in range(count)
+  ]
+
+
+def make_random_marker(rng: random.Random, marker: str) -> str:
+  spaced_marker = ''.join([
+    char.upper() if rng.random() < 0.5 else char
+    for char in rng.choice([marker, ' '.join(marker)])
+  ])
+
+  return spaced_marker + rng.choice(['в', 'ла', 'л а', ' в', '']) + rng.choice([':', ' :', '', ' '])
+
+
+def throw_mismatch(document: str):
+  raise Exception(f'Parser: segmenter output differs from the legacy section patterns on {document!r}')
+
+
+if __name__ == '__main__':
+  arg_parser = ArgumentParser(description='Check the section segmenter against the legacy lazy section patterns.')
+  arg_parser.add_argument('paths', nargs='*')
+  arg_parser.add_argument('--documents', type=int, default=SEGMENTER_CHECK_DOCUMENTS)
+  arg_parser.add_argument('--seed', type=int, default=SEGMENTER_CHECK_SEED)
+  args = arg_parser.parse_args()
+
+  check_segmenter(
+    [fm.read_file(path) for path in args.paths]
+    if args.paths
+    else make_random_documents(args.documents, args.seed)
+  )
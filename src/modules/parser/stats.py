@@ -0,0 +1,33 @@
+import threading
+
+from src.modules.parser.typedefs import QaField, QaFieldOutcome
+
+
+class QaFieldsStats:
+  def __init__(self) -> None:
+    self.lock = threading.Lock()
+    self.counts: dict[QaField, dict[QaFieldOutcome, int]] = {}
+
+  def record(self, field: QaField, outcome: QaFieldOutcome) -> None:
+    with self.lock:
+      field_counts = self.counts.setdefault(field, {})
+      field_counts[outcome] = field_counts.get(outcome, 0) + 1
+
+  def hit_rates(self) -> dict[str, float]:
+    with self.lock:
+      return {
+        field.name: round(
+          field_counts.get(QaFieldOutcome.RuleHit, 0)
+          / (field_counts.get(QaFieldOutcome.RuleHit, 0) + field_counts.get(QaFieldOutcome.RuleMiss, 0)),
+          3,
+        )
+        for field, field_counts in self.counts.items()
+        if QaFieldOutcome.RuleHit in field_counts or QaFieldOutcome.RuleMiss in field_counts
+      }
+
+  def skipped_counts(self) -> dict[str, int]:
+    with self.lock:
+      return {
+        field.name: field_counts.get(QaFieldOutcome.Skipped, 0)
+        for field, field_counts in self.counts.items()
+      }
@@ -1,8 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Pattern
 
+from src.modules.regexs.typedefs import SectionMarkerType, KeywordFamily, KeywordIndex
+from src.modules.udpipe_client.typedefs import Sentence
+from src.modules.tracing.typedefs import TraceSpan
+
 FindOption = Pattern or str
+Span = tuple[int, int]
 
 
 class DocumentSectionType(Enum):
@@ -11,6 +16,39 @@ class DocumentSectionType(Enum):
   Decision = 3
 
 
+class ParseStage(Enum):
+  Sections = 1
+  Keywords = 2
+  Udp = 3
+  Qa = 4
+
+
+class Degradation(Enum):
+  NoUdp = 1
+  HeaderOnlyQa = 2
+  RegexOnly = 3
+
+
+class QaField(Enum):
+  IssueDate = 1
+  Judge = 2
+  Prosecutor = 3
+  Clerk = 4
+  Location = 5
+
+
+class QaFieldOutcome(Enum):
+  Skipped = 1
+  RuleHit = 2
+  RuleMiss = 3
+
+
+@dataclass
+class FieldGuard:
+  family: KeywordFamily
+  section_type: DocumentSectionType
+
+
 @dataclass
 class CourtCommission:
   judge: Optional[str]
@@ -37,16 +75,97 @@ class DocumentSections:
   decision: Optional[str]
 
 
+@dataclass
+class DocumentSpans:
+  header: Optional[Span]
+  ruling: Optional[Span]
+  decision: Optional[Span]
+
+
+@dataclass
+class SectionMarker:
+  type: SectionMarkerType
+  span: Span
+  suffix_span: Span
+  colon_end: Optional[int]
+  suffix_content_end: int
+  content_before_end: int = 0
+  content_after_start: Optional[int] = None
+
+
 @dataclass
 class ParsedDocument:
-  document_sections: DocumentSections
-  document_issue_date: Optional[str]
-  document_regulatory_framework: list[str]
+  document_sections: Optional[DocumentSections | DocumentSpans] = None
+  document_issue_date: Optional[str] = None
+  document_regulatory_framework: Optional[list[str]] = None
+
+  case_form: Optional[str] = None
+  case_parties_info: Optional[CasePartiesInfo] = None
 
-  case_form: Optional[str]
-  case_parties_info: CasePartiesInfo
+  court_commission: Optional[CourtCommission] = None
+  court_location: Optional[str] = None
 
-  court_commission: CourtCommission
-  court_location: Optional[str]
+  document_decision_status: Optional[str] = None
 
-  document_decision_status: Optional[str]
+  field_versions: Optional[dict[str, int]] = None
+  degraded_fields: Optional[list[str]] = None
+
+
+@dataclass
+class RuleAnswer:
+  answer: str
+  confidence: float
+
+
+@dataclass
+class ParseBudget:
+  time_budget: float
+  deadline: float
+  degradations: set[Degradation] = field(default_factory=set)
+  paused_at: Optional[float] = None
+
+
+@dataclass
+class ParseContext:
+  document: str
+  fields: list[str] = field(default_factory=list)
+  stages: set[ParseStage] = field(default_factory=set)
+  budget: Optional[ParseBudget] = None
+  sentences: list[Sentence] = field(default_factory=list)
+  features_by_word: dict[str, list[str]] = field(default_factory=dict)
+  keywords: Optional[KeywordIndex] = None
+  document_spans: Optional[DocumentSpans] = None
+  answers: dict[QaField, Optional[str]] = field(default_factory=dict)
+  confidences: dict[QaField, float] = field(default_factory=dict)
+  forced_qa_fields: set[QaField] = field(default_factory=set)
+  section_context: Optional[str] = None
+  section_span: Optional[Span] = None
+
+
+@dataclass
+class ParseTask:
+  src_path: str
+  dst_path: str
+
+
+@dataclass
+class PipelineLimits:
+  read_concurrency: int
+  udp_concurrency: int
+  scan_concurrency: int
+  qa_concurrency: int
+  parse_concurrency: int
+  commit_concurrency: int
+  queue_size: int
+
+
+@dataclass
+class PipelineItem:
+  task: ParseTask
+  document: Optional[str] = None
+  spans: Optional[DocumentSpans] = None
+  sentences: Optional[list[Sentence]] = None
+  budget: Optional[ParseBudget] = None
+  trace: Optional[TraceSpan] = None
+  context: Optional[ParseContext] = None
+  parsed_document: Optional[ParsedDocument] = None
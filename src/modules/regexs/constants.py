@@ -38,16 +38,42 @@ CASE_DECISION_START_MARKERS = [
 
 CASE_DECISION_END_MARKER = 'суддя'
 
-FULLNAME_PATTERN = re.compile(r'^[А-ЩЬЮЯІЇЄҐ][а-щьюяіїєґ\'’]+\s?[А-ЩЬЮЯІЇЄҐ]\.\s?[А-ЩЬЮЯІЇЄҐ]\.$')
+DECISION_STATUS_MARKERS = [
+  'задовольнити',
+  'відмовити',
+]
+
+JUDGE_MARKER = 'судд'
+PROSECUTOR_MARKER = 'прокурор'
+CLERK_MARKER = 'секретар'
+
+FULLNAME_REGEX = r'[А-ЩЬЮЯІЇЄҐ][а-щьюяіїєґ\'’]+\s?[А-ЩЬЮЯІЇЄҐ]\.\s?[А-ЩЬЮЯІЇЄҐ]\.'
+NAME_QUALIFIER_REGEX = r'[а-щьюяіїєґ\'’]+'
+CITY_NAME_REGEX = r'[А-ЩЬЮЯІЇЄҐ][а-щьюяіїєґ\'’-]+'
+IN_THE_NAME_OF_UKRAINE_MARKER = 'ІМЕНЕМ УКРАЇНИ'
+CITY_MARKER = 'місто'
+
+FULLNAME_PATTERN = re.compile(f'^{FULLNAME_REGEX}$')
 REG_FRAMEWORK_PATTERN = re.compile(r'(пункт|частина|стаття).*України', re.MULTILINE | re.IGNORECASE)
 UDP_GENDER_PATTERN = re.compile(r'(Neut|Masc|Fem)')
-DECISION_STATUS_PATTERN = re.compile(r'(задовольнити|відмовити)', re.IGNORECASE)
-PROSECUTOR_PATTERN = re.compile(r'прокурор', re.IGNORECASE)
-CLERK_PATTERN = re.compile(r'секретар', re.IGNORECASE)
-JUDGE_PATTERN = re.compile(r'судд', re.IGNORECASE)
-
-NBSP_PATTERN = re.compile(r'\xA0')
-UTF_START_BYTE_PATTERN = re.compile(r'\xd0')
-FF_PATTERN = re.compile(r'\f')
-HTTP_PATTERN = re.compile(r'https?://\S+')
-NON_24_DATE_PATTERN = re.compile(r'\b\d+/\d+/\d+, \d+:\d+ [AP]M\b')
+PROSECUTOR_PATTERN = re.compile(PROSECUTOR_MARKER, re.IGNORECASE)
+CLERK_PATTERN = re.compile(CLERK_MARKER, re.IGNORECASE)
+JUDGE_PATTERN = re.compile(JUDGE_MARKER, re.IGNORECASE)
+COURT_NAME_PATTERN = re.compile(r'\bсуд\b', re.IGNORECASE)
+MONTH_MARKERS_PATTERN = re.compile(r'|'.join(MONTH_MARKERS))
+
+NORMALIZATION_CHARS = {
+  '\xa0': ' ',
+  '\xd0': ' ',
+  '\f': '',
+}
+NORMALIZATION_REMOVAL_PATTERNS = [
+  re.compile(r'https?://\S+'),
+  re.compile(r'\b\d+/\d+/\d+, \d+:\d+ [AP]M\b'),
+]
+NORMALIZATION_ABBREVIATIONS = {
+  'м.': 'місто ',
+  'ст.': 'стаття ',
+  'ч.': 'частина ',
+  'п.': 'пункт ',
+}
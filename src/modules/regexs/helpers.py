@@ -2,11 +2,19 @@ import re
 from re import Pattern
 from typing import Optional
 
+from src.modules.regexs.typedefs import SectionMarkerType, Keyword, KeywordFamily
 from src.modules.regexs.constants import \
   FULLNAME_PATTERN, \
+  FULLNAME_REGEX, \
+  NAME_QUALIFIER_REGEX, \
+  CITY_NAME_REGEX, \
+  CITY_MARKER, \
+  MONTH_MARKERS_PATTERN, \
   CASE_RULING_START_MARKERS, \
   CASE_DECISION_START_MARKERS, \
   CASE_DECISION_END_MARKER, \
+  DECISION_STATUS_MARKERS, \
+  JUDGE_MARKER, PROSECUTOR_MARKER, CLERK_MARKER, \
   CASE_FORM_MARKERS, MONTH_MARKERS
 
 
@@ -18,7 +26,7 @@ def define_date_pattern(value: str) -> Pattern[str]:
 
 
 def does_month_marker_occur(value: str) -> bool:
-  return any(marker in value for marker in MONTH_MARKERS)
+  return bool(MONTH_MARKERS_PATTERN.search(value))
 
 
 def make_date_labeled_pattern() -> Pattern[str]:
@@ -29,77 +37,89 @@ def make_date_labeled_pattern() -> Pattern[str]:
   ), re.IGNORECASE)
 
 
-def make_date_digital_pattern() -> Pattern[str]:
-  return re.compile(r'(\d{2})\.(\d{2})\.(\d{4})')
+def make_labeled_fullname_pattern(marker: str) -> Pattern[str]:
+  return re.compile(
+    rf'(?i:{marker})[а-щьюяіїєґ]*[\s:,–-]+'
+    rf'(?P<qualifiers>(?:{NAME_QUALIFIER_REGEX}\s+){{0,2}})'
+    rf'(?P<name>{FULLNAME_REGEX})'
+  )
+
 
+def make_city_pattern() -> Pattern[str]:
+  return re.compile(rf'(?P<dated>року\s+)?(?P<city>{CITY_MARKER}\s+{CITY_NAME_REGEX})')
 
-def make_case_header_pattern() -> Pattern[str]:
-  return re.compile(make_case_header_regex(), re.IGNORECASE | re.DOTALL)
+
+def make_date_digital_pattern() -> Pattern[str]:
+  return re.compile(r'(\d{2})\.(\d{2})\.(\d{4})')
 
 
-def make_case_ruling_pattern() -> Pattern[str]:
-  return re.compile(make_case_ruling_regex(), re.IGNORECASE | re.DOTALL)
+def make_section_markers_pattern() -> Pattern[str]:
+  return re.compile(make_section_markers_regex(), re.IGNORECASE)
 
 
-def make_case_decision_pattern() -> Pattern[str]:
-  return re.compile(make_case_decision_regex(), re.IGNORECASE | re.DOTALL)
+def make_keywords_pattern(keywords: list[Keyword]) -> Pattern[str]:
+  return re.compile(make_keywords_regex(keywords))
 
 
-def make_case_form_patterns() -> list[Pattern[str]]:
+def make_keywords() -> list[Keyword]:
   return [
-    re.compile(make_case_form_regex(marker))
-    for marker in CASE_FORM_MARKERS
+    *[
+      Keyword(family=KeywordFamily.CaseForm, marker=marker, regex=make_case_form_regex(marker))
+      for marker in CASE_FORM_MARKERS
+    ],
+    *[
+      Keyword(family=KeywordFamily.Month, marker=marker, regex=re.escape(marker))
+      for marker in MONTH_MARKERS
+    ],
+    *[
+      Keyword(family=KeywordFamily.DecisionStatus, marker=marker, regex=make_ignorecase_regex(marker))
+      for marker in DECISION_STATUS_MARKERS
+    ],
+    Keyword(family=KeywordFamily.Judge, marker=JUDGE_MARKER, regex=make_ignorecase_regex(JUDGE_MARKER)),
+    Keyword(family=KeywordFamily.Prosecutor, marker=PROSECUTOR_MARKER, regex=make_ignorecase_regex(PROSECUTOR_MARKER)),
+    Keyword(family=KeywordFamily.Clerk, marker=CLERK_MARKER, regex=make_ignorecase_regex(CLERK_MARKER)),
   ]
 
 
-def make_case_header_regex() -> str:
-  end_regex = r'|'.join([
-    r'\s*'.join([char for char in marker]) + r'\s*(в\s*|л\s*а)'
-    for marker in CASE_RULING_START_MARKERS
-  ])
-
+def make_keywords_regex(keywords: list[Keyword]) -> str:
   return (
-      r'^(.*?)'
-      + end_regex
-      + r'\s*:'
+      r'(?='
+      + r'|'.join([f'({keyword.regex})' for keyword in keywords])
+      + r')'
   )
 
 
-def make_case_ruling_regex() -> str:
-  start_regex = r'|'.join([
-    r'\s*'.join([char for char in marker]) + r'\s*(в\s*|л\s*а)'
-    for marker in CASE_RULING_START_MARKERS
-  ])
+def make_ignorecase_regex(marker: str) -> str:
+  return f'(?i:{re.escape(marker)})'
 
-  end_regex = r'|'.join([
-    r'\s*'.join([char for char in marker]) + r'\s*(в\s*|л\s*а)'
-    for marker in CASE_DECISION_START_MARKERS
-  ])
 
+def make_section_markers_regex() -> str:
   return (
-      r'('
-      + start_regex
-      + r')\s*:(.*?)('
-      + end_regex
-      + r')\s*:'
+      r'(?='
+      + r'|'.join([
+        make_section_marker_regex(SectionMarkerType.Established, CASE_RULING_START_MARKERS[:1]),
+        make_section_marker_regex(SectionMarkerType.Resolved, CASE_RULING_START_MARKERS[1:]),
+        make_section_marker_regex(SectionMarkerType.Decided, CASE_DECISION_START_MARKERS),
+        rf'(?P<{SectionMarkerType.Signed.value}>' + make_spaced_regex(CASE_DECISION_END_MARKER) + r')',
+      ])
+      + r')'
   )
 
 
-def make_case_decision_regex() -> str:
-  regex_elements = [
-    r'\s*'.join([char for char in marker]) + r'\s*(в\s*|л\s*а)'
-    for marker in CASE_DECISION_START_MARKERS
-  ]
+def make_section_marker_regex(marker_type: SectionMarkerType, markers: list[str]) -> str:
+  name = marker_type.value
 
   return (
-      r'('
-      + r'|'.join(regex_elements)
-      + r')\s*:(.*?)'
-      + '\s*'.join([char for char in CASE_DECISION_END_MARKER])
-      + r'\s*:?'
+      rf'(?P<{name}>(?:'
+      + r'|'.join([make_spaced_regex(marker) for marker in markers])
+      + rf')\s*(?P<{name}_suffix>в\s*|л\s*а))(?P<{name}_colon>\s*:)?'
   )
 
 
+def make_spaced_regex(word: str) -> str:
+  return r'\s*'.join([char for char in word])
+
+
 def make_case_form_regex(lowercase_word: str) -> str:
   return r'\s*'.join([
     char.strip()
@@ -0,0 +1,47 @@
+from typing import Optional
+
+import src.modules.regexs.helpers as reh
+
+from src.modules.regexs.typedefs import KeywordFamily, KeywordHit, KeywordIndex
+
+KEYWORDS = reh.make_keywords()
+KEYWORDS_PATTERN = reh.make_keywords_pattern(KEYWORDS)
+
+
+def scan_keywords(text: str) -> KeywordIndex:
+  index: KeywordIndex = {family: [] for family in KeywordFamily}
+
+  for match in KEYWORDS_PATTERN.finditer(text):
+    keyword = KEYWORDS[match.lastindex - 1]
+    start, end = match.span(match.lastindex)
+
+    index[keyword.family].append(
+      KeywordHit(marker=keyword.marker, text=text[start:end], start=start, end=end)
+    )
+
+  return index
+
+
+def find_hits(
+    index: KeywordIndex,
+    family: KeywordFamily,
+    span: Optional[tuple[int, int]] = None,
+) -> list[KeywordHit]:
+  if span is None:
+    return index[family]
+
+  start, end = span
+
+  return [
+    hit
+    for hit in index[family]
+    if hit.start >= start and hit.end <= end
+  ]
+
+
+def has_hits(
+    index: KeywordIndex,
+    family: KeywordFamily,
+    span: Optional[tuple[int, int]] = None,
+) -> bool:
+  return bool(find_hits(index, family, span))
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class SectionMarkerType(Enum):
+  Established = 'established'
+  Resolved = 'resolved'
+  Decided = 'decided'
+  Signed = 'signed'
+
+
+class KeywordFamily(Enum):
+  CaseForm = 1
+  Month = 2
+  Judge = 3
+  Prosecutor = 4
+  Clerk = 5
+  DecisionStatus = 6
+
+
+@dataclass
+class Keyword:
+  family: KeywordFamily
+  marker: str
+  regex: str
+
+
+@dataclass
+class KeywordHit:
+  marker: str
+  text: str
+  start: int
+  end: int
+
+
+KeywordIndex = dict[KeywordFamily, list[KeywordHit]]
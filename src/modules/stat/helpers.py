@@ -1,3 +1,6 @@
+from src.modules.metrics.decorators import stage_logging
+
+
 def resolve_axes(freqs: list[dict]):
   return [
     [
@@ -14,3 +17,11 @@ def get_bg_range_on_ug(unigrams: list[str]):
 
 def get_ngram_range(use_bigrams: bool) -> (int, int):
   return (2, 2) if use_bigrams else (1, 1)
+
+
+def logging(message: str):
+  return stage_logging(log, 'stat')(message)
+
+
+def log(message: str) -> None:
+  print(f'Stat: {message}')
@@ -1,8 +1,6 @@
-import matplotlib.pyplot as plt
-
 from operator import itemgetter
-from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
-from wordcloud import WordCloud
+
+from src.utils.imports import lazy_import
 
 import src.modules.file_manager.file_manager as fm
 import src.modules.stat.lemmatizer.lemmatizer as lm
@@ -16,9 +14,14 @@ from src.modules.stat.constants import \
   UGTF_CLOUD_FILE, UGIDF_CLOUD_FILE, \
   UGTF_BARH_FILE, UGIDF_BARH_FILE, \
   BGIDF_BARH_FILE, BGTF_BARH_FILE
-from src.modules.stat.helpers import get_ngram_range, get_bg_range_on_ug, resolve_axes
+from src.modules.stat.helpers import get_ngram_range, get_bg_range_on_ug, resolve_axes, logging
+
+plt = lazy_import('matplotlib.pyplot')
+sklearn_text = lazy_import('sklearn.feature_extraction.text')
+wordcloud_lib = lazy_import('wordcloud')
 
 
+@logging('building charts...')
 def build_charts() -> None:
   (ug_tf, ug_idf, bg_tf, bg_idf) = evaluate()
   build_cloud(
@@ -59,6 +62,7 @@ def build_charts() -> None:
   )
 
 
+@logging('parsing and writing lemmas...')
 def parse_and_write_lemmas() -> None:
   jsons = fm.bulk_get_jsons(ANALYSIS_DATA_DIR_PATH, sorting=False, nonempty=True)
 
@@ -119,7 +123,7 @@ def build_cloud(
     savefig: str,
     reverse: bool,
 ) -> None:
-  wordcloud_inst = WordCloud(
+  wordcloud_inst = wordcloud_lib.WordCloud(
     width=1000,
     height=1000,
     background_color='white',
@@ -137,6 +141,7 @@ def build_cloud(
   plt.savefig(savefig)
 
 
+@logging('evaluating tf-idf...')
 def evaluate() -> TfIdf:
   records = fm.bulk_get_files_records(STATS_PAIRS_DATA_DIR_PATH, '*.txt')
 
@@ -171,7 +176,7 @@ def parse_list_to_bigrams(unigrams: list[str]) -> list[str]:
 
 def calculate_ngrams_idf(ngrams: list[str], use_bigrams: bool) -> dict:
   ngram_range = get_ngram_range(use_bigrams)
-  vectorizer = TfidfVectorizer(use_idf=True, ngram_range=ngram_range)
+  vectorizer = sklearn_text.TfidfVectorizer(use_idf=True, ngram_range=ngram_range)
 
   vectorizer.fit(ngrams)
   idf_values = vectorizer.idf_
@@ -183,7 +188,7 @@ def calculate_ngrams_idf(ngrams: list[str], use_bigrams: bool) -> dict:
 
 
 def calculate_ngrams_tf(ngrams: str, use_bigrams: bool) -> dict:
-  vectorizer = CountVectorizer(
+  vectorizer = sklearn_text.CountVectorizer(
     ngram_range=get_ngram_range(use_bigrams)
   )
 
@@ -0,0 +1,14 @@
+from src.constants.paths import TRACES_DATA_DIR_PATH
+
+DEF_TRACES_DIR_PATH = TRACES_DATA_DIR_PATH
+TRACES_FILE_PREFIX = 'spans-'
+TRACES_FILE_MARKER = '.jsonl'
+
+TRACE_ID_BYTES = 16
+SPAN_ID_BYTES = 8
+
+SPAN_KIND_INTERNAL = 'SPAN_KIND_INTERNAL'
+STATUS_CODE_OK = 'STATUS_CODE_OK'
+STATUS_CODE_ERROR = 'STATUS_CODE_ERROR'
+
+SLOWEST_TRACES_LIMIT = 10
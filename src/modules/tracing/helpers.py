@@ -0,0 +1,64 @@
+import os
+from typing import Any
+
+from src.modules.tracing.typedefs import TraceSpan
+
+from src.modules.tracing.constants import \
+  TRACE_ID_BYTES, \
+  SPAN_ID_BYTES, \
+  SPAN_KIND_INTERNAL, \
+  STATUS_CODE_OK, \
+  STATUS_CODE_ERROR
+
+
+def make_trace_id() -> str:
+  return os.urandom(TRACE_ID_BYTES).hex()
+
+
+def make_span_id() -> str:
+  return os.urandom(SPAN_ID_BYTES).hex()
+
+
+def to_otel_span(span: TraceSpan) -> dict:
+  return {
+    'traceId': span.trace_id,
+    'spanId': span.span_id,
+    'parentSpanId': span.parent_span_id or '',
+    'name': span.name,
+    'kind': SPAN_KIND_INTERNAL,
+    'startTimeUnixNano': str(span.start_time),
+    'endTimeUnixNano': str(span.end_time),
+    'attributes': [
+      {'key': key, 'value': to_otel_value(value)}
+      for key, value in span.attributes.items()
+    ],
+    'status': (
+      {'code': STATUS_CODE_ERROR, 'message': span.error}
+      if span.error
+      else {'code': STATUS_CODE_OK}
+    ),
+  }
+
+
+def to_otel_value(value: Any) -> dict:
+  if isinstance(value, bool):
+    return {'boolValue': value}
+
+  if isinstance(value, int):
+    return {'intValue': str(value)}
+
+  if isinstance(value, float):
+    return {'doubleValue': value}
+
+  if isinstance(value, (list, tuple)):
+    return {'arrayValue': {'values': [to_otel_value(item) for item in value]}}
+
+  return {'stringValue': str(value)}
+
+
+def get_span_duration_ms(otel_span: dict) -> float:
+  return (int(otel_span['endTimeUnixNano']) - int(otel_span['startTimeUnixNano'])) / 1e6
+
+
+def log(message: str):
+  print(f'Tracing: {message}')
@@ -0,0 +1,88 @@
+import json
+from argparse import ArgumentParser
+
+import src.modules.file_manager.file_manager as fm
+
+from src.modules.tracing.helpers import get_span_duration_ms, log
+from src.modules.tracing.constants import \
+  DEF_TRACES_DIR_PATH, \
+  TRACES_FILE_PREFIX, \
+  TRACES_FILE_MARKER, \
+  SLOWEST_TRACES_LIMIT
+
+
+def report_slowest_traces(dirname: str = DEF_TRACES_DIR_PATH, limit: int = SLOWEST_TRACES_LIMIT) -> None:
+  spans_by_trace = group_spans_by_trace(read_spans(dirname))
+  roots = [
+    span
+    for spans in spans_by_trace.values()
+    for span in spans
+    if not span['parentSpanId']
+  ]
+
+  for root in sorted(roots, key=get_span_duration_ms, reverse=True)[:limit]:
+    log(f'trace {root["traceId"]}, {format_attributes(root)}')
+
+    for line in format_span_tree(root, spans_by_trace[root['traceId']]):
+      log(line)
+
+
+def read_spans(dirname: str) -> list[dict]:
+  spans = []
+
+  for path in sorted(fm.get_paths(dirname, f'{TRACES_FILE_PREFIX}*{TRACES_FILE_MARKER}')):
+    with open(path, 'r', encoding='utf-8') as file:
+      spans.extend(json.loads(line) for line in file if line.strip())
+
+  return spans
+
+
+def group_spans_by_trace(spans: list[dict]) -> dict[str, list[dict]]:
+  spans_by_trace: dict[str, list[dict]] = {}
+
+  for span in spans:
+    spans_by_trace.setdefault(span['traceId'], []).append(span)
+
+  return spans_by_trace
+
+
+def format_span_tree(root: dict, spans: list[dict]) -> list[str]:
+  children_by_parent: dict[str, list[dict]] = {}
+
+  for span in spans:
+    children_by_parent.setdefault(span['parentSpanId'], []).append(span)
+
+  root_duration_ms = get_span_duration_ms(root) or 1
+  lines = []
+
+  def walk(span: dict, depth: int) -> None:
+    duration_ms = get_span_duration_ms(span)
+    status = ' [error]' if span['status'].get('message') else ''
+
+    lines.append(
+      f'{"  " * depth}{span["name"]}: {round(duration_ms, 1)} ms, '
+      f'{round(duration_ms / root_duration_ms * 100, 1)}%{status}'
+    )
+
+    for child in sorted(children_by_parent.get(span['spanId'], []), key=lambda child: int(child['startTimeUnixNano'])):
+      walk(child, depth + 1)
+
+  walk(root, 1)
+
+  return lines
+
+
+def format_attributes(span: dict) -> str:
+  return ', '.join(
+    f'{attribute["key"]}={next(iter(attribute["value"].values()))}'
+    for attribute in span['attributes']
+  )
+
+
+if __name__ == '__main__':
+  arg_parser = ArgumentParser(description='List the slowest document traces with their span breakdown.')
+  arg_parser.add_argument('dirname', nargs='?', default=DEF_TRACES_DIR_PATH)
+  arg_parser.add_argument('--limit', type=int, default=SLOWEST_TRACES_LIMIT)
+  args = arg_parser.parse_args()
+
+  report_slowest_traces(args.dirname, args.limit)
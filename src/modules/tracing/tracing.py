@@ -0,0 +1,120 @@
+import os
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import time_ns
+from typing import Any, Iterator, Optional, TextIO
+
+import src.modules.file_manager.file_manager as fm
+
+from src.modules.tracing.typedefs import TraceSpan
+from src.modules.tracing.helpers import make_trace_id, make_span_id, to_otel_span
+from src.modules.tracing.constants import DEF_TRACES_DIR_PATH, TRACES_FILE_PREFIX, TRACES_FILE_MARKER
+
+
+class Tracer:
+  def __init__(self) -> None:
+    self.lock = threading.Lock()
+    self.file: Optional[TextIO] = None
+    self.current_span: ContextVar[Optional[TraceSpan]] = ContextVar('current_span', default=None)
+
+  def enable(self, dirname: str = DEF_TRACES_DIR_PATH) -> None:
+    fm.make_dir(dirname)
+
+    with self.lock:
+      self.file = open(
+        f'{dirname}/{TRACES_FILE_PREFIX}{os.getpid()}{TRACES_FILE_MARKER}',
+        'a',
+        encoding='utf-8',
+      )
+
+  def disable(self) -> None:
+    with self.lock:
+      if self.file:
+        self.file.close()
+
+      self.file = None
+
+  def start_trace(self, name: str, attributes: Optional[dict[str, Any]] = None) -> Optional[TraceSpan]:
+    if not self.file:
+      return None
+
+    return TraceSpan(
+      trace_id=make_trace_id(),
+      span_id=make_span_id(),
+      parent_span_id=None,
+      name=name,
+      start_time=time_ns(),
+      attributes=attributes or {},
+    )
+
+  def end_trace(self, root: Optional[TraceSpan], error: Optional[str] = None) -> None:
+    if root:
+      root.error = error
+      self.__finish(root)
+
+  @contextmanager
+  def activate(self, root: Optional[TraceSpan]) -> Iterator[None]:
+    if not root:
+      yield
+      return
+
+    token = self.current_span.set(root)
+
+    try:
+      yield
+    finally:
+      self.current_span.reset(token)
+
+  @contextmanager
+  def trace(self, name: str, attributes: Optional[dict[str, Any]] = None) -> Iterator[Optional[TraceSpan]]:
+    root = self.start_trace(name, attributes)
+
+    try:
+      with self.activate(root):
+        yield root
+    except Exception as error:
+      self.end_trace(root, str(error))
+      raise
+
+    self.end_trace(root)
+
+  @contextmanager
+  def span(self, name: str, attributes: Optional[dict[str, Any]] = None) -> Iterator[Optional[TraceSpan]]:
+    parent = self.current_span.get()
+
+    if not self.file or not parent:
+      yield None
+      return
+
+    span = TraceSpan(
+      trace_id=parent.trace_id,
+      span_id=make_span_id(),
+      parent_span_id=parent.span_id,
+      name=name,
+      start_time=time_ns(),
+      attributes=attributes or {},
+    )
+    token = self.current_span.set(span)
+
+    try:
+      yield span
+    except Exception as error:
+      span.error = str(error)
+      raise
+    finally:
+      self.current_span.reset(token)
+      self.__finish(span)
+
+  def __finish(self, span: TraceSpan) -> None:
+    span.end_time = time_ns()
+    line = json.dumps(to_otel_span(span), ensure_ascii=False) + '\n'
+
+    with self.lock:
+      if self.file:
+        self.file.write(line)
+        self.file.flush()
+
+
+tracer = Tracer()
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass
+class TraceSpan:
+  trace_id: str
+  span_id: str
+  parent_span_id: Optional[str]
+  name: str
+  start_time: int
+  end_time: Optional[int] = None
+  attributes: dict[str, Any] = field(default_factory=dict)
+  error: Optional[str] = None
@@ -2,6 +2,7 @@ from json import JSONDecodeError
 from typing import Optional
 
 from src.utils.decorators import make_delayed_decorator
+from src.modules.metrics.decorators import stage_logging
 import src.modules.udpipe_client.script_runner.script_runner as sr
 
 from src.modules.udpipe_client.typedefs import Sentence, SentenceMember
@@ -39,6 +40,24 @@ def sentence_to_dict(sentence: Sentence) -> dict:
   return sentence_dict
 
 
+def sentence_from_dict(data: dict) -> Sentence:
+  return Sentence(
+    id=data['id'],
+    sentence=data['sentence'],
+    data=[SentenceMember(**member) for member in data['data']],
+  )
+
+
+def index_features_by_word(sentences: list[Sentence]) -> dict[str, list[str]]:
+  features_by_word: dict[str, list[str]] = {}
+
+  for sentence in sentences:
+    for member in sentence.data:
+      features_by_word.setdefault(member.word, []).append(member.features)
+
+  return features_by_word
+
+
 def map_semistruct_to_sentences(semistruct_records: list[list[str]]) -> list[Sentence]:
   sentences: list[Sentence] = []
 
@@ -131,6 +150,10 @@ def throw(message):
   raise Exception(format_message(message))
 
 
+def logging(message: str):
+  return stage_logging(log, 'udpipe_client')(message)
+
+
 def log(message: str):
   print(format_message(message))
 
@@ -1,10 +1,14 @@
 import os
+import threading
+from typing import Optional
 
 from src.modules.udpipe_client.typedefs import Sentence
 
 import src.modules.file_manager.file_manager as fm
 import src.modules.udpipe_client.script_runner.script_runner as sr
 
+from src.utils.imports import lazy_import
+
 from src.modules.udpipe_client.helpers import \
   filter_extra_comments, \
   sub_split_into_semistruct, \
@@ -13,13 +17,30 @@ from src.modules.udpipe_client.helpers import \
   is_process_request_succeeded, \
   is_udp_running, \
   delayed, \
+  logging, \
   throw, \
   log
 
 from src.modules.udpipe_client.constants import UDP_MODEL_NAME, START_UDP_SH_PATH, STOP_UDP_SH_PATH
 from src.constants.paths import TXT_DATA_DIR_PATH, ANALYSIS_DATA_DIR_PATH
 
+requests = lazy_import('requests')
+
+session_lock = threading.Lock()
+session = None
+
+
+def get_session():
+  global session
+
+  with session_lock:
+    if session is None:
+      session = requests.Session()
+
+  return session
 
+
+@logging('making sentences from result...')
 def make_sentences_from_udp_result(raw_udp_result: str) -> list[Sentence]:
   lines = raw_udp_result.split('\n')
   no_extra_comment_lines = filter_extra_comments(lines)
@@ -60,6 +81,7 @@ def stop():
   verify_stopped()
 
 
+@logging('processing file...')
 def process(src_path: str, dst_path: str, locally=False) -> None:
   exec_code = os.system(
     'curl --silent '
@@ -71,6 +93,27 @@ def process(src_path: str, dst_path: str, locally=False) -> None:
     throw('failed to run!')
 
 
+@logging('processing content...')
+def process_content(content: str, locally=False, timeout: Optional[float] = None) -> Optional[dict]:
+  try:
+    response = get_session().post(
+      url=define_parser(locally),
+      data={'model': UDP_MODEL_NAME, 'tokenizer': '', 'tagger': '', 'parser': ''},
+      files={'data': content.encode('utf-8')},
+      timeout=timeout,
+    )
+  except requests.Timeout:
+    log(f'timed out after {timeout} secs')
+    return None
+  except requests.RequestException:
+    throw('failed to run!')
+
+  if not response.ok:
+    throw(f'failed to run, status {response.status_code}')
+
+  return response.json()
+
+
 @delayed
 def verify_running():
   if not is_udp_running():
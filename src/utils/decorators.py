@@ -1,6 +1,7 @@
 import time as t
+from functools import wraps
 from time import time as curr_time
-from typing import Any
+from typing import Any, Callable, Optional
 
 
 def make_delayed_decorator(delay):
@@ -15,17 +16,23 @@ def make_delayed_decorator(delay):
   return delayed
 
 
-def make_logging_decorator(logger):
+def make_logging_decorator(
+    logger,
+    scope: str = '',
+    measure: Optional[Callable[[str, Callable], Callable]] = None,
+    is_debug: Callable[[], bool] = lambda: True,
+):
   def logging(message):
     def decorator(func):
-      def wrapper(*args, **kwargs):
-        logger(f'{message}')
-
-        fn_result, exec_time = with_time_estimate(func, *args, **kwargs)
+      name = f'{scope}.{func.__qualname__}' if scope else func.__qualname__
+      measured_func = measure(name, func) if measure else func
 
-        logger(f'[exec time — {exec_time} secs]')
+      @wraps(func)
+      def wrapper(*args, **kwargs):
+        if is_debug():
+          logger(f'{message}')
 
-        return fn_result
+        return measured_func(*args, **kwargs)
 
       return wrapper
 
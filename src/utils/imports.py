@@ -0,0 +1,19 @@
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Optional
+
+
+class LazyModule:
+  def __init__(self, name: str) -> None:
+    self.name = name
+    self.module: Optional[ModuleType] = None
+
+  def __getattr__(self, attr: str) -> Any:
+    if self.module is None:
+      self.module = import_module(self.name)
+
+    return getattr(self.module, attr)
+
+
+def lazy_import(name: str) -> LazyModule:
+  return LazyModule(name)
@@ -0,0 +1,63 @@
+import os
+from time import perf_counter
+
+import src.modules.file_manager.file_manager as fm
+
+from src.modules.file_manager.shards import ShardWriter, read_shard_record
+
+
+def write_records(dirname: str, count: int, compress: bool) -> None:
+  with ShardWriter(dirname=dirname, prefix='test', compress=compress) as writer:
+    for number in range(count):
+      writer.write(str(number), {'number': number, 'text': os.urandom(750).hex()})
+
+
+def measure_read(dirname: str) -> float:
+  start_time = perf_counter()
+  fm.bulk_get_jsons(dirname, sorting=False, nonempty=True)
+
+  return perf_counter() - start_time
+
+
+def test_gzip_shard_round_trip(tmp_path):
+  write_records(str(tmp_path), 100, compress=True)
+
+  jsons = fm.bulk_get_jsons(str(tmp_path), sorting=True, nonempty=True)
+
+  assert [json.id for json in jsons] == [str(number) for number in range(100)]
+  assert [json.content['number'] for json in jsons] == list(range(100))
+  assert read_shard_record(str(tmp_path), '42')['number'] == 42
+
+
+def test_latest_shard_record_wins(tmp_path):
+  with ShardWriter(dirname=str(tmp_path), prefix='test', compress=True) as writer:
+    writer.write('1', {'version': 1})
+
+  with ShardWriter(dirname=str(tmp_path), prefix='other', compress=True) as writer:
+    writer.write('1', {'version': 2})
+
+  assert [json.content for json in fm.bulk_get_jsons(str(tmp_path), sorting=True, nonempty=True)] == [{'version': 2}]
+  assert read_shard_record(str(tmp_path), '1') == {'version': 2}
+
+
+def test_shard_writer_rotates_full_shards(tmp_path):
+  with ShardWriter(dirname=str(tmp_path), prefix='test', max_bytes=4096) as writer:
+    for number in range(20):
+      writer.write(str(number), {'number': number, 'text': os.urandom(500).hex()})
+
+  shards_paths = fm.get_shards_paths(str(tmp_path))
+
+  assert len(shards_paths) > 1
+  assert all(fm.get_file_size(path) <= 4096 for path in shards_paths)
+  assert [read_shard_record(str(tmp_path), str(number))['number'] for number in range(20)] == list(range(20))
+
+
+def test_gzip_shard_read_scales_linearly(tmp_path):
+  small_dirname, large_dirname = str(tmp_path / 'small'), str(tmp_path / 'large')
+  write_records(small_dirname, 2000, compress=True)
+  write_records(large_dirname, 8000, compress=True)
+
+  small_secs = min(measure_read(small_dirname) for _ in range(3))
+  large_secs = min(measure_read(large_dirname) for _ in range(3))
+
+  assert large_secs < small_secs * 8
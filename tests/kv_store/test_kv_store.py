@@ -0,0 +1,49 @@
+from src.modules.kv_store.kv_store import KvStore
+
+
+def test_put_evicts_least_recently_accessed(tmp_path):
+  store = KvStore(path=str(tmp_path / 'store.sqlite'), max_bytes=1000)
+
+  for number in range(5):
+    store.put(str(number), 'x' * 200)
+
+  store.get('0')
+  store.flush()
+  store.put('5', 'x' * 200)
+
+  assert store.get('0') is not None
+  assert store.get('1') is None
+  assert store.stats().size <= 1000
+
+
+def test_replaced_values_are_counted_once(tmp_path):
+  store = KvStore(path=str(tmp_path / 'store.sqlite'), max_bytes=1000)
+
+  for _ in range(20):
+    store.put('key', 'x' * 300)
+
+  assert store.stats().size == 300
+  assert store.get('key') == 'x' * 300
+
+
+def test_shared_store_evicts_by_total_size(tmp_path):
+  path = str(tmp_path / 'store.sqlite')
+  stores = [KvStore(path=path, max_bytes=2000), KvStore(path=path, max_bytes=2000)]
+
+  for number in range(40):
+    stores[number % 2].put(str(number), 'x' * 100)
+
+  assert stores[0].stats().size <= 2000
+  assert stores[0].get('39') is not None
+  assert stores[1].get('0') is None
+
+
+def test_total_size_survives_reopening(tmp_path):
+  path = str(tmp_path / 'store.sqlite')
+  KvStore(path=path).put('key', 'x' * 500)
+
+  store = KvStore(path=path, max_bytes=600)
+  store.put('other', 'x' * 500)
+
+  assert store.stats().size <= 600
+  assert store.get('other') is not None
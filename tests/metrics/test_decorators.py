@@ -0,0 +1,66 @@
+import ast
+from pathlib import Path
+
+import pytest
+
+from src.modules.metrics.metrics import registry as metrics
+from src.modules.metrics.decorators import stage_logging
+
+
+@pytest.fixture
+def messages() -> list:
+  metrics.reset()
+  metrics.enable()
+
+  yield []
+
+  stage_logging.disable_debug()
+  metrics.disable()
+  metrics.reset()
+
+
+def make_stage(messages: list):
+  @stage_logging(messages.append, 'test')('running stage')
+  def stage(value: int) -> int:
+    if value < 0:
+      raise ValueError(value)
+
+    return value * 2
+
+  return stage
+
+
+def test_stage_message_is_logged_in_debug_only(messages):
+  stage = make_stage(messages)
+
+  assert stage(2) == 4
+  assert messages == []
+
+  stage_logging.enable_debug()
+
+  assert stage(3) == 6
+  assert messages == ['running stage']
+
+
+def test_stage_is_measured(messages):
+  stage = make_stage(messages)
+  name = f'test.{stage.__qualname__}'
+
+  stage(1)
+
+  with pytest.raises(ValueError):
+    stage(-1)
+
+  snapshot = metrics.snapshot()
+
+  assert snapshot['histograms'][name]['count'] == 1
+  assert snapshot['counters'][f'{name}.errors'] == 1
+
+
+def test_utils_do_not_import_modules():
+  for path in (Path(__file__).parents[2] / 'src' / 'utils').glob('*.py'):
+    for node in ast.walk(ast.parse(path.read_text())):
+      if isinstance(node, ast.ImportFrom):
+        assert not (node.module or '').startswith('src.modules'), path
+      elif isinstance(node, ast.Import):
+        assert not any(alias.name.startswith('src.modules') for alias in node.names), path
@@ -0,0 +1,58 @@
+import pytest
+
+import src.modules.parser.parser as parser_module
+
+from src.modules.parser.parser import Parser
+from src.modules.parser.helpers import normalize_raw_document, read_normalized_document
+from src.modules.parse_service.parse_service import ParseService
+
+
+class FakeQaClient:
+  def __init__(self, **kwargs) -> None:
+    pass
+
+  def ask_many(self, queries) -> list:
+    return [None for _ in queries]
+
+
+@pytest.fixture
+def udp_calls(monkeypatch) -> list:
+  calls = []
+
+  def process_content(*args, **kwargs):
+    calls.append(args)
+    raise Exception('UDPipe: not available')
+
+  monkeypatch.setattr(parser_module, 'BertQaModelClient', FakeQaClient)
+  monkeypatch.setattr(parser_module.uc, 'process_content', process_content)
+
+  return calls
+
+
+def test_warm_up_skips_remote_udpipe(udp_calls):
+  service = ParseService(Parser(), workers=2)
+  service.start()
+  service.stop()
+
+  assert udp_calls == []
+
+
+def test_warm_up_uses_udpipe_when_enabled(udp_calls):
+  service = ParseService(Parser(), workers=1, warm_up_udp=True)
+  service.start()
+  service.stop()
+
+  assert len(udp_calls) == 1
+
+
+@pytest.mark.parametrize('text', [
+  'ВИРОК\nІМЕНЕМ УКРАЇНИ\n',
+  'ВИРОК\r\nІМЕНЕМ\rУКРАЇНИ\r\n\r\nУХВАЛИВ: задовольнити',
+  '\n\nhttp://x.y 1/2/3, 4:5 AM\n',
+  '',
+])
+def test_request_bodies_normalize_like_file_reads(tmp_path, text):
+  path = tmp_path / 'document.txt'
+  path.write_bytes(text.encode('utf-8'))
+
+  assert normalize_raw_document(text) == read_normalized_document(str(path))
@@ -0,0 +1,81 @@
+from time import monotonic, sleep
+
+import pytest
+
+import src.modules.parser.parser as parser_module
+
+from src.modules.parser.parser import Parser
+from src.modules.parser.helpers import make_budget, pause_budget, resume_budget, get_remaining_time, find_degraded_fields
+from src.modules.parser.typedefs import Degradation, QaField
+
+DOCUMENT = (
+  'ВИРОК ІМЕНЕМ УКРАЇНИ\n'
+  '12 березня 2021 року місто Одеса\n'
+  'Суддя Іванов І.І.\n'
+  'ВСТАНОВИВ:\nобставини справи\n'
+  'УХВАЛИВ: задовольнити\n'
+  'Суддя Іванов І.І.\n'
+)
+
+
+class FakeQaClient:
+  def __init__(self, **kwargs) -> None:
+    pass
+
+  def ask_many(self, queries) -> list:
+    return [None for _ in queries]
+
+
+@pytest.fixture
+def parser(monkeypatch) -> Parser:
+  monkeypatch.setattr(parser_module, 'BertQaModelClient', FakeQaClient)
+
+  return Parser(fields={'document_issue_date', 'court_location', 'court_commission', 'case_parties_info'})
+
+
+def parse_exhausted(parser: Parser, document: str):
+  budget = make_budget(10)
+  budget.deadline = monotonic()
+
+  return parser.extract(parser.ask_questions(parser.scan(document, None, budget=budget))), budget
+
+
+def test_paused_budget_excludes_wait():
+  budget = make_budget(10)
+  pause_budget(budget)
+  sleep(0.2)
+  resume_budget(budget)
+
+  assert get_remaining_time(budget) > 9.9
+
+
+def test_qa_degradation_marks_only_forced_fields():
+  budget = make_budget(10)
+  budget.degradations.add(Degradation.RegexOnly)
+
+  assert find_degraded_fields(budget, ['document_issue_date', 'court_commission'], set()) == []
+  assert find_degraded_fields(budget, ['document_issue_date', 'court_commission'], {QaField.Judge}) == ['court_commission']
+
+
+def test_skipped_udp_marks_udp_fields():
+  budget = make_budget(10)
+  budget.degradations.add(Degradation.NoUdp)
+
+  assert find_degraded_fields(budget, ['case_parties_info', 'court_location'], set()) == ['case_parties_info']
+
+
+def test_rules_answered_fields_are_not_degraded(parser):
+  parsed_document, budget = parse_exhausted(parser, DOCUMENT)
+
+  assert Degradation.RegexOnly in budget.degradations
+  assert parsed_document.document_issue_date
+  assert 'document_issue_date' not in (parsed_document.degraded_fields or [])
+  assert 'court_location' not in (parsed_document.degraded_fields or [])
+
+
+def test_unanswered_fields_are_degraded(parser):
+  parsed_document, _ = parse_exhausted(parser, 'Текст без дати і місця.\n')
+
+  assert 'document_issue_date' in parsed_document.degraded_fields
+  assert 'court_location' in parsed_document.degraded_fields
+  assert 'document_issue_date' not in parsed_document.field_versions
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+import src.modules.parser.helpers as helpers_module
+
+from src.modules.parser.helpers import bulk_get_parsed_documents, read_normalized_document
+from src.modules.parser.segmenter import segment_chunks, segment_document, slice_span
+from src.modules.parser.typedefs import DocumentSections
+
+DOCUMENT = (
+  'Справа № 522/1234/21\n'
+  'ВИРОК ІМЕНЕМ УКРАЇНИ 12 березня 2021 року м. Одеса\n'
+  'ВСТАНОВИВ:\n'
+  'обставини справи, ст. 368 КК України\n' * 20
+  + 'УХВАЛИВ:\nзадовольнити\nСуддя Іванов І.І.\n'
+)
+
+
+@pytest.mark.parametrize('streaming_min_bytes', [16, 10 ** 9])
+def test_spans_resolve_against_parser_normalization(tmp_path, monkeypatch, streaming_min_bytes):
+  monkeypatch.setattr(helpers_module, 'STREAMING_MIN_BYTES', streaming_min_bytes)
+  src_dirname, dst_dirname = tmp_path / 'src', tmp_path / 'dst'
+  src_dirname.mkdir()
+  dst_dirname.mkdir()
+  (src_dirname / '1.txt').write_text(DOCUMENT, encoding='utf-8')
+
+  chunks = list(helpers_module.iterate_normalized_chunks(str(src_dirname / '1.txt')))
+  document = ''.join(chunks)
+  spans = segment_chunks(chunks)
+  (dst_dirname / '1.json').write_text(json.dumps({
+    'document_sections': {'header': spans.header, 'ruling': spans.ruling, 'decision': spans.decision},
+  }), encoding='utf-8')
+
+  sections = bulk_get_parsed_documents(str(dst_dirname), str(src_dirname))['1'].document_sections
+
+  assert spans == segment_document(document)
+  assert read_normalized_document(str(src_dirname / '1.txt')) == document
+  assert sections == DocumentSections(
+    header=slice_span(document, spans.header),
+    ruling=slice_span(document, spans.ruling),
+    decision=slice_span(document, spans.decision),
+  )
+  assert sections.decision == 'задовольнити'
+  assert bulk_get_parsed_documents(str(dst_dirname))['1'].document_sections == spans
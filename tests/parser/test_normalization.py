@@ -0,0 +1,13 @@
+import pytest
+
+from src.modules.parser.helpers import normalize_text, normalize_chunks
+from src.modules.parser.normalization_bench import normalize_text_multipass, make_sample_documents
+from src.modules.parser.constants import NORMALIZATION_BENCH_EDGE_CASES
+
+
+@pytest.mark.parametrize('text', [*NORMALIZATION_BENCH_EDGE_CASES, *make_sample_documents([1024, 64 * 1024])])
+def test_normalization_matches_multipass(text):
+  expected = normalize_text_multipass(text)
+
+  assert normalize_text(text) == expected
+  assert ''.join(normalize_chunks(text[start:start + 100] for start in range(0, len(text), 100))) == expected
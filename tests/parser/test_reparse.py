@@ -0,0 +1,39 @@
+import json
+
+import src.modules.parser.parser as parser_module
+
+from src.modules.parser.reparse import reparse_documents
+from src.modules.parser.constants import FIELD_VERSIONS
+
+DOCUMENT = 'ВИРОК ІМЕНЕМ УКРАЇНИ\n12 березня 2021 року місто Одеса\nВСТАНОВИВ:\nобставини\nУХВАЛИВ: задовольнити\nСуддя Іванов І.І.\n'
+
+
+class FailingQaClient:
+  def __init__(self, **kwargs) -> None:
+    raise AssertionError('QA client must not be loaded')
+
+
+def write_parsed_document(path, field_versions: dict) -> None:
+  path.write_text(json.dumps({'case_form': None, 'field_versions': field_versions}), encoding='utf-8')
+
+
+def test_stale_regex_fields_do_not_load_qa(tmp_path, monkeypatch):
+  monkeypatch.setattr(parser_module, 'BertQaModelClient', FailingQaClient)
+  src_dirname, dst_dirname = tmp_path / 'src', tmp_path / 'dst'
+  src_dirname.mkdir()
+  dst_dirname.mkdir()
+  (src_dirname / '1.txt').write_text(DOCUMENT, encoding='utf-8')
+  write_parsed_document(dst_dirname / '1.json', {**FIELD_VERSIONS, 'case_form': 0})
+  write_parsed_document(dst_dirname / '2.json', {**FIELD_VERSIONS, 'court_location': 0})
+
+  reparsed_count = reparse_documents(
+    str(src_dirname),
+    str(dst_dirname),
+    stale_only=True,
+    artifacts_path=str(tmp_path / 'artifacts.sqlite'),
+  )
+  reparsed = json.loads((dst_dirname / '1.json').read_text(encoding='utf-8'))
+
+  assert reparsed_count == 1
+  assert reparsed['case_form'] == 'вирок'
+  assert reparsed['field_versions']['case_form'] == FIELD_VERSIONS['case_form']
@@ -0,0 +1,42 @@
+import pytest
+
+from src.modules.parser.segmenter import segment_document, segment_chunks
+from src.modules.parser.segmenter_check import \
+  make_legacy_patterns, \
+  make_random_documents, \
+  find_by_legacy_pattern, \
+  slice_document_spans, \
+  split_document
+
+LONG_SPACES = ' ' * 1000
+
+DOCUMENTS = [
+  'Шапка справи\nВСТАНОВИВ:\nобставини\nУХВАЛИВ:\nзадовольнити\nСуддя Іванов І.І.\n',
+  f'Шапка\nВСТАНОВИВ{LONG_SPACES}:\nобставини\nУХВАЛИВ:{LONG_SPACES}задовольнити{LONG_SPACES}Суддя\n',
+  f'Шапка{LONG_SPACES}В С Т А Н О В И{LONG_SPACES}В :{LONG_SPACES}обставини\nУ Х В А Л И Л А{LONG_SPACES}:\nС У Д Д Я',
+  f'{LONG_SPACES}постановила{LONG_SPACES}\n{LONG_SPACES}:текст\nвирішив:{LONG_SPACES}\nсуддя:',
+  'x' * 5000 + '\nВСТАНОВИВ:' + 'y' * 5000 + '\nВИРІШИВ:' + 'z' * 5000 + '\nсуддя',
+  LONG_SPACES,
+  '',
+]
+
+
+def segment_legacy(document: str) -> list:
+  return [find_by_legacy_pattern(pattern, document) for pattern in make_legacy_patterns()]
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 300, 4096])
+def test_chunked_segmentation_matches_full(document, chunk_size):
+  expected = slice_document_spans(document, segment_document(document))
+
+  assert slice_document_spans(document, segment_chunks(split_document(document, chunk_size))) == expected
+  assert expected == segment_legacy(document)
+
+
+def test_segmentation_matches_legacy_patterns():
+  for document in make_random_documents(2000, seed=3):
+    expected = segment_legacy(document)
+
+    assert slice_document_spans(document, segment_document(document)) == expected
+    assert slice_document_spans(document, segment_chunks(split_document(document, 5))) == expected